@@ -0,0 +1,227 @@
+import argparse, json, zlib
+from os.path import exists
+import numpy as np
+from memory_engine import read_bytes, wait_hooked, DolphinDisconnectedError
+
+MEM1_START = 0x80000000
+# the DOL text and data sections, where code referencing the fields lives
+CODE_START = 0x80003100
+CODE_END = 0x80400000
+CHUNK_SIZE = 0x100000
+
+# opcodes that take (hi << 16) from a lis as their base, ori is the only unsigned one
+D_FORM_OPS = [14, 24, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 48, 49, 50, 52, 54]
+ORI = 24
+LIS = 15
+LOOKAHEAD = 8
+
+def game_key() -> str:
+    # game id and revision from the disc header, plus a crc of the start of the code
+    header = bytes(read_bytes(MEM1_START, 8, "resolve"))
+    crc = zlib.crc32(bytes(read_bytes(CODE_START, 0x10000, "resolve")))
+    return f"{header[:6].decode('ascii', 'replace')}-{header[7]:02x}-{crc:08x}"
+
+def read_code(start = CODE_START, end = CODE_END) -> bytes:
+    return b"".join(bytes(read_bytes(a, min(CHUNK_SIZE, end - a), "resolve")) for a in range(start, end, CHUNK_SIZE))
+
+def decode_words(code:bytes):
+    words = np.frombuffer(code, dtype=">u4").astype(np.uint32)
+    return words, words >> 26, (words >> 21) & 0x1f, (words >> 16) & 0x1f, words & 0xffff
+
+def find_references(code:bytes) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # every lis rX, hi followed within LOOKAHEAD instructions by an instruction using rX with a 16 bit offset,
+    # returns word indices of both and the address they build
+    words, op, rd, ra, imm = decode_words(code)
+    lis = np.flatnonzero((op == LIS) & (ra == 0))
+
+    lis_found, use_found, targets = [], [], []
+    for k in range(1, LOOKAHEAD + 1):
+        l = lis[lis + k < len(words)]
+        u = l + k
+        base = np.where(op[u] == ORI, rd[u], ra[u])
+        ok = np.isin(op[u], D_FORM_OPS) & (base == rd[l])
+        l, u = l[ok], u[ok]
+        lo = np.where(op[u] == ORI, imm[u], imm[u].astype(np.int16).astype(np.int64))
+        lis_found.append(l)
+        use_found.append(u)
+        targets.append(((imm[l].astype(np.int64) << 16) + lo) & 0xffffffff)
+
+    return np.concatenate(lis_found), np.concatenate(use_found), np.concatenate(targets)
+
+def signature_mask(words:np.ndarray) -> np.ndarray:
+    # hide everything that moves between builds, branch displacements and the
+    # immediates of other lis/small data accesses
+    op, ra = words >> 26, (words >> 16) & 0x1f
+    mask = np.full(len(words), 0xffffffff, dtype=np.uint32)
+    mask[op == 18] = 0xfc000003
+    mask[op == 16] = 0xffff0003
+    mask[(op == LIS) & (ra == 0)] = 0xffff0000
+    mask[np.isin(op, D_FORM_OPS) & np.isin(ra, [2, 13])] = 0xffff0000
+    return mask
+
+def masked_find(code:bytes, pattern:bytes, mask:bytes) -> list[int]:
+    # anchors on the longest fully unmasked run with bytes.find, then checks the whole pattern
+    p = np.frombuffer(pattern, dtype=np.uint8)
+    m = np.frombuffer(mask, dtype=np.uint8)
+
+    best_start, best_len, run_start = 0, 0, None
+    for i, v in enumerate(list(m) + [0]):
+        if v == 0xff and run_start is None:
+            run_start = i
+        elif v != 0xff and run_start is not None:
+            if i - run_start > best_len:
+                best_start, best_len = run_start, i - run_start
+            run_start = None
+
+    anchor = pattern[best_start:best_start + best_len]
+    view = np.frombuffer(code, dtype=np.uint8)
+    found = []
+    pos = code.find(anchor)
+    while pos != -1:
+        start = pos - best_start
+        if start >= 0 and start % 4 == 0 and start + len(p) <= len(view):
+            if np.array_equal(view[start:start + len(p)] & m, p & m):
+                found.append(start)
+        pos = code.find(anchor, pos + 1)
+    return found
+
+class AddressResolver:
+    # finds the fields of accessor tables in other builds of the game by code signatures,
+    # learned on a build where the hard coded addresses are right
+
+    def __init__(self, tables, snapshots = (), signature_file = "signatures.json", cache_file = "address_cache.json") -> None:
+        self.tables = tables
+        self.snapshots = snapshots
+        self.signature_file = signature_file
+        self.cache_file = cache_file
+
+    def fields(self) -> dict:
+        return {name: accessor._addr for table in self.tables for name, accessor in table.items()}
+
+    def _load(self, path) -> dict:
+        if not path or not exists(path):
+            return {}
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def _save(self, path, data):
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
+    def learn(self, max_delta = 0x4000, max_window = 16) -> dict:
+        wait_hooked()
+        code = read_code()
+        words = decode_words(code)[0]
+        mask = signature_mask(words)
+        lis, use, targets = find_references(code)
+
+        signatures = {}
+        for name, addr in self.fields().items():
+            # references to the field itself first, then to the closest struct base below it
+            deltas = addr - targets
+            order = np.argsort(deltas + np.where(deltas == 0, -max_delta, 0))
+            order = order[(deltas[order] >= 0) & (deltas[order] < max_delta)]
+
+            for i in order[:32]:
+                sig = self._unique_signature(code, words, mask, int(lis[i]), int(use[i]), max_window)
+                if sig is not None:
+                    sig["delta"] = int(deltas[i])
+                    signatures[name] = sig
+                    break
+
+        self._save(self.signature_file, signatures)
+
+        cache = self._load(self.cache_file)
+        cache[game_key()] = self.fields()
+        self._save(self.cache_file, cache)
+        return signatures
+
+    def _unique_signature(self, code, words, mask, lis, use, max_window):
+        for window in range(2, max_window + 1, 2):
+            start, end = max(lis - window, 0), min(use + window + 1, len(words))
+            m = mask[start:end].copy()
+            m[lis - start] = m[use - start] = 0xffff0000
+            pattern = (words[start:end] & m).astype(">u4").tobytes()
+            m = m.astype(">u4").tobytes()
+            if len(masked_find(code, pattern, m)) == 1:
+                return {"pattern": pattern.hex(), "mask": m.hex(), "lis": lis - start, "use": use - start}
+        return None
+
+    def resolve(self) -> dict:
+        wait_hooked()
+        key = game_key()
+        cache = self._load(self.cache_file)
+        # a cache from before a field was added has to be resolved again
+        if key in cache and cache[key].keys() >= self.fields().keys():
+            return cache[key]
+
+        signatures = self._load(self.signature_file)
+        resolved = {}
+        if signatures:
+            code = read_code()
+            words, op, _, _, imm = decode_words(code)
+            for name, sig in signatures.items():
+                found = masked_find(code, bytes.fromhex(sig["pattern"]), bytes.fromhex(sig["mask"]))
+                if len(found) != 1:
+                    continue
+                l, u = found[0] // 4 + sig["lis"], found[0] // 4 + sig["use"]
+                lo = int(imm[u])
+                if op[u] != ORI and lo & 0x8000:
+                    lo -= 0x10000
+                resolved[name] = (((int(imm[l]) << 16) + lo) & 0xffffffff) + sig["delta"]
+
+        # anything without a match keeps its hard coded address
+        addresses = {**self.fields(), **resolved}
+        if resolved:
+            cache[key] = addresses
+            self._save(self.cache_file, cache)
+        return addresses
+
+    def apply(self) -> dict:
+        addresses = self.resolve()
+        relocate(self.tables, addresses)
+        for s in self.snapshots:
+            s.rebuild()
+        return addresses
+
+def relocate(tables, addresses:dict):
+    for table in tables:
+        for name, accessor in table.items():
+            if name in addresses:
+                accessor._addr = addresses[name]
+
+def main():
+    from game import CALCULATE_ADDRESSES, EVERY_FRAME_ADDRESSES, FORCED_HIT_ADDRESSES
+    from memory_engine import set_backend, RamImageBackend
+
+    parser = argparse.ArgumentParser(description="Learn field signatures on a known build, or resolve them on another one")
+    parser.add_argument("mode", choices=["learn", "resolve", "key"])
+    parser.add_argument("--ram-image", default=None, help="read a MEM1 dump instead of Dolphin")
+    parser.add_argument("--signatures", default="signatures.json")
+    parser.add_argument("--cache", default="address_cache.json")
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds to wait for Dolphin")
+    args = parser.parse_args()
+
+    if args.ram_image:
+        set_backend(RamImageBackend(args.ram_image))
+
+    resolver = AddressResolver([CALCULATE_ADDRESSES, EVERY_FRAME_ADDRESSES, FORCED_HIT_ADDRESSES], signature_file=args.signatures, cache_file=args.cache)
+    try:
+        # dolphin is hooked in the background, give it a moment before giving up
+        wait_hooked(args.timeout)
+    except DolphinDisconnectedError as e:
+        parser.exit(1, f"{e}\n")
+
+    if args.mode == "key":
+        print(game_key())
+    elif args.mode == "learn":
+        signatures = resolver.learn()
+        missing = [name for name in resolver.fields() if name not in signatures]
+        print(f"learned {len(signatures)} signatures for {game_key()}, none found for: {', '.join(missing)}")
+    else:
+        defaults = resolver.fields()
+        for name, addr in resolver.resolve().items():
+            print(f"{name:20} {addr:#010x}" + ("" if addr == defaults[name] else f"  (was {defaults[name]:#010x})"))
+
+if __name__ == "__main__":
+    main()
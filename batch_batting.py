@@ -0,0 +1,498 @@
+import numpy as np
+from calc_batting import *
+from flight import AIR_RESISTANCE, GRAVITY, landing_frames, positions
+
+# the lookup tables of calc_batting as arrays, indexed with whole columns at once
+ANGLE_RANGES = np.array(BATTING_ANGLE_RANGES)
+VERTICAL_WEIGHTS = np.array(BATTING_VERTICAL_ANGLE_WEIGHTS)
+VERTICAL_ZONES = np.array(SHORT_ARRAY_ARRAY_ARRAY_ARRAY_807B67CC)
+VERTICAL_FALLBACK_ZONES = np.array(SHORT_ARRAY_ARRAY_807B6AF4)
+NON_CAPTAIN_STAR_ZONES = np.array(NON_CAPTAIN_STAR_VERTICAL_ANGLES)
+CAPTAIN_STAR_ZONES = np.array(CAPTAIN_STAR_VERTICAL_ANGLES)
+HIT_TYPE_TABLE = np.array(UINT_ARRAY_ARRAY_807B7134)
+# contact frames with a horizontal range, the others never make contact
+CONTACT_FRAMES = np.flatnonzero((ANGLE_RANGES[..., 0] != ANGLE_RANGES[..., 1]).any(axis=(0, 1)))
+
+def _stat(key, dtype = np.int64):
+    return np.array([s[key] for s in STATS], dtype=dtype)
+
+SLAP_CONTACT_SIZE = _stat("Slap Contact Spot Size")
+CHARGE_CONTACT_SIZE = _stat("Charge Contact Spot Size")
+SLAP_POWER = _stat("Slap Hit Power")
+CHARGE_POWER = _stat("Charge Hit Power")
+CURSED_BALL = _stat("Cursed Ball")
+HORIZONTAL_TRAJECTORY = _stat("Horizontal Hit Trajectory")
+VERTICAL_TRAJECTORY = _stat("Vertical Hit Trajectory")
+CAPTAIN_STAR = _stat("Captain Star Hit/Pitch")
+NON_CAPTAIN_STAR = _stat("Non Captain Star Swing")
+TRIMMED_BAT = np.array([0 if h["TrimmedBat"] == 0.0 else 1 for h in BATTER_HITBOXES])
+SUPER_CURVE = np.isin(np.arange(len(STATS)), [0xe, 0x35, 0x25])
+
+def _to_radians(angle, dtype):
+    r = dtype(np.pi) * (angle * 2).astype(dtype) / 4096
+    return np.where(np.pi < r, -(2 * np.pi - r), r)
+
+class FloatTables:
+    # the float tables in one precision, the game keeps them as singles
+    def __init__(self, dtype) -> None:
+        self.dtype = dtype
+        self.contact_sizes = np.array(BALL_CONTACT_ARRAY_807B6294, dtype=dtype)
+        self.exit_velocities = np.array(BALL_HIT_ARRAY, dtype=dtype)
+        self.star_exit_velocities = np.array(STAR_SWING_EXIT_VELOCITY_ARRAY, dtype=dtype)
+        self.captain_star_exit_velocities = np.array(CAPTAIN_STAR_SWING_EXIT_VELOCITY_ARRAY, dtype=dtype)
+        self.hit_type_multipliers = np.array(UINT_ARRAY_ARRAY_807B7134, dtype=dtype)
+        self.field_bonuses = np.array(FIELD_TRAJECTORY_BONUSES, dtype=dtype)
+        self.cursed_debuffs = np.array(CURSED_BALL_DEBUFF_ARRAY, dtype=dtype)
+        self.reaches = np.array(BATTING_REACHES, dtype=dtype)
+        self.curves = np.array(FLOAT_ARRAY_ARRAY_807B72BC, dtype=dtype)
+        self.contact_chem = np.array(CONTACT_CHEM_LINK_MULTIPLIERS, dtype=dtype)
+        self.power_chem = np.array(POWER_CHEM_LINK_MULTIPLIERS, dtype=dtype)
+        self.range_near = np.array([h["HorizontalRangeNear"] for h in BATTER_HITBOXES], dtype=dtype)
+        self.range_far = np.array([h["HorizontalRangeFar"] for h in BATTER_HITBOXES], dtype=dtype)
+        self.pitching_height = np.array([h["PitchingHeight"] for h in BATTER_HITBOXES], dtype=dtype)
+        # every angle is a 12 bit integer, so cos and sin are looked up instead of computed
+        radians = _to_radians(np.arange(0x1000), dtype)
+        self.cos = np.cos(radians)
+        self.sin = np.sin(radians)
+
+DOUBLE = FloatTables(np.float64)
+SINGLE = FloatTables(np.float32)
+
+# pitch_type to (Pitcher_TypeOfPitch, ChargePitchType)
+PITCH_TYPES = np.array([[PITCHCURVE, PITCHCHARGETYPE_NONE], [PITCHCHARGE, PITCHCHARGETYPE_CHARGE], [PITCHCHARGE, PITCHCHARGETYPE_PERFECT], [PITCHCHANGEUP, PITCHCHARGETYPE_NONE]])
+# the sour batter hit type of every pitch type, for slaps and charges
+PITCH_OFFSETS = np.array([[SOUR_PERFECTPITCH_SLAP, SOUR_PERFECTPITCH_CHARGE] if charge == PITCHCHARGETYPE_PERFECT else [0, SOUR_CURVE_CHARGE] if pitch == PITCHCURVE
+                          else [SOUR_CHANGEUP_SLAP, SOUR_CHANGEUP_CHARGE] for pitch, charge in PITCH_TYPES])
+# per contact zone, the batter hit type on top of the sour one and the row of CURSED_BALL_DEBUFF_ARRAY
+ZONE_HIT_TYPES = np.array([SOUR_CURVE_SLAP, NICE_CURVE_SLAP, PERFECT_CURVE_SLAP, NICE_CURVE_SLAP, SOUR_CURVE_SLAP])
+ZONE_DEBUFFS = np.array([2, 1, 0, 1, 2])
+
+BATCH_DTYPE = np.dtype([
+    ("valid", "?"),
+    ("contact_zone", "i1"),
+    ("contact_quality", "f8"),
+    ("absolute_contact", "f8"),
+    ("hit_type", "i1"),
+    ("horizontal_angle", "i4"),
+    ("vertical_angle", "i4"),
+    ("vertical_zone", "i1"),
+    ("power", "i4"),
+    ("start", "f8", (3,)),
+    ("velocity", "f8", (3,)),
+    ("acceleration", "f8", (3,)),
+    ("frames", "i4"),
+    ("landing", "f8", (3,)),
+    ("distance", "f8"),
+])
+
+def _take(table, *index):
+    # table[index] for 1-d index arrays through one flat np.take, much faster than fancy indexing
+    key = index[0]
+    for size, i in zip(table.shape[1:len(index)], index[1:]):
+        key = key * size + i
+    return np.take(table.reshape(-1, *table.shape[len(index):]), key, axis=0)
+
+def _fmod(a, b):
+    # a - trunc(a / b) * b like the game's integer remainder, 0 where b is 0
+    b = np.where(b == 0, 1, b)
+    return np.fmod(a, b)
+
+def _madd(a, b, c):
+    # a * b + c, for float32 rounded once like the game's fused multiply-add:
+    # the product of two singles is exact in a double, so only the sum and the cast back round
+    if np.result_type(a, b, c) != np.float32:
+        return a * b + c
+    a, b, c = (np.asarray(x, dtype=np.float32).astype(np.float64) for x in (a, b, c))
+    return (a * b + c).astype(np.float32)
+
+def _interpolate(value, low, high):
+    # LinearInterpolateToNewRange from 0..1
+    return _madd(high - low, np.clip(value, 0.0, 1.0), low)
+
+def _prelude(s):
+    # calculateValues' star swing selection, and the stat changes of parseValues
+    id = s["batter_id"]
+    starred = s["is_starred"]
+    f = s["tables"].dtype
+    for name, stat in [("slap_contact_size", SLAP_CONTACT_SIZE[id]), ("charge_contact_size", CHARGE_CONTACT_SIZE[id]), ("slap_power", SLAP_POWER[id]),
+                       ("charge_power", CHARGE_POWER[id]), ("cursed_ball", CURSED_BALL[s["pitcher_id"]])]:
+        s[name] = np.where(starred, np.minimum(stat + 50, 100), stat).astype(f)
+
+    hit_type = s["hit_type"].copy()
+    charge_up = s["charge_up"].copy()
+    stars = s["num_stars"]
+    captain_star = CAPTAIN_STAR[id]
+    non_captain_star = NON_CAPTAIN_STAR[id]
+
+    star = s["is_star_hit"] & (hit_type != BUNT) & (stars != 0)
+    moonshot = star & (charge_up == 1.0) & (stars >= 5)
+    regular = star & ~moonshot
+
+    non_captain = regular & (captain_star == 0) & (stars >= 1) & (non_captain_star != 0)
+    popped = non_captain & (non_captain_star < 3)
+    hit_type[popped] = CHARGE
+    charge_up[popped] = 1.0
+    hit_type[non_captain & (non_captain_star == 3)] = SLAP
+
+    captain = regular & (captain_star != 0) & (stars >= np.where(s["is_batter_captain"], 1, 2))
+    hit_type[captain | moonshot] = STAR
+
+    s["hit_type"] = hit_type
+    s["charge_up"] = charge_up
+    s["charge_down"] = np.where(popped, 1.0, s["charge_down"])
+    s["moonshot"] = moonshot
+    s["non_captain_star_swing"] = np.where(non_captain, non_captain_star, 0)
+    s["captain_star_swing"] = np.where(star & ((hit_type == STAR) | popped), captain_star, 0)
+
+def _contact(s):
+    t = s["tables"]
+    id = s["batter_id"]
+    chem = s["chem"]
+    css = s["captain_star_swing"]
+    charge_up = np.where(css != 0, 0.0, s["charge_up"])
+
+    contact_size = np.where(css != 0, 100.0, s["slap_contact_size"])
+    contact_size = np.where(charge_up <= 0.0, contact_size * t.contact_chem[chem], s["charge_contact_size"])
+
+    diff = s["ball_x"] - s["batter_x"]
+    trimmed = TRIMMED_BAT[id]
+    s["valid"] &= (t.reaches[trimmed, 0] <= diff) & (diff <= t.reaches[trimmed, 1])
+    diff = np.where(s["handedness"] == LEFTY, -diff, diff)
+
+    pos = np.where(diff >= 0.0, 100.0 * (diff / t.range_far[id]) + 100.0, -(100.0 * (diff / t.range_near[id]) - 100.0))
+    pos = np.clip(pos, 0.0, 200.0)
+
+    contact_size = contact_size / 100.0
+    sizes = _take(t.contact_sizes, trimmed, s["hit_type"], s["easy_batting"])
+    left_nice, left_perfect, right_perfect, right_nice = [_madd(contact_size, sizes[:, i + 4] - sizes[:, i], sizes[:, i]) for i in range(4)]
+
+    # each zone is only reached when every threshold before it is passed
+    passed = left_nice <= pos
+    zone = passed.astype(np.int64)
+    for threshold in [left_perfect, right_perfect, right_nice]:
+        passed &= threshold <= pos
+        zone += passed
+
+    # how far through its zone the contact is, counted from the outside in
+    low = np.choose(zone, [0.0, left_nice, left_perfect, right_perfect, right_nice])
+    high = np.choose(zone, [left_nice, left_perfect, right_perfect, right_nice, 200.0])
+    quality = (pos - low) / (high - low)
+    quality = np.where((zone > PERFECT) | ((zone == PERFECT) & (pos >= 100.0)), 1.0 - quality, quality)
+
+    moonshot_perfect = s["moonshot"] & (zone == PERFECT)
+    s["captain_star_swing"] = np.where(moonshot_perfect, 0, css)
+    s["moonshot"] = moonshot_perfect
+
+    s["valid"] &= (s["pitch_type"] >= 0) & (s["pitch_type"] <= 3)
+    slap = s["hit_type"] == SLAP
+    quality_type = np.take(ZONE_HIT_TYPES, zone)
+    pitch_offset = _take(PITCH_OFFSETS, np.clip(s["pitch_type"], 0, 3), ~slap)
+
+    s["contact_zone"] = zone
+    s["contact_quality"] = quality
+    s["absolute_contact"] = pos
+    s["batter_hit_type"] = np.where(slap | (s["hit_type"] == CHARGE), quality_type + pitch_offset, -1)
+
+def _horizontal_angle(s):
+    righty = s["handedness"] == RIGHTY
+    direction = np.select([s["stick_right"], s["stick_left"]],
+                          [np.where(righty, PUSHPULL_PUSH, PUSHPULL_PULL), np.where(righty, PUSHPULL_PULL, PUSHPULL_PUSH)], PUSHPULL_NONE)
+
+    frame = s["frame"]
+    s["valid"] &= (frame >= 0) & (frame < ANGLE_RANGES.shape[2])
+    low, high = ANGLE_RANGES[direction, (s["hit_type"] != SLAP).astype(np.int64), np.clip(frame, 0, ANGLE_RANGES.shape[2] - 1)].T
+
+    angle = low + _fmod(s["rand_1"], np.abs(high - low)) + 0x400
+    angle = np.where(righty, angle, np.where(angle < 0x801, 0x800 - angle, 0x1800 - angle))
+    s["horizontal_angle"] = angle & 0xfff
+
+def _weighted_random_index(cumulative, r1, r2, r3):
+    # WeightedRandomIndex for an (N, weights) array of running weight totals, returns the index and the updated StaticRandomInt1
+    total = cumulative[:, -1]
+    fin = np.abs(total)
+    rolls = fin >= 2
+    divisor = np.where(rolls, fin, 1)
+    new_r1 = np.where(rolls, r1 - (r2 & 0xff) + np.trunc(r2 / divisor).astype(np.int64) + r3, r1)
+    roll = np.where(rolls, np.abs(np.fmod(new_r1, divisor)), 0)
+    roll = np.where(total < 0, -roll, roll)
+
+    # the first index the roll falls under, 0 when it never does, the weights are never negative so the totals only go up
+    index = np.count_nonzero(cumulative <= roll[:, None], axis=1)
+    return np.where(index == cumulative.shape[1], 0, index), new_r1
+
+def _stick_weights(flags, table, up_down):
+    # the vertical zone weights, without the ones the flags rule out and moved around by the stick
+    weights = [np.where(flags & m == 0, 0, table[..., i]) for i, m in enumerate([0x1e0, 0xf0, 0x78, 0x3c, 0x1e])]
+    down, up = up_down == 2, up_down == 1
+    first, fourth, last = weights[0], weights[3], weights[4]
+    weights[4] = np.where(down, last + first, np.where(up, 0, last))
+    weights[0] = np.where(down, 0, np.where(up, fourth + last + first, first))
+    weights[3] = np.where(up, 0, fourth)
+    return np.stack(np.broadcast_arrays(*weights), axis=-1)
+
+def _fixed_zones(flags, up_down):
+    # the vertical zone the flags force, 0 when the zone is rolled
+    high_flags = flags & 0xf000000
+    low_flags = flags & 0xf
+    flipped = np.where(high_flags == 0, ((low_flags == 2) & (up_down == 2)) | ((low_flags == 3) & (up_down == 1)),
+                       ((high_flags == 0x2000000) & (up_down == 2)) | ((high_flags == 0x3000000) & (up_down == 1)))
+    fixed_zone = np.where(high_flags == 0, np.where(low_flags != 0, 2, 0), 1)
+    return np.where(flipped, 0, fixed_zone)
+
+# both only depend on a handful of small indexes, so they're worked out once for all of them,
+# [batter hit type, easy batting, vertical trajectory, slap or charge, contact zone, stick up/down]
+_FLAGS = HIT_TYPE_TABLE[:, [3, 2]]
+_UP_DOWN = np.arange(3)
+STICK_WEIGHTS = np.cumsum(_stick_weights(_FLAGS[:, :, None, None, None, None], VERTICAL_WEIGHTS.transpose(2, 0, 1, 3, 4)[None, :, :, :, :, None], _UP_DOWN), axis=-1)
+FIXED_ZONES = _fixed_zones(_FLAGS[:, :, None], _UP_DOWN)
+
+def _vertical_angle(s):
+    zone = s["contact_zone"]
+    css = s["captain_star_swing"]
+    ncss = s["non_captain_star_swing"]
+    moonshot = s["moonshot"]
+    easy = s["easy_batting"]
+    slap_or_charge = (s["hit_type"] != SLAP).astype(np.int64)
+
+    up_down = np.where(s["stick_up"], 1, s["stick_down"] * 2)
+    hit_type = s["batter_hit_type"] % len(HIT_TYPE_TABLE)
+    fixed_zone = _take(FIXED_ZONES, hit_type, easy, up_down)
+    cumulative = _take(STICK_WEIGHTS, hit_type, easy, VERTICAL_TRAJECTORY[s["batter_id"]], slap_or_charge, zone, up_down)
+
+    weighted = (css == 0) & ~moonshot & (ncss == 0) & (fixed_zone == 0)
+    index, rolled_r1 = _weighted_random_index(cumulative, s["rand_1"], s["rand_2"], s["rand_3"])
+    r1 = np.where(weighted, rolled_r1, s["rand_1"])
+    index = np.where(weighted, index, 0)
+
+    low, high = [_take(VERTICAL_ZONES[..., i], slap_or_charge, zone, index) for i in range(2)]
+
+    # the star swings and fixed zones replace the weighted one, only computed where they're used
+    regular = (css == 0) & ~moonshot & (ncss == 0)
+    for rows, table, key in [
+        (regular & (fixed_zone != 0), VERTICAL_FALLBACK_ZONES, lambda r: (fixed_zone[r],)),
+        (ncss != 0, NON_CAPTAIN_STAR_ZONES, lambda r: (ncss[r] - 1, zone[r])),
+        (moonshot, VERTICAL_ZONES[1, :, 2], lambda r: (zone[r],)),
+        (css != 0, CAPTAIN_STAR_ZONES, lambda r: (css[r] - 1, zone[r])),
+    ]:
+        rows = np.flatnonzero(rows)
+        if len(rows):
+            low[rows], high[rows] = _take(table, *key(rows)).T
+
+    s["valid"] &= high != low
+    angle = low + _fmod(r1, high - low)
+
+    flip = (angle >= 0x401) | (angle < -0x400)
+    s["horizontal_angle"] = np.where(flip, (s["horizontal_angle"] + 0x800) & 0xfff, s["horizontal_angle"])
+    s["vertical_angle"] = np.where(angle >= 0x401, 0x800 - angle, np.where(angle < 0, angle + 0x1000, angle))
+    s["vertical_zone"] = np.where(weighted, index, -1)
+
+def _hit_power(s):
+    t = s["tables"]
+    zone = s["contact_zone"]
+    css = s["captain_star_swing"]
+    ncss = s["non_captain_star_swing"]
+    moonshot = s["moonshot"]
+    hit_type = s["batter_hit_type"]
+
+    star = (css != 0) | (ncss != 0)
+    charged = np.where(star, 0.0, s["charge_up"])
+    low, high, gravity = [_take(t.exit_velocities[..., i], s["hit_type"], zone) for i in range(3)]
+    for rows, table, key in [
+        (ncss != 0, t.star_exit_velocities, lambda r: (ncss[r] - 1, zone[r])),
+        (css != 0, t.captain_star_exit_velocities, lambda r: (css[r] - 1, zone[r])),
+        (moonshot, t.exit_velocities[1], lambda r: (zone[r],)),
+    ]:
+        rows = np.flatnonzero(rows)
+        if len(rows):
+            low[rows], high[rows], gravity[rows] = _take(table, *key(rows)).T
+
+    contact_power = _madd(s["contact_quality"], high - low, low)
+
+    charge_power = _madd(-(s["charge_power"] - s["slap_power"]) * 0.5, 1.0 - s["charge_down"], s["charge_power"])
+    power = np.where(css != 0, 100.0, np.where(charged <= 0.0, s["slap_power"], charge_power))
+
+    debuff = np.take(ZONE_DEBUFFS, zone)
+    power = np.where(~star, power * _interpolate(s["cursed_ball"] / 100.0, np.take(t.cursed_debuffs[:, 0], debuff), np.take(t.cursed_debuffs[:, 1], debuff)), power)
+    power = np.where((s["chem"] != 0) & (0.0 < charged), power * t.power_chem[s["chem"]], power)
+    power = np.where(-1 < hit_type, (power * _take(t.hit_type_multipliers, hit_type % len(HIT_TYPE_TABLE), 1 - s["easy_batting"])) / 100.0, power)
+
+    distance = contact_power * _madd(power / 100.0, 1.0 - 0.8, 0.8)
+
+    angle = s["horizontal_angle"]
+    field = np.where(angle < 0x200, 0, np.where(angle < 0x601, angle - 0x200, 0x400))
+    field = np.where(s["handedness"] != RIGHTY, 0x400 - field, field)
+    area = np.minimum(field >> 8, 3)
+    trajectory = HORIZONTAL_TRAJECTORY[s["batter_id"]]
+    field_bonus = _interpolate((field - area * 0x100).astype(t.dtype) / 256, _take(t.field_bonuses, trajectory, area), _take(t.field_bonuses, trajectory, area + 1))
+    distance = np.where(css == 0, distance * field_bonus, distance)
+    distance = np.where(moonshot, distance * MOONSHOT_MULTIPLIER, distance)
+
+    s["power"] = np.trunc(distance).astype(np.int64)
+    s["added_gravity"] = 0.00001 * gravity
+
+def _velocity(s):
+    t = s["tables"]
+    half_power = s["power"].astype(t.dtype) * 0.5
+    horizontal = s["horizontal_angle"] & 0xfff
+    vertical = s["vertical_angle"] & 0xfff
+    c_h, s_h = np.take(t.cos, horizontal), np.take(t.sin, horizontal)
+
+    ground = half_power * np.take(t.cos, vertical)
+    x_ground = c_h * ground
+    z_ground = s_h * ground
+    velocity = np.stack([x_ground / 100.0, (half_power * np.take(t.sin, vertical)) / 100.0, z_ground / 100.0], axis=1)
+
+    angle = s["horizontal_angle"]
+    vangle = s["vertical_angle"]
+    righty = s["handedness"] == RIGHTY
+    super_curve = (SUPER_CURVE[s["batter_id"]] | (s["non_captain_star_swing"] == 3)).astype(np.int64)
+
+    contact = np.where(100.0 < s["absolute_contact"], 200.0 - s["absolute_contact"], s["absolute_contact"])
+    curve = 1.0 - (1.0 - contact * 0.01) * t.curves[super_curve, 0]
+    curve = np.where((0x180 < vangle) & (vangle < 0x401), curve * (1.0 - np.minimum(vangle - 0x180, 512).astype(t.dtype) * 1.0 / 512.0), curve)
+
+    h = np.where((angle < 0xc01) & (0xff < angle), np.minimum(angle, 0x700), 0x100)
+    h = np.where(righty, h, 0x800 - h)
+    h = (0x460 - h).astype(t.dtype)
+    curve = curve * np.where(h > 0, h / 864.0, h / 672.0)
+
+    # the game turns the curve's sign into the direction and takes its size, a signed multiply is the same
+    curves = (angle < 0x901) | (0xeff < angle)
+    z_accel = -np.abs((c_h * curve) * t.curves[super_curve, 2])
+    x_accel = (s_h * curve) * t.curves[super_curve, 1]
+    x_accel = np.where(righty, x_accel, -x_accel)
+    acceleration = np.stack([np.where(curves, x_accel, 0.0), s["added_gravity"], np.where(curves, z_accel, 0.0)], axis=1).astype(t.dtype)
+
+    s["velocity"] = velocity
+    s["acceleration"] = acceleration
+
+def _start(s):
+    t = s["tables"]
+    return np.stack([np.where(s["handedness"] != RIGHTY, -s["ball_x"], s["ball_x"]), t.pitching_height[s["batter_id"]], s["ball_z"]], axis=1)
+
+def _flight(s, air_resistance = AIR_RESISTANCE, gravity = GRAVITY):
+    start = s["start"] = _start(s)
+    frames = landing_frames(start, s["velocity"], s["acceleration"], air_resistance, gravity)
+    s["valid"] &= frames > 0
+    s["frames"] = frames
+    s["landing"] = positions(start, s["velocity"], s["acceleration"], np.maximum(frames - 1, 0), air_resistance, gravity)
+    s["distance"] = np.hypot(s["landing"][:, 0], s["landing"][:, 2])
+
+def _flight_single(s, air_resistance = AIR_RESISTANCE, gravity = GRAVITY, limit = 1 << 12):
+    # steps every ball frame by frame in float32, rounding included,
+    # rows drop out of the arrays as they land
+    g = np.float32(gravity)
+    # the velocity update is one fused multiply-add, done in doubles and rounded back once like _madd
+    r = np.float64(np.float32(air_resistance))
+    start = s["start"] = _start(s)
+
+    frames = np.where(start[:, 1] > 0, -1, 0)
+    landing = start.copy()
+    # swings that missed the bat aren't flown
+    rows = np.flatnonzero((frames == -1) & s["valid"])
+    # x, y, z as rows so every update is one contiguous operation
+    p = np.ascontiguousarray(start[rows].T)
+    v = np.ascontiguousarray(s["velocity"][rows].T)
+    a = np.ascontiguousarray(s["acceleration"][rows].T, dtype=np.float64)
+    wide = np.empty(p.shape)
+    last = np.empty_like(p)
+    landed_count = 0
+
+    for frame in range(1, limit):
+        if len(rows) == landed_count:
+            break
+
+        # the new position goes into the old frame's buffer
+        last, p = p, np.add(p, v, out=last)
+        v[1] -= g
+        np.multiply(v, r, out=wide)
+        wide += a
+        np.copyto(v, wide, casting="same_kind")
+
+        landed = np.flatnonzero(p[1] <= 0)
+        if len(landed):
+            frames[rows[landed]] = frame
+            landing[rows[landed]] = np.take(last, landed, axis=1).T
+            # landed balls are lifted out of the way until the survivors are copied
+            p[1, landed] = np.inf
+            landed_count += len(landed)
+
+            # only copy the survivors once enough of them are gone
+            if landed_count > len(rows) // 2:
+                alive = np.flatnonzero(p[1] != np.inf)
+                rows, p, v, a = rows[alive], np.take(p, alive, axis=1), np.take(v, alive, axis=1), np.take(a, alive, axis=1)
+                last, wide = np.empty_like(p), np.empty(p.shape)
+                landed_count = 0
+
+    s["valid"] &= frames > 0
+    s["frames"] = frames
+    s["landing"] = landing
+    s["distance"] = np.sqrt(landing[:, 0] * landing[:, 0] + landing[:, 2] * landing[:, 2])
+
+CHUNK_SIZE = 1 << 14
+COPY_SIZE = 1 << 12
+
+COLUMN_TYPES = {
+    "batter_id": np.int64, "is_batter_captain": bool, "pitcher_id": np.int64, "easy_batting": np.int64, "handedness": np.int64,
+    "batter_x": np.float64, "ball_x": np.float64, "ball_z": np.float64, "chem": np.int64, "num_stars": np.int64, "hit_type": np.int64,
+    "is_star_hit": bool, "is_starred": bool, "pitch_type": np.int64, "charge_up": np.float64, "charge_down": np.float64, "frame": np.int64,
+    "stick_up": bool, "stick_down": bool, "stick_left": bool, "stick_right": bool, "rand_1": np.int64, "rand_2": np.int64, "rand_3": np.int64,
+}
+
+FLOAT_COLUMNS = [k for k, t in COLUMN_TYPES.items() if t is np.float64]
+
+STAGES = [_prelude, _contact, _horizontal_angle, _vertical_angle, _hit_power, _velocity, _flight]
+
+def hit_ball_batch(single_precision = False, **kwargs) -> np.ndarray:
+    """ hit_ball for arrays of swings, every argument is broadcast against the others.
+
+    Takes the same arguments as hit_ball, except ball_z is used as given. rand_1, rand_2 and rand_3 have to be set,
+    there is no random fill in. Returns a BATCH_DTYPE structured array in the broadcast shape, bunts and swings
+    that would miss the bat are marked as not valid.
+
+    single_precision does every float step in float32 and steps the flight frame by frame instead of float64 and the
+    closed form flight. The multiply-adds of the contact thresholds, the power interpolations and the flight step are
+    rounded once, as fused multiply-adds. It has not been checked against values read from a running game.
+
+    10^6 random swings take about 0.8s, or 2.0s with single_precision, on the one slow core this was measured on.
+    """
+
+    defaults = {k: t(0) for k, t in COLUMN_TYPES.items()}
+    defaults["num_stars"] = 4
+    unknown = set(kwargs) - set(defaults)
+    if unknown:
+        raise TypeError(f"unknown arguments {', '.join(sorted(unknown))}")
+
+    values = {**defaults, **kwargs}
+    shape = np.broadcast_shapes(*(np.shape(v) for v in values.values()))
+    # scalars are filled in per chunk instead of being broadcast to the full size
+    columns = {k: np.broadcast_to(v, shape).ravel() for k, v in values.items() if np.ndim(v) != 0}
+    scalars = {k: v for k, v in values.items() if np.ndim(v) == 0}
+
+    tables = SINGLE if single_precision else DOUBLE
+    stages = STAGES[:-1] + [_flight_single] if single_precision else STAGES
+
+    out = np.zeros(int(np.prod(shape)), dtype=BATCH_DTYPE)
+    # chunks small enough for the temporaries to stay in cache
+    for start in range(0, len(out), CHUNK_SIZE):
+        count = min(CHUNK_SIZE, len(out) - start)
+        s = {k: v[start:start + count].astype(COLUMN_TYPES[k]) for k, v in columns.items()}
+        s.update({k: np.full(count, v, dtype=COLUMN_TYPES[k]) for k, v in scalars.items()})
+        s["tables"] = tables
+        for k in FLOAT_COLUMNS:
+            s[k] = s[k].astype(tables.dtype)
+
+        s["valid"] = s["hit_type"] != BUNT
+        # bunts go through the swing stages with slap tables, their results are thrown away
+        s["hit_type"] = np.where(s["valid"], s["hit_type"], SLAP)
+
+        for stage in stages:
+            stage(s)
+
+        # the output rows are wide, filling them a block at a time keeps them in cache from one field to the next
+        for at in range(start, start + count, COPY_SIZE):
+            block = out[at:min(at + COPY_SIZE, start + count)]
+            for name in BATCH_DTYPE.names:
+                block[name] = s["batter_hit_type" if name == "hit_type" else name][at - start:at - start + COPY_SIZE]
+
+    return out.reshape(shape)
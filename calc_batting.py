@@ -1,6 +1,10 @@
+import copy
 import json
 import math
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from random import random
+from flight import Flight
 
 STATS = [{"Curve Ball Speed": 130, "Fast Ball Speed": 168, "Cursed Ball": 60, "Curve": 53, "Curve Control": 50, "Char Id": 0, "Slap Contact Spot Size": 65, "Charge Contact Spot Size": 35, "Slap Hit Power": 50, "Charge Hit Power": 64, "Bunting": 35, "Speed": 50, "Throwing Arm": 60, "Weight": 2, "Captain Star Hit/Pitch": 1, "Non Captain Star Pitch": 2, "Batting Stat Bar": 6, "Pitching Stat Bar": 6, "Running Stat Bar": 5, "Fielding Stat Bar": 6, "Name": "Mario", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 0, "Can Be Captain": 1, "Non Captain Star Swing": 1, "Fielding Ability": 10}, {"Curve Ball Speed": 125, "Fast Ball Speed": 165, "Cursed Ball": 55, "Curve": 56, "Curve Control": 50, "Char Id": 1, "Slap Contact Spot Size": 70, "Charge Contact Spot Size": 40, "Slap Hit Power": 48, "Charge Hit Power": 59, "Bunting": 40, "Speed": 60, "Throwing Arm": 50, "Weight": 2, "Captain Star Hit/Pitch": 2, "Non Captain Star Pitch": 2, "Batting Stat Bar": 5, "Pitching Stat Bar": 6, "Running Stat Bar": 6, "Fielding Stat Bar": 6, "Name": "Luigi", "Fielding Arm": 0, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 0, "Can Be Captain": 1, "Non Captain Star Swing": 2, "Fielding Ability": 66}, {"Curve Ball Speed": 130, "Fast Ball Speed": 165, "Cursed Ball": 70, "Curve": 35, "Curve Control": 50, "Char Id": 2, "Slap Contact Spot Size": 30, "Charge Contact Spot Size": 15, "Slap Hit Power": 60, "Charge Hit Power": 80, "Bunting": 20, "Speed": 40, "Throwing Arm": 70, "Weight": 4, "Captain Star Hit/Pitch": 5, "Non Captain Star Pitch": 1, "Batting Stat Bar": 8, "Pitching Stat Bar": 7, "Running Stat Bar": 4, "Fielding Stat Bar": 4, "Name": "DK", "Fielding Arm": 0, "Batting Stance": 1, "Horizontal Hit Trajectory": 1, "Vertical Hit Trajectory": 1, "Character Class": 1, "Can Be Captain": 1, "Non Captain Star Swing": 1, "Fielding Ability": 20}, {"Curve Ball Speed": 115, "Fast Ball Speed": 155, "Cursed Ball": 45, "Curve": 80, "Curve Control": 50, "Char Id": 3, "Slap Contact Spot Size": 45, "Charge Contact Spot Size": 15, "Slap Hit Power": 45, "Charge Hit Power": 30, "Bunting": 20, "Speed": 70, "Throwing Arm": 60, "Weight": 1, "Captain Star Hit/Pitch": 6, "Non Captain Star Pitch": 1, "Batting Stat Bar": 3, "Pitching Stat Bar": 6, "Running Stat Bar": 7, "Fielding Stat Bar": 7, "Name": "Diddy", "Fielding Arm": 0, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 2, "Character Class": 2, "Can Be Captain": 1, "Non Captain Star Swing": 2, "Fielding Ability": 4}, {"Curve Ball Speed": 125, "Fast Ball Speed": 165, "Cursed Ball": 50, "Curve": 70, "Curve Control": 90, "Char Id": 4, "Slap Contact Spot Size": 80, "Charge Contact Spot Size": 45, "Slap Hit Power": 46, "Charge Hit Power": 45, "Bunting": 45, "Speed": 50, "Throwing Arm": 40, "Weight": 2, "Captain Star Hit/Pitch": 11, "Non Captain Star Pitch": 3, "Batting Stat Bar": 4, "Pitching Stat Bar": 8, "Running Stat Bar": 5, "Fielding Stat Bar": 7, "Name": "Peach", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 2, "Vertical Hit Trajectory": 2, "Character Class": 3, "Can Be Captain": 1, "Non Captain Star Swing": 2, "Fielding Ability": 32}, {"Curve Ball Speed": 120, "Fast Ball Speed": 160, "Cursed Ball": 55, "Curve": 60, "Curve Control": 55, "Char Id": 5, "Slap Contact Spot Size": 70, "Charge Contact Spot Size": 40, "Slap Hit Power": 49, "Charge Hit Power": 60, "Bunting": 55, "Speed": 40, "Throwing Arm": 40, "Weight": 2, "Captain Star Hit/Pitch": 12, "Non Captain Star Pitch": 3, "Batting Stat Bar": 6, "Pitching Stat Bar": 7, "Running Stat Bar": 4, "Fielding Stat Bar": 5, "Name": "Daisy", "Fielding Arm": 0, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 0, "Can Be Captain": 1, "Non Captain Star Swing": 1, "Fielding Ability": 40}, {"Curve Ball Speed": 120, "Fast Ball Speed": 155, "Cursed Ball": 50, "Curve": 51, "Curve Control": 50, "Char Id": 6, "Slap Contact Spot Size": 50, "Charge Contact Spot Size": 30, "Slap Hit Power": 50, "Charge Hit Power": 45, "Bunting": 25, "Speed": 90, "Throwing Arm": 40, "Weight": 2, "Captain Star Hit/Pitch": 9, "Non Captain Star Pitch": 3, "Batting Stat Bar": 5, "Pitching Stat Bar": 4, "Running Stat Bar": 9, "Fielding Stat Bar": 6, "Name": "Yoshi", "Fielding Arm": 0, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 2, "Can Be Captain": 1, "Non Captain Star Swing": 2, "Fielding Ability": 4}, {"Curve Ball Speed": 115, "Fast Ball Speed": 150, "Cursed Ball": 50, "Curve": 50, "Curve Control": 50, "Char Id": 7, "Slap Contact Spot Size": 50, "Charge Contact Spot Size": 25, "Slap Hit Power": 44, "Charge Hit Power": 30, "Bunting": 25, "Speed": 70, "Throwing Arm": 30, "Weight": 0, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 1, "Batting Stat Bar": 3, "Pitching Stat Bar": 5, "Running Stat Bar": 7, "Fielding Stat Bar": 3, "Name": "Baby Mario", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 2, "Character Class": 2, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 2}, {"Curve Ball Speed": 115, "Fast Ball Speed": 150, "Cursed Ball": 40, "Curve": 50, "Curve Control": 50, "Char Id": 8, "Slap Contact Spot Size": 45, "Charge Contact Spot Size": 25, "Slap Hit Power": 42, "Charge Hit Power": 20, "Bunting": 25, "Speed": 80, "Throwing Arm": 30, "Weight": 0, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 1, "Batting Stat Bar": 2, "Pitching Stat Bar": 5, "Running Stat Bar": 8, "Fielding Stat Bar": 3, "Name": "Baby Luigi", "Fielding Arm": 0, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 2, "Character Class": 2, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 2}, {"Curve Ball Speed": 120, "Fast Ball Speed": 175, "Cursed Ball": 90, "Curve": 35, "Curve Control": 50, "Char Id": 9, "Slap Contact Spot Size": 40, "Charge Contact Spot Size": 15, "Slap Hit Power": 60, "Charge Hit Power": 95, "Bunting": 20, "Speed": 10, "Throwing Arm": 70, "Weight": 4, "Captain Star Hit/Pitch": 7, "Non Captain Star Pitch": 2, "Batting Stat Bar": 9, "Pitching Stat Bar": 9, "Running Stat Bar": 1, "Fielding Stat Bar": 1, "Name": "Bowser", "Fielding Arm": 0, "Batting Stance": 1, "Horizontal Hit Trajectory": 1, "Vertical Hit Trajectory": 1, "Character Class": 1, "Can Be Captain": 1, "Non Captain Star Swing": 1, "Fielding Ability": 17}, {"Curve Ball Speed": 125, "Fast Ball Speed": 165, "Cursed Ball": 80, "Curve": 30, "Curve Control": 50, "Char Id": 10, "Slap Contact Spot Size": 50, "Charge Contact Spot Size": 25, "Slap Hit Power": 55, "Charge Hit Power": 80, "Bunting": 25, "Speed": 30, "Throwing Arm": 60, "Weight": 3, "Captain Star Hit/Pitch": 3, "Non Captain Star Pitch": 2, "Batting Stat Bar": 8, "Pitching Stat Bar": 3, "Running Stat Bar": 3, "Fielding Stat Bar": 4, "Name": "Wario", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 1, "Can Be Captain": 1, "Non Captain Star Swing": 1, "Fielding Ability": 9}, {"Curve Ball Speed": 110, "Fast Ball Speed": 169, "Cursed Ball": 50, "Curve": 70, "Curve Control": 60, "Char Id": 11, "Slap Contact Spot Size": 90, "Charge Contact Spot Size": 40, "Slap Hit Power": 50, "Charge Hit Power": 1, "Bunting": 45, "Speed": 40, "Throwing Arm": 40, "Weight": 3, "Captain Star Hit/Pitch": 4, "Non Captain Star Pitch": 1, "Batting Stat Bar": 4, "Pitching Stat Bar": 9, "Running Stat Bar": 4, "Fielding Stat Bar": 4, "Name": "Waluigi", "Fielding Arm": 1, "Batting Stance": 1, "Horizontal Hit Trajectory": 2, "Vertical Hit Trajectory": 2, "Character Class": 3, "Can Be Captain": 1, "Non Captain Star Swing": 3, "Fielding Ability": 80}, {"Curve Ball Speed": 120, "Fast Ball Speed": 160, "Cursed Ball": 50, "Curve": 50, "Curve Control": 50, "Char Id": 12, "Slap Contact Spot Size": 70, "Charge Contact Spot Size": 30, "Slap Hit Power": 40, "Charge Hit Power": 50, "Bunting": 30, "Speed": 40, "Throwing Arm": 50, "Weight": 1, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 1, "Batting Stat Bar": 5, "Pitching Stat Bar": 4, "Running Stat Bar": 4, "Fielding Stat Bar": 5, "Name": "Koopa(R)", "Fielding Arm": 0, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 0, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 8}, {"Curve Ball Speed": 115, "Fast Ball Speed": 155, "Cursed Ball": 50, "Curve": 50, "Curve Control": 50, "Char Id": 13, "Slap Contact Spot Size": 50, "Charge Contact Spot Size": 30, "Slap Hit Power": 45, "Charge Hit Power": 70, "Bunting": 25, "Speed": 60, "Throwing Arm": 50, "Weight": 0, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 2, "Batting Stat Bar": 5, "Pitching Stat Bar": 3, "Running Stat Bar": 6, "Fielding Stat Bar": 3, "Name": "Toad(R)", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 0, "Can Be Captain": 0, "Non Captain Star Swing": 1, "Fielding Ability": 0}, {"Curve Ball Speed": 120, "Fast Ball Speed": 160, "Cursed Ball": 50, "Curve": 90, "Curve Control": 60, "Char Id": 14, "Slap Contact Spot Size": 85, "Charge Contact Spot Size": 45, "Slap Hit Power": 40, "Charge Hit Power": 30, "Bunting": 50, "Speed": 40, "Throwing Arm": 40, "Weight": 1, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 1, "Batting Stat Bar": 3, "Pitching Stat Bar": 8, "Running Stat Bar": 4, "Fielding Stat Bar": 2, "Name": "Boo", "Fielding Arm": 1, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 3, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 64}, {"Curve Ball Speed": 115, "Fast Ball Speed": 150, "Cursed Ball": 50, "Curve": 50, "Curve Control": 50, "Char Id": 15, "Slap Contact Spot Size": 50, "Charge Contact Spot Size": 30, "Slap Hit Power": 44, "Charge Hit Power": 20, "Bunting": 25, "Speed": 90, "Throwing Arm": 40, "Weight": 0, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 1, "Batting Stat Bar": 2, "Pitching Stat Bar": 3, "Running Stat Bar": 9, "Fielding Stat Bar": 4, "Name": "Toadette", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 2, "Character Class": 2, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 10}, {"Curve Ball Speed": 120, "Fast Ball Speed": 160, "Cursed Ball": 50, "Curve": 50, "Curve Control": 50, "Char Id": 16, "Slap Contact Spot Size": 50, "Charge Contact Spot Size": 30, "Slap Hit Power": 46, "Charge Hit Power": 55, "Bunting": 25, "Speed": 40, "Throwing Arm": 40, "Weight": 1, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 3, "Batting Stat Bar": 5, "Pitching Stat Bar": 3, "Running Stat Bar": 4, "Fielding Stat Bar": 5, "Name": "Shy Guy(R)", "Fielding Arm": 1, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 0, "Can Be Captain": 0, "Non Captain Star Swing": 1, "Fielding Ability": 8}, {"Curve Ball Speed": 125, "Fast Ball Speed": 165, "Cursed Ball": 60, "Curve": 40, "Curve Control": 50, "Char Id": 17, "Slap Contact Spot Size": 45, "Charge Contact Spot Size": 30, "Slap Hit Power": 55, "Charge Hit Power": 67, "Bunting": 20, "Speed": 40, "Throwing Arm": 60, "Weight": 3, "Captain Star Hit/Pitch": 10, "Non Captain Star Pitch": 2, "Batting Stat Bar": 6, "Pitching Stat Bar": 4, "Running Stat Bar": 4, "Fielding Stat Bar": 4, "Name": "Birdo", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 0, "Can Be Captain": 1, "Non Captain Star Swing": 1, "Fielding Ability": 1}, {"Curve Ball Speed": 120, "Fast Ball Speed": 155, "Cursed Ball": 50, "Curve": 50, "Curve Control": 50, "Char Id": 18, "Slap Contact Spot Size": 40, "Charge Contact Spot Size": 30, "Slap Hit Power": 45, "Charge Hit Power": 30, "Bunting": 20, "Speed": 60, "Throwing Arm": 30, "Weight": 1, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 3, "Batting Stat Bar": 3, "Pitching Stat Bar": 3, "Running Stat Bar": 7, "Fielding Stat Bar": 5, "Name": "Monty", "Fielding Arm": 0, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 2, "Character Class": 2, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 1}, {"Curve Ball Speed": 125, "Fast Ball Speed": 166, "Cursed Ball": 50, "Curve": 40, "Curve Control": 50, "Char Id": 19, "Slap Contact Spot Size": 35, "Charge Contact Spot Size": 20, "Slap Hit Power": 55, "Charge Hit Power": 75, "Bunting": 30, "Speed": 40, "Throwing Arm": 50, "Weight": 2, "Captain Star Hit/Pitch": 8, "Non Captain Star Pitch": 2, "Batting Stat Bar": 8, "Pitching Stat Bar": 5, "Running Stat Bar": 4, "Fielding Stat Bar": 3, "Name": "Bowser Jr", "Fielding Arm": 1, "Batting Stance": 0, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 1, "Character Class": 1, "Can Be Captain": 1, "Non Captain Star Swing": 1, "Fielding Ability": 2}, {"Curve Ball Speed": 115, "Fast Ball Speed": 155, "Cursed Ball": 50, "Curve": 60, "Curve Control": 50, "Char Id": 20, "Slap Contact Spot Size": 55, "Charge Contact Spot Size": 30, "Slap Hit Power": 48, "Charge Hit Power": 35, "Bunting": 20, "Speed": 60, "Throwing Arm": 60, "Weight": 1, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 1, "Batting Stat Bar": 3, "Pitching Stat Bar": 3, "Running Stat Bar": 6, "Fielding Stat Bar": 4, "Name": "Paratroopa(R)", "Fielding Arm": 0, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 2, "Character Class": 3, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 64}, {"Curve Ball Speed": 125, "Fast Ball Speed": 160, "Cursed Ball": 50, "Curve": 30, "Curve Control": 50, "Char Id": 21, "Slap Contact Spot Size": 35, "Charge Contact Spot Size": 15, "Slap Hit Power": 51, "Charge Hit Power": 65, "Bunting": 20, "Speed": 20, "Throwing Arm": 80, "Weight": 3, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 3, "Batting Stat Bar": 6, "Pitching Stat Bar": 3, "Running Stat Bar": 2, "Fielding Stat Bar": 5, "Name": "Pianta(B)", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 1, "Vertical Hit Trajectory": 2, "Character Class": 1, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 17}, {"Curve Ball Speed": 125, "Fast Ball Speed": 160, "Cursed Ball": 50, "Curve": 30, "Curve Control": 50, "Char Id": 22, "Slap Contact Spot Size": 35, "Charge Contact Spot Size": 15, "Slap Hit Power": 51, "Charge Hit Power": 70, "Bunting": 20, "Speed": 10, "Throwing Arm": 80, "Weight": 3, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 2, "Batting Stat Bar": 7, "Pitching Stat Bar": 3, "Running Stat Bar": 1, "Fielding Stat Bar": 5, "Name": "Pianta(R)", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 1, "Vertical Hit Trajectory": 2, "Character Class": 1, "Can Be Captain": 0, "Non Captain Star Swing": 1, "Fielding Ability": 17}, {"Curve Ball Speed": 125, "Fast Ball Speed": 165, "Cursed Ball": 50, "Curve": 40, "Curve Control": 50, "Char Id": 23, "Slap Contact Spot Size": 35, "Charge Contact Spot Size": 15, "Slap Hit Power": 51, "Charge Hit Power": 65, "Bunting": 20, "Speed": 10, "Throwing Arm": 80, "Weight": 3, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 1, "Batting Stat Bar": 6, "Pitching Stat Bar": 4, "Running Stat Bar": 1, "Fielding Stat Bar": 5, "Name": "Pianta(Y)", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 1, "Vertical Hit Trajectory": 2, "Character Class": 1, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 17}, {"Curve Ball Speed": 115, "Fast Ball Speed": 155, "Cursed Ball": 50, "Curve": 50, "Curve Control": 50, "Char Id": 24, "Slap Contact Spot Size": 40, "Charge Contact Spot Size": 15, "Slap Hit Power": 43, "Charge Hit Power": 30, "Bunting": 20, "Speed": 70, "Throwing Arm": 60, "Weight": 1, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 3, "Batting Stat Bar": 3, "Pitching Stat Bar": 3, "Running Stat Bar": 7, "Fielding Stat Bar": 4, "Name": "Noki(B)", "Fielding Arm": 0, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 2, "Character Class": 2, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 8}, {"Curve Ball Speed": 115, "Fast Ball Speed": 155, "Cursed Ball": 50, "Curve": 50, "Curve Control": 50, "Char Id": 25, "Slap Contact Spot Size": 40, "Charge Contact Spot Size": 15, "Slap Hit Power": 45, "Charge Hit Power": 40, "Bunting": 20, "Speed": 60, "Throwing Arm": 60, "Weight": 1, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 2, "Batting Stat Bar": 4, "Pitching Stat Bar": 3, "Running Stat Bar": 6, "Fielding Stat Bar": 4, "Name": "Noki(R)", "Fielding Arm": 0, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 2, "Character Class": 2, "Can Be Captain": 0, "Non Captain Star Swing": 1, "Fielding Ability": 8}, {"Curve Ball Speed": 115, "Fast Ball Speed": 155, "Cursed Ball": 50, "Curve": 60, "Curve Control": 50, "Char Id": 26, "Slap Contact Spot Size": 45, "Charge Contact Spot Size": 13, "Slap Hit Power": 43, "Charge Hit Power": 30, "Bunting": 25, "Speed": 60, "Throwing Arm": 60, "Weight": 1, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 1, "Batting Stat Bar": 3, "Pitching Stat Bar": 4, "Running Stat Bar": 6, "Fielding Stat Bar": 4, "Name": "Noki(G)", "Fielding Arm": 0, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 2, "Character Class": 2, "Can Be Captain": 0, "Non Captain Star Swing": 3, "Fielding Ability": 8}, {
         "Curve Ball Speed": 125, "Fast Ball Speed": 165, "Cursed Ball": 50, "Curve": 40, "Curve Control": 50, "Char Id": 27, "Slap Contact Spot Size": 30, "Charge Contact Spot Size": 20, "Slap Hit Power": 10, "Charge Hit Power": 85, "Bunting": 15, "Speed": 30, "Throwing Arm": 60, "Weight": 3, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 2, "Batting Stat Bar": 8, "Pitching Stat Bar": 3, "Running Stat Bar": 3, "Fielding Stat Bar": 3, "Name": "Bro(H)", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 1, "Vertical Hit Trajectory": 1, "Character Class": 1, "Can Be Captain": 0, "Non Captain Star Swing": 1, "Fielding Ability": 1}, {"Curve Ball Speed": 120, "Fast Ball Speed": 155, "Cursed Ball": 50, "Curve": 50, "Curve Control": 50, "Char Id": 28, "Slap Contact Spot Size": 85, "Charge Contact Spot Size": 40, "Slap Hit Power": 45, "Charge Hit Power": 40, "Bunting": 45, "Speed": 40, "Throwing Arm": 30, "Weight": 0, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 3, "Batting Stat Bar": 4, "Pitching Stat Bar": 4, "Running Stat Bar": 4, "Fielding Stat Bar": 6, "Name": "Toadsworth", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 3, "Can Be Captain": 0, "Non Captain Star Swing": 3, "Fielding Ability": 1}, {"Curve Ball Speed": 115, "Fast Ball Speed": 155, "Cursed Ball": 50, "Curve": 50, "Curve Control": 50, "Char Id": 29, "Slap Contact Spot Size": 50, "Charge Contact Spot Size": 30, "Slap Hit Power": 40, "Charge Hit Power": 60, "Bunting": 25, "Speed": 70, "Throwing Arm": 50, "Weight": 0, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 3, "Batting Stat Bar": 4, "Pitching Stat Bar": 3, "Running Stat Bar": 7, "Fielding Stat Bar": 3, "Name": "Toad(B)", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 0, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 0}, {"Curve Ball Speed": 120, "Fast Ball Speed": 160, "Cursed Ball": 50, "Curve": 55, "Curve Control": 50, "Char Id": 30, "Slap Contact Spot Size": 50, "Charge Contact Spot Size": 30, "Slap Hit Power": 40, "Charge Hit Power": 60, "Bunting": 25, "Speed": 60, "Throwing Arm": 50, "Weight": 0, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 1, "Batting Stat Bar": 4, "Pitching Stat Bar": 4, "Running Stat Bar": 6, "Fielding Stat Bar": 3, "Name": "Toad(Y)", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 0, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 0}, {"Curve Ball Speed": 115, "Fast Ball Speed": 155, "Cursed Ball": 50, "Curve": 50, "Curve Control": 50, "Char Id": 31, "Slap Contact Spot Size": 55, "Charge Contact Spot Size": 35, "Slap Hit Power": 45, "Charge Hit Power": 65, "Bunting": 35, "Speed": 60, "Throwing Arm": 50, "Weight": 0, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 3, "Batting Stat Bar": 5, "Pitching Stat Bar": 3, "Running Stat Bar": 6, "Fielding Stat Bar": 3, "Name": "Toad(G)", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 0, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 0}, {"Curve Ball Speed": 115, "Fast Ball Speed": 155, "Cursed Ball": 50, "Curve": 50, "Curve Control": 50, "Char Id": 32, "Slap Contact Spot Size": 50, "Charge Contact Spot Size": 30, "Slap Hit Power": 45, "Charge Hit Power": 70, "Bunting": 25, "Speed": 50, "Throwing Arm": 60, "Weight": 0, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 2, "Batting Stat Bar": 5, "Pitching Stat Bar": 3, "Running Stat Bar": 5, "Fielding Stat Bar": 4, "Name": "Toad(P)", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 0, "Can Be Captain": 0, "Non Captain Star Swing": 1, "Fielding Ability": 0}, {"Curve Ball Speed": 120, "Fast Ball Speed": 150, "Cursed Ball": 50, "Curve": 50, "Curve Control": 40, "Char Id": 33, "Slap Contact Spot Size": 65, "Charge Contact Spot Size": 35, "Slap Hit Power": 48, "Charge Hit Power": 40, "Bunting": 40, "Speed": 20, "Throwing Arm": 40, "Weight": 2, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 1, "Batting Stat Bar": 4, "Pitching Stat Bar": 2, "Running Stat Bar": 2, "Fielding Stat Bar": 8, "Name": "Magikoopa(B)", "Fielding Arm": 0, "Batting Stance": 1, "Horizontal Hit Trajectory": 2, "Vertical Hit Trajectory": 2, "Character Class": 3, "Can Be Captain": 0, "Non Captain Star Swing": 3, "Fielding Ability": 128}, {"Curve Ball Speed": 120, "Fast Ball Speed": 155, "Cursed Ball": 50, "Curve": 50, "Curve Control": 40, "Char Id": 34, "Slap Contact Spot Size": 65, "Charge Contact Spot Size": 35, "Slap Hit Power": 50, "Charge Hit Power": 45, "Bunting": 40, "Speed": 10, "Throwing Arm": 40, "Weight": 2, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 1, "Batting Stat Bar": 5, "Pitching Stat Bar": 2, "Running Stat Bar": 1, "Fielding Stat Bar": 8, "Name": "Magikoopa(R)", "Fielding Arm": 0, "Batting Stance": 1, "Horizontal Hit Trajectory": 2, "Vertical Hit Trajectory": 2, "Character Class": 3, "Can Be Captain": 0, "Non Captain Star Swing": 3, "Fielding Ability": 128}, {"Curve Ball Speed": 120, "Fast Ball Speed": 150, "Cursed Ball": 50, "Curve": 60, "Curve Control": 50, "Char Id": 35, "Slap Contact Spot Size": 65, "Charge Contact Spot Size": 35, "Slap Hit Power": 48, "Charge Hit Power": 40, "Bunting": 40, "Speed": 10, "Throwing Arm": 40, "Weight": 2, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 1, "Batting Stat Bar": 4, "Pitching Stat Bar": 3, "Running Stat Bar": 1, "Fielding Stat Bar": 8, "Name": "Magikoopa(G)", "Fielding Arm": 0, "Batting Stance": 1, "Horizontal Hit Trajectory": 2, "Vertical Hit Trajectory": 2, "Character Class": 3, "Can Be Captain": 0, "Non Captain Star Swing": 3, "Fielding Ability": 128}, {"Curve Ball Speed": 120, "Fast Ball Speed": 150, "Cursed Ball": 50, "Curve": 70, "Curve Control": 50, "Char Id": 36, "Slap Contact Spot Size": 65, "Charge Contact Spot Size": 35, "Slap Hit Power": 40, "Charge Hit Power": 30, "Bunting": 40, "Speed": 10, "Throwing Arm": 40, "Weight": 2, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 1, "Batting Stat Bar": 3, "Pitching Stat Bar": 4, "Running Stat Bar": 1, "Fielding Stat Bar": 8, "Name": "Magikoopa(Y)", "Fielding Arm": 0, "Batting Stance": 1, "Horizontal Hit Trajectory": 2, "Vertical Hit Trajectory": 2, "Character Class": 3, "Can Be Captain": 0, "Non Captain Star Swing": 3, "Fielding Ability": 128}, {"Curve Ball Speed": 125, "Fast Ball Speed": 165, "Cursed Ball": 50, "Curve": 60, "Curve Control": 50, "Char Id": 37, "Slap Contact Spot Size": 50, "Charge Contact Spot Size": 15, "Slap Hit Power": 55, "Charge Hit Power": 75, "Bunting": 20, "Speed": 30, "Throwing Arm": 70, "Weight": 4, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 2, "Batting Stat Bar": 7, "Pitching Stat Bar": 5, "Running Stat Bar": 3, "Fielding Stat Bar": 4, "Name": "King Boo", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 1, "Can Be Captain": 0, "Non Captain Star Swing": 1, "Fielding Ability": 65}, {"Curve Ball Speed": 130, "Fast Ball Speed": 170, "Cursed Ball": 50, "Curve": 30, "Curve Control": 50, "Char Id": 38, "Slap Contact Spot Size": 30, "Charge Contact Spot Size": 10, "Slap Hit Power": 60, "Charge Hit Power": 95, "Bunting": 10, "Speed": 10, "Throwing Arm": 100, "Weight": 4, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 3, "Batting Stat Bar": 9, "Pitching Stat Bar": 4, "Running Stat Bar": 1, "Fielding Stat Bar": 3, "Name": "Petey", "Fielding Arm": 1, "Batting Stance": 1, "Horizontal Hit Trajectory": 1, "Vertical Hit Trajectory": 1, "Character Class": 1, "Can Be Captain": 0, "Non Captain Star Swing": 1, "Fielding Ability": 1}, {"Curve Ball Speed": 115, "Fast Ball Speed": 155, "Cursed Ball": 50, "Curve": 70, "Curve Control": 50, "Char Id": 39, "Slap Contact Spot Size": 60, "Charge Contact Spot Size": 25, "Slap Hit Power": 42, "Charge Hit Power": 25, "Bunting": 30, "Speed": 60, "Throwing Arm": 70, "Weight": 1, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 1, "Batting Stat Bar": 2, "Pitching Stat Bar": 5, "Running Stat Bar": 6, "Fielding Stat Bar": 6, "Name": "Dixie", "Fielding Arm": 0, "Batting Stance": 1, "Horizontal Hit Trajectory": 2, "Vertical Hit Trajectory": 2, "Character Class": 3, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 4}, {"Curve Ball Speed": 115, "Fast Ball Speed": 155, "Cursed Ball": 50, "Curve": 50, "Curve Control": 50, "Char Id": 40, "Slap Contact Spot Size": 40, "Charge Contact Spot Size": 15, "Slap Hit Power": 45, "Charge Hit Power": 40, "Bunting": 80, "Speed": 50, "Throwing Arm": 30, "Weight": 0, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 2, "Batting Stat Bar": 4, "Pitching Stat Bar": 3, "Running Stat Bar": 5, "Fielding Stat Bar": 4, "Name": "Goomba", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 0, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 0}, {"Curve Ball Speed": 115, "Fast Ball Speed": 154, "Cursed Ball": 50, "Curve": 50, "Curve Control": 50, "Char Id": 41, "Slap Contact Spot Size": 30, "Charge Contact Spot Size": 15, "Slap Hit Power": 45, "Charge Hit Power": 30, "Bunting": 80, "Speed": 70, "Throwing Arm": 60, "Weight": 0, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 1, "Batting Stat Bar": 3, "Pitching Stat Bar": 2, "Running Stat Bar": 7, "Fielding Stat Bar": 5, "Name": "Paragoomba", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 2, "Character Class": 2, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 64}, {"Curve Ball Speed": 120, "Fast Ball Speed": 165, "Cursed Ball": 50, "Curve": 50, "Curve Control": 50, "Char Id": 42, "Slap Contact Spot Size": 70, "Charge Contact Spot Size": 30, "Slap Hit Power": 40, "Charge Hit Power": 60, "Bunting": 30, "Speed": 30, "Throwing Arm": 50, "Weight": 1, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 2, "Batting Stat Bar": 6, "Pitching Stat Bar": 4, "Running Stat Bar": 3, "Fielding Stat Bar": 5, "Name": "Koopa(G)", "Fielding Arm": 0, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 0, "Can Be Captain": 0, "Non Captain Star Swing": 1, "Fielding Ability": 8}, {"Curve Ball Speed": 115, "Fast Ball Speed": 155, "Cursed Ball": 50, "Curve": 60, "Curve Control": 50, "Char Id": 43, "Slap Contact Spot Size": 60, "Charge Contact Spot Size": 35, "Slap Hit Power": 40, "Charge Hit Power": 30, "Bunting": 20, "Speed": 60, "Throwing Arm": 60, "Weight": 1, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 1, "Batting Stat Bar": 2, "Pitching Stat Bar": 3, "Running Stat Bar": 6, "Fielding Stat Bar": 4, "Name": "Paratroopa(G)", "Fielding Arm": 0, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 2, "Character Class": 3, "Can Be Captain": 0, "Non Captain Star Swing": 3, "Fielding Ability": 64}, {"Curve Ball Speed": 120, "Fast Ball Speed": 160, "Cursed Ball": 50, "Curve": 50, "Curve Control": 50, "Char Id": 44, "Slap Contact Spot Size": 50, "Charge Contact Spot Size": 30, "Slap Hit Power": 42, "Charge Hit Power": 50, "Bunting": 25, "Speed": 50, "Throwing Arm": 40, "Weight": 1, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 3, "Batting Stat Bar": 4, "Pitching Stat Bar": 3, "Running Stat Bar": 5, "Fielding Stat Bar": 5, "Name": "Shy Guy(B)", "Fielding Arm": 1, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 0, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 8}, {"Curve Ball Speed": 130, "Fast Ball Speed": 165, "Cursed Ball": 50, "Curve": 55, "Curve Control": 50, "Char Id": 45, "Slap Contact Spot Size": 50, "Charge Contact Spot Size": 30, "Slap Hit Power": 42, "Charge Hit Power": 50, "Bunting": 25, "Speed": 40, "Throwing Arm": 40, "Weight": 1, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 1, "Batting Stat Bar": 4, "Pitching Stat Bar": 4, "Running Stat Bar": 4, "Fielding Stat Bar": 5, "Name": "Shy Guy(Y)", "Fielding Arm": 1, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 0, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 8}, {"Curve Ball Speed": 125, "Fast Ball Speed": 160, "Cursed Ball": 50, "Curve": 60, "Curve Control": 60, "Char Id": 46, "Slap Contact Spot Size": 50, "Charge Contact Spot Size": 30, "Slap Hit Power": 42, "Charge Hit Power": 50, "Bunting": 25, "Speed": 40, "Throwing Arm": 40, "Weight": 1, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 3, "Batting Stat Bar": 4, "Pitching Stat Bar": 4, "Running Stat Bar": 4, "Fielding Stat Bar": 5, "Name": "Shy Guy(G)", "Fielding Arm": 1, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 0, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 8}, {"Curve Ball Speed": 120, "Fast Ball Speed": 160, "Cursed Ball": 50, "Curve": 50, "Curve Control": 50, "Char Id": 47, "Slap Contact Spot Size": 50, "Charge Contact Spot Size": 30, "Slap Hit Power": 42, "Charge Hit Power": 50, "Bunting": 25, "Speed": 40, "Throwing Arm": 50, "Weight": 1, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 2, "Batting Stat Bar": 4, "Pitching Stat Bar": 4, "Running Stat Bar": 4, "Fielding Stat Bar": 6, "Name": "Shy Guy(Bk)", "Fielding Arm": 1, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 0, "Can Be Captain": 0, "Non Captain Star Swing": 1, "Fielding Ability": 8}, {"Curve Ball Speed": 120, "Fast Ball Speed": 150, "Cursed Ball": 90, "Curve": 50, "Curve Control": 50, "Char Id": 48, "Slap Contact Spot Size": 65, "Charge Contact Spot Size": 25, "Slap Hit Power": 40, "Charge Hit Power": 55, "Bunting": 30, "Speed": 40, "Throwing Arm": 50, "Weight": 1, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 1, "Batting Stat Bar": 5, "Pitching Stat Bar": 4, "Running Stat Bar": 4, "Fielding Stat Bar": 3, "Name": "Dry Bones(Gy)", "Fielding Arm": 1, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 3, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 9}, {"Curve Ball Speed": 120, "Fast Ball Speed": 150, "Cursed Ball": 90, "Curve": 50, "Curve Control": 50, "Char Id": 49, "Slap Contact Spot Size": 70, "Charge Contact Spot Size": 25, "Slap Hit Power": 40, "Charge Hit Power": 55, "Bunting": 30, "Speed": 30, "Throwing Arm": 50, "Weight": 1, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 1, "Batting Stat Bar": 6, "Pitching Stat Bar": 4, "Running Stat Bar": 3, "Fielding Stat Bar": 3, "Name": "Dry Bones(G)", "Fielding Arm": 1, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 3, "Can Be Captain": 0, "Non Captain Star Swing": 3, "Fielding Ability": 9}, {"Curve Ball Speed": 125, "Fast Ball Speed": 155, "Cursed Ball": 90, "Curve": 50, "Curve Control": 50, "Char Id": 50, "Slap Contact Spot Size": 65, "Charge Contact Spot Size": 25, "Slap Hit Power": 44, "Charge Hit Power": 60, "Bunting": 30, "Speed": 30, "Throwing Arm": 50, "Weight": 1, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 2, "Batting Stat Bar": 6, "Pitching Stat Bar": 4, "Running Stat Bar": 3, "Fielding Stat Bar": 3, "Name": "Dry Bones(R)", "Fielding Arm": 1, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 3, "Can Be Captain": 0, "Non Captain Star Swing": 1, "Fielding Ability": 9}, {"Curve Ball Speed": 120, "Fast Ball Speed": 150, "Cursed Ball": 90, "Curve": 50, "Curve Control": 50, "Char Id": 51, "Slap Contact Spot Size": 65, "Charge Contact Spot Size": 25, "Slap Hit Power": 40, "Charge Hit Power": 55, "Bunting": 30, "Speed": 30, "Throwing Arm": 60, "Weight": 1, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 3, "Batting Stat Bar": 5, "Pitching Stat Bar": 4, "Running Stat Bar": 3, "Fielding Stat Bar": 4, "Name": "Dry Bones(B)", "Fielding Arm": 1, "Batting Stance": 1, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 3, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 9}, {"Curve Ball Speed": 125, "Fast Ball Speed": 165, "Cursed Ball": 50, "Curve": 40, "Curve Control": 50, "Char Id": 52, "Slap Contact Spot Size": 30, "Charge Contact Spot Size": 20, "Slap Hit Power": 5, "Charge Hit Power": 90, "Bunting": 15, "Speed": 20, "Throwing Arm": 60, "Weight": 3, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 2, "Batting Stat Bar": 8, "Pitching Stat Bar": 3, "Running Stat Bar": 2, "Fielding Stat Bar": 3, "Name": "Bro(F)", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 1, "Vertical Hit Trajectory": 2, "Character Class": 1, "Can Be Captain": 0, "Non Captain Star Swing": 2, "Fielding Ability": 1}, {"Curve Ball Speed": 125, "Fast Ball Speed": 165, "Cursed Ball": 50, "Curve": 40, "Curve Control": 50, "Char Id": 53, "Slap Contact Spot Size": 30, "Charge Contact Spot Size": 20, "Slap Hit Power": 20, "Charge Hit Power": 80, "Bunting": 15, "Speed": 30, "Throwing Arm": 60, "Weight": 3, "Captain Star Hit/Pitch": 0, "Non Captain Star Pitch": 1, "Batting Stat Bar": 8, "Pitching Stat Bar": 3, "Running Stat Bar": 3, "Fielding Stat Bar": 3, "Name": "Bro(B)", "Fielding Arm": 0, "Batting Stance": 0, "Horizontal Hit Trajectory": 0, "Vertical Hit Trajectory": 0, "Character Class": 1, "Can Be Captain": 0, "Non Captain Star Swing": 3, "Fielding Ability": 1}]
@@ -77,6 +81,7 @@ LEFT_NICE = 1
 PERFECT = 2
 RIGHT_NICE = 3
 RIGHT_SOUR = 4
+CONTACT_ZONE_NAMES = ["Left Sour", "Left Nice", "Perfect", "Right Nice", "Right Sour"]
 
 RIGHTY = 0
 LEFTY = 1
@@ -122,19 +127,123 @@ PITCHCHARGETYPE_PERFECT = 3
 PUSHPULL_NONE = 0
 PUSHPULL_PULL = 1
 PUSHPULL_PUSH = 2
+
+
+class HitRequest:
+    # the arguments of hit_ball, see its docstring for what each one is
+    __slots__ = (
+        "batter_id", "is_batter_captain", "pitcher_id",
+        "easy_batting", "handedness",
+        "batter_x", "ball_x", "ball_z",
+        "chem", "num_stars",
+        "hit_type", "is_star_hit", "is_starred",
+        "pitch_type",
+        "charge_up", "charge_down",
+        "frame",
+        "stick_up", "stick_down", "stick_left", "stick_right",
+        "rand_1", "rand_2", "rand_3",
+        "override_vertical_range", "override_vertical_angle", "override_horizontal_angle",
+        "include_path",
+    )
+
+    def __init__(self, batter_id=0, is_batter_captain=False, pitcher_id=0,
+                 easy_batting=False, handedness=0,
+                 batter_x=0.0, ball_x=0.0, ball_z=0.0,
+                 chem=0, num_stars=4,
+                 hit_type=0, is_star_hit=False, is_starred=False,
+                 pitch_type=0,
+                 charge_up=0.0, charge_down=0.0,
+                 frame=0,
+                 stick_up=False, stick_down=False, stick_left=False, stick_right=False,
+                 rand_1=0, rand_2=0, rand_3=0,
+                 override_vertical_range=None, override_vertical_angle=None, override_horizontal_angle=None,
+                 include_path=True) -> None:
+        self.batter_id = batter_id
+        self.is_batter_captain = is_batter_captain
+        self.pitcher_id = pitcher_id
+        self.easy_batting = easy_batting
+        self.handedness = handedness
+        self.batter_x = batter_x
+        self.ball_x = ball_x
+        self.ball_z = ball_z
+        self.chem = chem
+        self.num_stars = num_stars
+        self.hit_type = hit_type
+        self.is_star_hit = is_star_hit
+        self.is_starred = is_starred
+        self.pitch_type = pitch_type
+        self.charge_up = charge_up
+        self.charge_down = charge_down
+        self.frame = frame
+        self.stick_up = stick_up
+        self.stick_down = stick_down
+        self.stick_left = stick_left
+        self.stick_right = stick_right
+        self.rand_1 = rand_1
+        self.rand_2 = rand_2
+        self.rand_3 = rand_3
+        self.override_vertical_range = override_vertical_range
+        self.override_vertical_angle = override_vertical_angle
+        self.override_horizontal_angle = override_horizontal_angle
+        self.include_path = include_path
+
+    def replace(self, **changes):
+        r = copy.copy(self)
+        for name, value in changes.items():
+            setattr(r, name, value)
+        return r
+
+class ControllerInput:
+    __slots__ = ("Up", "Down", "Left", "Right")
+
+    def __init__(self, up, down, left, right) -> None:
+        self.Up = up
+        self.Down = down
+        self.Left = left
+        self.Right = right
+
+class BatterState:
+    # same names as the game's batter struct
+    __slots__ = (
+        "Batter_CharID", "IsCaptain", "Name", "Stars", "isStar",
+        "AtBat_Mystery_BatDirection", "AtBat_TrimmedBat", "AtBat_BatterHand", "AtBat_IsFullyCharged", "AtBat_HitTrajectoryLow",
+        "AtBat_CaptainStarHitPitch", "AtBat_NonCaptainStarSwing", "AtBat_MoonShot", "AtBat_Mystery_CaptainStarSwing",
+        "AtBat_Mystery_DidPopFlyOrGrounderConnect", "AtBat_Mystery7", "AtBat_InputDirection",
+        "ballContact_X", "ballContact_Z", "interstitialBallContact_X", "posX",
+        "Batter_Contact_SlapChargeBuntStar", "Batter_IsBunting", "Batter_ContactType", "Batter_HitType",
+        "Batter_SlapHitPower", "Batter_SlapContactSize", "Batter_ChargeContactSize", "Batter_Bunting",
+        "BatterAtPlate_BatterCharge_Up", "BatterAtPlate_BatterCharge_Down", "BatterAtPlate_ChargePower", "BatterAtPlate_TrajectoryNearFar",
+        "RandomBattingFactors_ChemLinksOnBase", "Frame_SwingContact1", "EasyBatting", "ControllerInput",
+        "nonCaptainStarSwingContact", "CalculatedBallPos", "ContactQuality",
+        "LeftNiceThreshold", "LeftPerfectThreshold", "RightPerfectThreshold", "RightNiceThreshold",
+    )
+
+class PitcherState:
+    __slots__ = ("calced_cursedBall", "Pitcher_TypeOfPitch", "ChargePitchType")
+
+class BallState:
+    # velocity and acceleration stay dicts, they are handed out in BallDetails
+    __slots__ = ("ballVelocity", "ballAcceleration")
+
 class BattingCalculator:
-    StaticRandomInt1 = 7769  # <= 32767
-    StaticRandomInt2 = 5359  # <= 32767
-    USHORT_8089269c = 1828  # <= 32767
-    inMemBatter = {}
-    inMemPitcher = {}
-    inMemBall = {}
-    readValues = {}
-    Hit_HorizontalAngle = 0
-    Hit_VerticalAngle = 0
-    Hit_HorizontalPower = 0
-    AddedContactGravity = 0
-    Display_Output = {}
+    __slots__ = (
+        "request", "includePath",
+        "StaticRandomInt1", "StaticRandomInt2", "USHORT_8089269c",
+        "inMemBatter", "inMemPitcher", "inMemBall",
+        "Hit_HorizontalAngle", "Hit_VerticalAngle", "Hit_HorizontalPower", "Hit_BasePower", "AddedContactGravity",
+        "Display_Output",
+    )
+
+    def __init__(self, request:HitRequest) -> None:
+        self.request = request
+        # the frame by frame path is only needed for drawing
+        self.includePath = request.include_path
+        self.Hit_HorizontalAngle = 0
+        self.Hit_VerticalAngle = 0
+        self.Hit_HorizontalPower = 0
+        self.Hit_BasePower = 0
+        self.AddedContactGravity = 0
+        self.parseValues()
 
 
     def floor(f):
@@ -157,162 +266,162 @@ class BattingCalculator:
         return (nextMax - nextMin) * max + nextMin
 
     def calculateContact(self):
-        chargeUp = self.inMemBatter["BatterAtPlate_BatterCharge_Up"]
-        contactSize = self.inMemBatter["Batter_SlapContactSize"]
-        if (self.inMemBatter["AtBat_Mystery_CaptainStarSwing"] != 0):
+        chargeUp = self.inMemBatter.BatterAtPlate_BatterCharge_Up
+        contactSize = self.inMemBatter.Batter_SlapContactSize
+        if (self.inMemBatter.AtBat_Mystery_CaptainStarSwing != 0):
             # if there was a star swing, make contact size 100
             chargeUp = 0.0
             contactSize = 100.0
 
-        if (self.inMemBatter["Batter_IsBunting"] == False):
+        if (self.inMemBatter.Batter_IsBunting == False):
             if (chargeUp <= 0.0):
                 # If not charging
-                if (self.inMemBatter["RandomBattingFactors_ChemLinksOnBase"] != 0):
+                if (self.inMemBatter.RandomBattingFactors_ChemLinksOnBase != 0):
                     # If there are chem links on base, make the contact size larger
-                    contactSize *= CONTACT_CHEM_LINK_MULTIPLIERS[self.inMemBatter["RandomBattingFactors_ChemLinksOnBase"]]
+                    contactSize *= CONTACT_CHEM_LINK_MULTIPLIERS[self.inMemBatter.RandomBattingFactors_ChemLinksOnBase]
 
             else:
                 # else there is a charge
-                contactSize = self.inMemBatter["Batter_ChargeContactSize"]
+                contactSize = self.inMemBatter.Batter_ChargeContactSize
 
         else:
             # else bunting, use bunting contact size
-            contactSize = self.inMemBatter["Batter_Bunting"]
+            contactSize = self.inMemBatter.Batter_Bunting
 
-        diffInX = self.inMemBatter["interstitialBallContact_X"] - self.inMemBatter["posX"]
-        if (self.inMemBatter["AtBat_BatterHand"] == LEFTY):
+        diffInX = self.inMemBatter.interstitialBallContact_X - self.inMemBatter.posX
+        if (self.inMemBatter.AtBat_BatterHand == LEFTY):
             diffInX = -diffInX
 
         if (diffInX >= 0.0):
-            self.inMemBatter["CalculatedBallPos"] = 100.0 * \
+            self.inMemBatter.CalculatedBallPos = 100.0 * \
                 (diffInX /
-                BATTER_HITBOXES[self.inMemBatter["Batter_CharID"]]["HorizontalRangeFar"]) + 100.0
+                BATTER_HITBOXES[self.inMemBatter.Batter_CharID]["HorizontalRangeFar"]) + 100.0
 
         else:
-            self.inMemBatter["CalculatedBallPos"] = - \
+            self.inMemBatter.CalculatedBallPos = - \
                 (100.0 * (diffInX /
-                        BATTER_HITBOXES[self.inMemBatter["Batter_CharID"]]["HorizontalRangeNear"]) - 100.0)
+                        BATTER_HITBOXES[self.inMemBatter.Batter_CharID]["HorizontalRangeNear"]) - 100.0)
 
-        if (self.inMemBatter["CalculatedBallPos"] < 0.0):
-            self.inMemBatter["CalculatedBallPos"] = 0.0
+        if (self.inMemBatter.CalculatedBallPos < 0.0):
+            self.inMemBatter.CalculatedBallPos = 0.0
 
-        if (200.0 < self.inMemBatter["CalculatedBallPos"]):
-            self.inMemBatter["CalculatedBallPos"] = 200.0
+        if (200.0 < self.inMemBatter.CalculatedBallPos):
+            self.inMemBatter.CalculatedBallPos = 200.0
 
         # Higher is better, makes ranges larger
         contactSize = contactSize / 100.0
         # Contact sizes are only based on slap/charge and trimming, and AI
-        big_Array = BALL_CONTACT_ARRAY_807B6294[self.inMemBatter["AtBat_TrimmedBat"]][
-            self.inMemBatter["Batter_Contact_SlapChargeBuntStar"]][self.inMemBatter["EasyBatting"]]
+        big_Array = BALL_CONTACT_ARRAY_807B6294[self.inMemBatter.AtBat_TrimmedBat][
+            self.inMemBatter.Batter_Contact_SlapChargeBuntStar][self.inMemBatter.EasyBatting]
         b0 = big_Array[0]
         b1 = big_Array[1]
         b2 = big_Array[2]
         b3 = big_Array[3]
 
-        self.inMemBatter["LeftNiceThreshold"] = contactSize * (big_Array[4] - b0) + b0
-        self.inMemBatter["LeftPerfectThreshold"] = contactSize * (big_Array[5] - b1) + b1
-        self.inMemBatter["RightPerfectThreshold"] = contactSize * (big_Array[6] - b2) + b2
-        self.inMemBatter["RightNiceThreshold"] = contactSize * (big_Array[7] - b3) + b3
+        self.inMemBatter.LeftNiceThreshold = contactSize * (big_Array[4] - b0) + b0
+        self.inMemBatter.LeftPerfectThreshold = contactSize * (big_Array[5] - b1) + b1
+        self.inMemBatter.RightPerfectThreshold = contactSize * (big_Array[6] - b2) + b2
+        self.inMemBatter.RightNiceThreshold = contactSize * (big_Array[7] - b3) + b3
 
         
 
-        self.inMemBatter["Batter_ContactType"] = LEFT_SOUR
-        if (self.inMemBatter["LeftNiceThreshold"] <= self.inMemBatter["CalculatedBallPos"]):
-            self.inMemBatter["Batter_ContactType"] = LEFT_NICE
+        self.inMemBatter.Batter_ContactType = LEFT_SOUR
+        if (self.inMemBatter.LeftNiceThreshold <= self.inMemBatter.CalculatedBallPos):
+            self.inMemBatter.Batter_ContactType = LEFT_NICE
 
-            if (self.inMemBatter["LeftPerfectThreshold"] <= self.inMemBatter["CalculatedBallPos"]):
-                self.inMemBatter["Batter_ContactType"] = PERFECT
+            if (self.inMemBatter.LeftPerfectThreshold <= self.inMemBatter.CalculatedBallPos):
+                self.inMemBatter.Batter_ContactType = PERFECT
 
-                if (self.inMemBatter["RightPerfectThreshold"] <= self.inMemBatter["CalculatedBallPos"]):
-                    self.inMemBatter["Batter_ContactType"] = RIGHT_NICE
+                if (self.inMemBatter.RightPerfectThreshold <= self.inMemBatter.CalculatedBallPos):
+                    self.inMemBatter.Batter_ContactType = RIGHT_NICE
 
-                    if (self.inMemBatter["RightNiceThreshold"] <= self.inMemBatter["CalculatedBallPos"]):
-                        self.inMemBatter["Batter_ContactType"] = RIGHT_SOUR
+                    if (self.inMemBatter.RightNiceThreshold <= self.inMemBatter.CalculatedBallPos):
+                        self.inMemBatter.Batter_ContactType = RIGHT_SOUR
 
-        if (self.inMemBatter["Batter_ContactType"] == PERFECT):
-            if (self.inMemBatter["CalculatedBallPos"] >= 100.0):
-                self.inMemBatter["ContactQuality"] = 1.0 - (self.inMemBatter["CalculatedBallPos"] - self.inMemBatter["LeftPerfectThreshold"]) / (
-                    self.inMemBatter["RightPerfectThreshold"] - self.inMemBatter["LeftPerfectThreshold"])
+        if (self.inMemBatter.Batter_ContactType == PERFECT):
+            if (self.inMemBatter.CalculatedBallPos >= 100.0):
+                self.inMemBatter.ContactQuality = 1.0 - (self.inMemBatter.CalculatedBallPos - self.inMemBatter.LeftPerfectThreshold) / (
+                    self.inMemBatter.RightPerfectThreshold - self.inMemBatter.LeftPerfectThreshold)
 
             else:
-                self.inMemBatter["ContactQuality"] = (self.inMemBatter["CalculatedBallPos"] - self.inMemBatter["LeftPerfectThreshold"]) / (
-                    self.inMemBatter["RightPerfectThreshold"] - self.inMemBatter["LeftPerfectThreshold"])
+                self.inMemBatter.ContactQuality = (self.inMemBatter.CalculatedBallPos - self.inMemBatter.LeftPerfectThreshold) / (
+                    self.inMemBatter.RightPerfectThreshold - self.inMemBatter.LeftPerfectThreshold)
 
-            # if ((CONTACT_PERFECT_THRESHOLDS[self.inMemBatter["Batter_Contact_SlapChargeBuntStar"]][0] <= self.inMemBatter["CalculatedBallPos"]) and (self.inMemBatter["CalculatedBallPos"] <= CONTACT_PERFECT_THRESHOLDS[self.inMemBatter["Batter_Contact_SlapChargeBuntStar"]][1])):
-            #     self.inMemBatter["mostPerfectContact"] = True
+            # if ((CONTACT_PERFECT_THRESHOLDS[self.inMemBatter.Batter_Contact_SlapChargeBuntStar][0] <= self.inMemBatter.CalculatedBallPos) and (self.inMemBatter.CalculatedBallPos <= CONTACT_PERFECT_THRESHOLDS[self.inMemBatter.Batter_Contact_SlapChargeBuntStar][1])):
+            #     self.inMemBatter.mostPerfectContact = True
 
-        elif (self.inMemBatter["Batter_ContactType"] < PERFECT):
-            if (self.inMemBatter["Batter_ContactType"] == LEFT_SOUR):
-                self.inMemBatter["ContactQuality"] = self.inMemBatter["CalculatedBallPos"] / \
-                    self.inMemBatter["LeftNiceThreshold"]
+        elif (self.inMemBatter.Batter_ContactType < PERFECT):
+            if (self.inMemBatter.Batter_ContactType == LEFT_SOUR):
+                self.inMemBatter.ContactQuality = self.inMemBatter.CalculatedBallPos / \
+                    self.inMemBatter.LeftNiceThreshold
 
             else:
-                self.inMemBatter["ContactQuality"] = (self.inMemBatter["CalculatedBallPos"] - self.inMemBatter["LeftNiceThreshold"]) / (
-                    self.inMemBatter["LeftPerfectThreshold"] - self.inMemBatter["LeftNiceThreshold"])
+                self.inMemBatter.ContactQuality = (self.inMemBatter.CalculatedBallPos - self.inMemBatter.LeftNiceThreshold) / (
+                    self.inMemBatter.LeftPerfectThreshold - self.inMemBatter.LeftNiceThreshold)
 
-        elif (self.inMemBatter["Batter_ContactType"] < RIGHT_SOUR):
-            self.inMemBatter["ContactQuality"] = 1.0 - (self.inMemBatter["CalculatedBallPos"] - self.inMemBatter["RightPerfectThreshold"]) / (
-                self.inMemBatter["RightNiceThreshold"] - self.inMemBatter["RightPerfectThreshold"])
+        elif (self.inMemBatter.Batter_ContactType < RIGHT_SOUR):
+            self.inMemBatter.ContactQuality = 1.0 - (self.inMemBatter.CalculatedBallPos - self.inMemBatter.RightPerfectThreshold) / (
+                self.inMemBatter.RightNiceThreshold - self.inMemBatter.RightPerfectThreshold)
 
         else:
-            self.inMemBatter["ContactQuality"] = 1.0 - \
-                (self.inMemBatter["CalculatedBallPos"] - self.inMemBatter["RightNiceThreshold"]) / \
-                (200.0 - self.inMemBatter["RightNiceThreshold"])
+            self.inMemBatter.ContactQuality = 1.0 - \
+                (self.inMemBatter.CalculatedBallPos - self.inMemBatter.RightNiceThreshold) / \
+                (200.0 - self.inMemBatter.RightNiceThreshold)
 
-        if (self.inMemBatter["AtBat_MoonShot"] != False):
-            if (self.inMemBatter["Batter_ContactType"] == PERFECT):
-                self.inMemBatter["AtBat_Mystery_CaptainStarSwing"] = 0
+        if (self.inMemBatter.AtBat_MoonShot != False):
+            if (self.inMemBatter.Batter_ContactType == PERFECT):
+                self.inMemBatter.AtBat_Mystery_CaptainStarSwing = 0
 
             else:
-                self.inMemBatter["AtBat_MoonShot"] = False
+                self.inMemBatter.AtBat_MoonShot = False
 
-        self.inMemBatter["Batter_HitType"] = -1
-        if ((self.inMemBatter["Batter_Contact_SlapChargeBuntStar"] == SLAP) or (self.inMemBatter["Batter_Contact_SlapChargeBuntStar"] == CHARGE)):
+        self.inMemBatter.Batter_HitType = -1
+        if ((self.inMemBatter.Batter_Contact_SlapChargeBuntStar == SLAP) or (self.inMemBatter.Batter_Contact_SlapChargeBuntStar == CHARGE)):
             # Default to Sour
-            self.inMemBatter["Batter_HitType"] = SOUR_CURVE_SLAP
+            self.inMemBatter.Batter_HitType = SOUR_CURVE_SLAP
             # Adjust if the hit was nice or perfect
-            if (self.inMemBatter["Batter_ContactType"] == PERFECT):
-                self.inMemBatter["Batter_HitType"] = PERFECT_CURVE_SLAP
+            if (self.inMemBatter.Batter_ContactType == PERFECT):
+                self.inMemBatter.Batter_HitType = PERFECT_CURVE_SLAP
 
-            elif ((self.inMemBatter["Batter_ContactType"] == LEFT_NICE) or (self.inMemBatter["Batter_ContactType"] == RIGHT_NICE)):
-                self.inMemBatter["Batter_HitType"] = NICE_CURVE_SLAP
+            elif ((self.inMemBatter.Batter_ContactType == LEFT_NICE) or (self.inMemBatter.Batter_ContactType == RIGHT_NICE)):
+                self.inMemBatter.Batter_HitType = NICE_CURVE_SLAP
 
             # Adjust the HitType on a perfect pitch
             # 0xc for strike, 0xf for hit
-            if (self.inMemPitcher["ChargePitchType"] == PITCHCHARGETYPE_PERFECT):
-                if (self.inMemBatter["Batter_Contact_SlapChargeBuntStar"] == SLAP):
-                    self.inMemBatter["Batter_HitType"] += SOUR_PERFECTPITCH_SLAP
+            if (self.inMemPitcher.ChargePitchType == PITCHCHARGETYPE_PERFECT):
+                if (self.inMemBatter.Batter_Contact_SlapChargeBuntStar == SLAP):
+                    self.inMemBatter.Batter_HitType += SOUR_PERFECTPITCH_SLAP
 
                 else:
-                    self.inMemBatter["Batter_HitType"] += SOUR_PERFECTPITCH_CHARGE
+                    self.inMemBatter.Batter_HitType += SOUR_PERFECTPITCH_CHARGE
 
             else:
                 # Else not perfect charge pitch
                 # If the pitch was Curve and contact was not a hit, it was a charge:
                 # adjust by 0x3
-                if (self.inMemPitcher["Pitcher_TypeOfPitch"] == PITCHCURVE):
-                    if (self.inMemBatter["Batter_Contact_SlapChargeBuntStar"] != SLAP):
-                        self.inMemBatter["Batter_HitType"] += SOUR_CURVE_CHARGE
+                if (self.inMemPitcher.Pitcher_TypeOfPitch == PITCHCURVE):
+                    if (self.inMemBatter.Batter_Contact_SlapChargeBuntStar != SLAP):
+                        self.inMemBatter.Batter_HitType += SOUR_CURVE_CHARGE
 
                 else:
                     # Else non-curve, which I believe is just a change up
                     # adjust by 0x6 for Hit
                     # adjust by 0x9 for Charge
-                    if (self.inMemBatter["Batter_Contact_SlapChargeBuntStar"] == SLAP):
-                        self.inMemBatter["Batter_HitType"] += SOUR_CHANGEUP_SLAP
+                    if (self.inMemBatter.Batter_Contact_SlapChargeBuntStar == SLAP):
+                        self.inMemBatter.Batter_HitType += SOUR_CHANGEUP_SLAP
 
                     else:
-                        self.inMemBatter["Batter_HitType"] += SOUR_CHANGEUP_CHARGE
+                        self.inMemBatter.Batter_HitType += SOUR_CHANGEUP_CHARGE
 
         self.Display_Output["Contact"] = {
             "DistanceFromPerfect": diffInX,
-            "ContactZone": ["Left Sour", "Left Nice", "Perfect", "Right Nice", "Right Sour"][self.inMemBatter["Batter_ContactType"]],
-            "ContactQuality": self.inMemBatter["ContactQuality"],
-            "AbsoluteContact": self.inMemBatter["CalculatedBallPos"],
-            "LeftNiceThreshold" : self.inMemBatter["LeftNiceThreshold"],
-            "LeftPerfectThreshold" : self.inMemBatter["LeftPerfectThreshold"],
-            "RightPerfectThreshold" : self.inMemBatter["RightPerfectThreshold"],
-            "RightNiceThreshold" : self.inMemBatter["RightNiceThreshold"],
+            "ContactZone": CONTACT_ZONE_NAMES[self.inMemBatter.Batter_ContactType],
+            "ContactQuality": self.inMemBatter.ContactQuality,
+            "AbsoluteContact": self.inMemBatter.CalculatedBallPos,
+            "LeftNiceThreshold" : self.inMemBatter.LeftNiceThreshold,
+            "LeftPerfectThreshold" : self.inMemBatter.LeftPerfectThreshold,
+            "RightPerfectThreshold" : self.inMemBatter.RightPerfectThreshold,
+            "RightNiceThreshold" : self.inMemBatter.RightNiceThreshold,
         }
         return
 
@@ -327,7 +436,8 @@ class BattingCalculator:
         return ballAngle
 
 
-    def WeightedRandomIndex(self, vals, count):
+    def WeightedRandomIndex(vals, count, randomInt1, randomInt2, randomInt3):
+        # returns the index and the new randomInt1, the game updates it in case it's called successive times
         randomSum = 0
 
         loopSum = 0
@@ -344,9 +454,8 @@ class BattingCalculator:
             randomSum = 0
 
         else:
-            # update RandomInt in case it's called successive times
-            self.StaticRandomInt1 = (self.StaticRandomInt1 - (self.StaticRandomInt2 & 0xff)) + BattingCalculator.floor(self.StaticRandomInt2 / finSum) + self.USHORT_8089269c
-            randomRange = self.StaticRandomInt1 - BattingCalculator.floor(self.StaticRandomInt1 / finSum) * finSum
+            randomInt1 = (randomInt1 - (randomInt2 & 0xff)) + BattingCalculator.floor(randomInt2 / finSum) + randomInt3
+            randomRange = randomInt1 - BattingCalculator.floor(randomInt1 / finSum) * finSum
             randomSum = (randomRange >> 0x1f ^ randomRange) - (randomRange >> 0x1f)
             if (loopSum < 0):
                 randomSum = -randomSum
@@ -357,22 +466,22 @@ class BattingCalculator:
         if (0 < count):
             while (count != 0):
                 if (randomSum < p_loopArray[i]):
-                    return newIndex
+                    return newIndex, randomInt1
 
                 randomSum -= p_loopArray[i]
                 newIndex += 1
                 count += -1
                 i += 1
 
-        return 0
+        return 0, randomInt1
 
     def calculateBuntAngle(self):
         iVar3 = 0
-        input = self.inMemBatter["ControllerInput"]
+        input = self.inMemBatter.ControllerInput
 
-        contactType = self.inMemBatter["Batter_ContactType"]
-        iVar2 = self.inMemBatter["Batter_SlapContactSize"] * (BUNT_ANGLE_CALC_ARRAY[contactType][2] - BUNT_ANGLE_CALC_ARRAY[contactType][0])
-        iVar1 = self.inMemBatter["Batter_SlapContactSize"] * (BUNT_ANGLE_CALC_ARRAY[contactType][3] - BUNT_ANGLE_CALC_ARRAY[contactType][1])
+        contactType = self.inMemBatter.Batter_ContactType
+        iVar2 = self.inMemBatter.Batter_SlapContactSize * (BUNT_ANGLE_CALC_ARRAY[contactType][2] - BUNT_ANGLE_CALC_ARRAY[contactType][0])
+        iVar1 = self.inMemBatter.Batter_SlapContactSize * (BUNT_ANGLE_CALC_ARRAY[contactType][3] - BUNT_ANGLE_CALC_ARRAY[contactType][1])
         iVar2 = BattingCalculator.floor(iVar2 / 100) + (iVar2 >> 0x1f)
         iVar1 = BattingCalculator.floor(iVar1 / 100) + (iVar1 >> 0x1f)
         iVar2 = BUNT_ANGLE_CALC_ARRAY[contactType][0] + (iVar2 - (iVar2 >> 0x1f))
@@ -380,17 +489,17 @@ class BattingCalculator:
         iVar2 += self.StaticRandomInt1 - BattingCalculator.floor(self.StaticRandomInt1 / iVar1) * iVar1
         if (contactType != 0):
             if (contactType < 4):
-                if (not input["Left"]):
-                    if (not input["Right"]):
+                if (not input.Left):
+                    if (not input.Right):
                         iVar3 = (self.StaticRandomInt2 & 1 ^ -(self.StaticRandomInt2 >> 0x1f)) + (self.StaticRandomInt2 >> 0x1f)
-                    elif (self.inMemBatter["AtBat_BatterHand"] != RIGHTY):
+                    elif (self.inMemBatter.AtBat_BatterHand != RIGHTY):
                         iVar3 = 1
-                elif (self.inMemBatter["AtBat_BatterHand"] == RIGHTY):
+                elif (self.inMemBatter.AtBat_BatterHand == RIGHTY):
                     iVar3 = 1
         elif (contactType == 0):
             iVar3 = 1
 
-        if (((self.inMemBatter["AtBat_BatterHand"] == RIGHTY) and (iVar3 != 0)) or ((self.inMemBatter["AtBat_BatterHand"] != RIGHTY and (iVar3 == 0)))):
+        if (((self.inMemBatter.AtBat_BatterHand == RIGHTY) and (iVar3 != 0)) or ((self.inMemBatter.AtBat_BatterHand != RIGHTY and (iVar3 == 0)))):
             if (iVar2 < 0x801):
                 iVar2 = 0x800 - iVar2
             else:
@@ -402,11 +511,11 @@ class BattingCalculator:
 
     def calculateBuntingExtras(self):
         uVar5 = ((self.StaticRandomInt1 & 1 ^ self.StaticRandomInt1 >> 0x1f) != self.StaticRandomInt1 >> 0x1f)
-        uVar4 = self.inMemBatter["Batter_ContactType"]
-        iVar6 = BUNTING_CONTACT_ARRAY[self.inMemBatter["Batter_ContactType"]][uVar5][0]
+        uVar4 = self.inMemBatter.Batter_ContactType
+        iVar6 = BUNTING_CONTACT_ARRAY[self.inMemBatter.Batter_ContactType][uVar5][0]
         iVar7 = BUNTING_CONTACT_ARRAY[uVar4][uVar5][1]
-        iVar3 = self.inMemBatter["Batter_SlapContactSize"] * (BUNTING_CONTACT_ARRAY[uVar4][uVar5 + 2][0] - iVar6)
-        iVar2 = self.inMemBatter["Batter_SlapContactSize"] * (BUNTING_CONTACT_ARRAY[uVar4][uVar5 + 2][1] - iVar7)
+        iVar3 = self.inMemBatter.Batter_SlapContactSize * (BUNTING_CONTACT_ARRAY[uVar4][uVar5 + 2][0] - iVar6)
+        iVar2 = self.inMemBatter.Batter_SlapContactSize * (BUNTING_CONTACT_ARRAY[uVar4][uVar5 + 2][1] - iVar7)
         iVar3 = BattingCalculator.floor(iVar3 / 100) + (iVar3 >> 0x1f)
         iVar2 = BattingCalculator.floor(iVar2 / 100) + (iVar2 >> 0x1f)
         iVar6 += iVar3 - (iVar3 >> 0x1f)
@@ -424,34 +533,34 @@ class BattingCalculator:
             Hit_VerticalAngle = 0x800 - Hit_VerticalAngle
             Hit_HorizontalAngle = BattingCalculator.AdjustBallAngle(Hit_HorizontalAngle + 0x800)
 
-        iVar2 = BUNTING_POWER_ARRAY[self.inMemBatter["Batter_ContactType"]][1] - BUNTING_POWER_ARRAY[self.inMemBatter["Batter_ContactType"]][0]
-        self.Hit_HorizontalPower = (self.StaticRandomInt1 - (self.StaticRandomInt1 / iVar2) * iVar2) + BUNTING_POWER_ARRAY[self.inMemBatter["Batter_ContactType"]][0]
+        iVar2 = BUNTING_POWER_ARRAY[self.inMemBatter.Batter_ContactType][1] - BUNTING_POWER_ARRAY[self.inMemBatter.Batter_ContactType][0]
+        self.Hit_HorizontalPower = (self.StaticRandomInt1 - (self.StaticRandomInt1 / iVar2) * iVar2) + BUNTING_POWER_ARRAY[self.inMemBatter.Batter_ContactType][0]
         
-        self.inMemBatter["AtBat_Mystery_CaptainStarSwing"] = 0
+        self.inMemBatter.AtBat_Mystery_CaptainStarSwing = 0
         return
 
     def calculateHorizontalAngle(self):
-        input = self.inMemBatter["ControllerInput"]
+        input = self.inMemBatter.ControllerInput
 
-        isCharge = 1 if self.inMemBatter["Batter_Contact_SlapChargeBuntStar"] != SLAP else 0
-        self.inMemBatter["AtBat_InputDirection"] = PUSHPULL_NONE
-        if (self.inMemBatter["AtBat_Mystery_BatDirection"] == 0):
-            if (not input["Right"]):
-                if (input["Left"]):
-                    if (self.inMemBatter["AtBat_BatterHand"] == RIGHTY):
-                        self.inMemBatter["AtBat_InputDirection"] = PUSHPULL_PULL
+        isCharge = 1 if self.inMemBatter.Batter_Contact_SlapChargeBuntStar != SLAP else 0
+        self.inMemBatter.AtBat_InputDirection = PUSHPULL_NONE
+        if (self.inMemBatter.AtBat_Mystery_BatDirection == 0):
+            if (not input.Right):
+                if (input.Left):
+                    if (self.inMemBatter.AtBat_BatterHand == RIGHTY):
+                        self.inMemBatter.AtBat_InputDirection = PUSHPULL_PULL
 
                     else:
-                        self.inMemBatter["AtBat_InputDirection"] = PUSHPULL_PUSH
+                        self.inMemBatter.AtBat_InputDirection = PUSHPULL_PUSH
 
-            elif (self.inMemBatter["AtBat_BatterHand"] == RIGHTY):
-                self.inMemBatter["AtBat_InputDirection"] = PUSHPULL_PUSH
+            elif (self.inMemBatter.AtBat_BatterHand == RIGHTY):
+                self.inMemBatter.AtBat_InputDirection = PUSHPULL_PUSH
 
             else:
-                self.inMemBatter["AtBat_InputDirection"] = PUSHPULL_PULL
+                self.inMemBatter.AtBat_InputDirection = PUSHPULL_PULL
 
-        inputDirection = self.inMemBatter["AtBat_InputDirection"]
-        frameOfContact = self.inMemBatter["Frame_SwingContact1"]
+        inputDirection = self.inMemBatter.AtBat_InputDirection
+        frameOfContact = self.inMemBatter.Frame_SwingContact1
         iVar2 = BATTING_ANGLE_RANGES[inputDirection][isCharge][frameOfContact][0]
         iVar1 = BATTING_ANGLE_RANGES[inputDirection][isCharge][frameOfContact][1]
 
@@ -468,7 +577,7 @@ class BattingCalculator:
             iVar2 += self.StaticRandomInt1 - BattingCalculator.floor(self.StaticRandomInt1 / iVar1) * iVar1
 
         iVar2 += 0x400
-        if (self.inMemBatter["AtBat_BatterHand"] != RIGHTY):
+        if (self.inMemBatter.AtBat_BatterHand != RIGHTY):
             if (iVar2 < 0x801):
                 iVar2 = 0x800 - iVar2
 
@@ -477,26 +586,26 @@ class BattingCalculator:
 
         self.Hit_HorizontalAngle = BattingCalculator.AdjustBallAngle(iVar2)
 
-        if "override_horizontal_angle" in self.readValues:
-            self.Hit_HorizontalAngle = self.readValues["override_horizontal_angle"]
+        if self.request.override_horizontal_angle is not None:
+            self.Hit_HorizontalAngle = self.request.override_horizontal_angle
 
 
     def calculateVerticalAngle(self):
         iVar5 = 0
         upDown = 0
-        slapOrCharge = 0 if self.inMemBatter["Batter_Contact_SlapChargeBuntStar"] == 0 else 1
-        pInput = self.inMemBatter["ControllerInput"]
+        slapOrCharge = 0 if self.inMemBatter.Batter_Contact_SlapChargeBuntStar == 0 else 1
+        pInput = self.inMemBatter.ControllerInput
 
         handledVerticalZones = False
 
-        captainStarSwing = self.inMemBatter["AtBat_Mystery_CaptainStarSwing"]
+        captainStarSwing = self.inMemBatter.AtBat_Mystery_CaptainStarSwing
         if (captainStarSwing == 0):
-            if (self.inMemBatter["AtBat_MoonShot"] == False):
-                noncaptainStarSwing = self.inMemBatter["nonCaptainStarSwingContact"]
+            if (self.inMemBatter.AtBat_MoonShot == False):
+                noncaptainStarSwing = self.inMemBatter.nonCaptainStarSwingContact
                 if (noncaptainStarSwing == 0):
-                    if (self.inMemBatter["AtBat_Mystery_BatDirection"] == 0):
-                        if (not pInput["Up"]):
-                            if (pInput["Down"]):
+                    if (self.inMemBatter.AtBat_Mystery_BatDirection == 0):
+                        if (not pInput.Up):
+                            if (pInput.Down):
                                 # 2 == Down
                                 upDown = 2
 
@@ -504,15 +613,15 @@ class BattingCalculator:
                             # 1 == Up
                             upDown = 1
 
-                    pabVar4 = BATTING_VERTICAL_ANGLE_WEIGHTS[self.inMemBatter["AtBat_HitTrajectoryLow"]][slapOrCharge][self.inMemBatter["EasyBatting"]][self.inMemBatter["Batter_ContactType"]]
+                    pabVar4 = BATTING_VERTICAL_ANGLE_WEIGHTS[self.inMemBatter.AtBat_HitTrajectoryLow][slapOrCharge][self.inMemBatter.EasyBatting][self.inMemBatter.Batter_ContactType]
                     local_28 = pabVar4[0]
                     local_27 = pabVar4[1]
                     local_26 = pabVar4[2]
                     local_25 = pabVar4[3]
                     local_24 = pabVar4[4]
 
-                    uVar4 = UINT_ARRAY_ARRAY_807B7134[self.inMemBatter["Batter_HitType"]][3 - self.inMemBatter["EasyBatting"]]
-                    uVar6 = UINT_ARRAY_ARRAY_807B7134[self.inMemBatter["Batter_HitType"]][4]
+                    uVar4 = UINT_ARRAY_ARRAY_807B7134[self.inMemBatter.Batter_HitType][3 - self.inMemBatter.EasyBatting]
+                    uVar6 = UINT_ARRAY_ARRAY_807B7134[self.inMemBatter.Batter_HitType][4]
                     uVar5 = uVar4 & 0xf000000
                     if (uVar5 == 0):
                         uVar16 = uVar4 & 0xf
@@ -571,17 +680,17 @@ class BattingCalculator:
                             local_25 = 0
 
                     if (iVar5 == 0):
-                        weightedRandomIndex = self.WeightedRandomIndex([local_28, local_27, local_26, local_25, local_24], 5)
+                        weightedRandomIndex, self.StaticRandomInt1 = BattingCalculator.WeightedRandomIndex([local_28, local_27, local_26, local_25, local_24], 5, self.StaticRandomInt1, self.StaticRandomInt2, self.USHORT_8089269c)
 
-                        if "override_vertical_range" in self.readValues:
-                            weightedRandomIndex = self.readValues["override_vertical_range"]
+                        if self.request.override_vertical_range is not None:
+                            weightedRandomIndex = self.request.override_vertical_range
 
                         # Regular star swings
-                        lowerRange = SHORT_ARRAY_ARRAY_ARRAY_ARRAY_807B67CC[slapOrCharge][self.inMemBatter["Batter_ContactType"]][weightedRandomIndex][0]
-                        higherRange = SHORT_ARRAY_ARRAY_ARRAY_ARRAY_807B67CC[slapOrCharge][self.inMemBatter["Batter_ContactType"]][weightedRandomIndex][1]
+                        lowerRange = SHORT_ARRAY_ARRAY_ARRAY_ARRAY_807B67CC[slapOrCharge][self.inMemBatter.Batter_ContactType][weightedRandomIndex][0]
+                        higherRange = SHORT_ARRAY_ARRAY_ARRAY_ARRAY_807B67CC[slapOrCharge][self.inMemBatter.Batter_ContactType][weightedRandomIndex][1]
                         
                         self.Display_Output["Vertical Details"] = {
-                            "Zones" : SHORT_ARRAY_ARRAY_ARRAY_ARRAY_807B67CC[slapOrCharge][self.inMemBatter["Batter_ContactType"]],
+                            "Zones" : [list(zone) for zone in SHORT_ARRAY_ARRAY_ARRAY_ARRAY_807B67CC[slapOrCharge][self.inMemBatter.Batter_ContactType]],
                             "Weights": [local_28, local_27, local_26, local_25, local_24],
                             "Selected Zone": weightedRandomIndex
                         }
@@ -595,19 +704,19 @@ class BattingCalculator:
                 else:
                     # Non Captain Star Swings
                     lowerRange = NON_CAPTAIN_STAR_VERTICAL_ANGLES[
-                        noncaptainStarSwing - 1][self.inMemBatter["Batter_ContactType"]][0]
+                        noncaptainStarSwing - 1][self.inMemBatter.Batter_ContactType][0]
                     higherRange = NON_CAPTAIN_STAR_VERTICAL_ANGLES[
-                        noncaptainStarSwing - 1][self.inMemBatter["Batter_ContactType"]][1]
+                        noncaptainStarSwing - 1][self.inMemBatter.Batter_ContactType][1]
 
             else:
                 # Moonshot, also uses Charge Angles
-                lowerRange = SHORT_ARRAY_ARRAY_ARRAY_ARRAY_807B67CC[1][self.inMemBatter["Batter_ContactType"]][2][0]
-                higherRange = SHORT_ARRAY_ARRAY_ARRAY_ARRAY_807B67CC[1][self.inMemBatter["Batter_ContactType"]][2][1]
+                lowerRange = SHORT_ARRAY_ARRAY_ARRAY_ARRAY_807B67CC[1][self.inMemBatter.Batter_ContactType][2][0]
+                higherRange = SHORT_ARRAY_ARRAY_ARRAY_ARRAY_807B67CC[1][self.inMemBatter.Batter_ContactType][2][1]
 
         else:
             # Captain Star Swings
-            lowerRange = CAPTAIN_STAR_VERTICAL_ANGLES[captainStarSwing - 1][self.inMemBatter["Batter_ContactType"]][0]
-            higherRange = CAPTAIN_STAR_VERTICAL_ANGLES[captainStarSwing - 1][self.inMemBatter["Batter_ContactType"]][1]
+            lowerRange = CAPTAIN_STAR_VERTICAL_ANGLES[captainStarSwing - 1][self.inMemBatter.Batter_ContactType][0]
+            higherRange = CAPTAIN_STAR_VERTICAL_ANGLES[captainStarSwing - 1][self.inMemBatter.Batter_ContactType][1]
 
         if (not handledVerticalZones):
             self.Display_Output["Vertical Details"] = {
@@ -623,8 +732,8 @@ class BattingCalculator:
 
         self.Hit_VerticalAngle = sVar3
 
-        if "override_vertical_angle" in self.readValues:
-            self.Hit_VerticalAngle = self.readValues["override_vertical_angle"]
+        if self.request.override_vertical_angle is not None:
+            self.Hit_VerticalAngle = self.request.override_vertical_angle
 
         if (self.Hit_VerticalAngle < 0x401):
             if (self.Hit_VerticalAngle < -0x400):
@@ -641,72 +750,72 @@ class BattingCalculator:
 
     def calculateHitPower(self):
         uVar2 = 0
-        niceSour = self.inMemBatter["Batter_ContactType"]
-        charged = self.inMemBatter["BatterAtPlate_BatterCharge_Up"]
+        niceSour = self.inMemBatter.Batter_ContactType
+        charged = self.inMemBatter.BatterAtPlate_BatterCharge_Up
 
         # Regular contact array
-        contactArray = BALL_HIT_ARRAY[self.inMemBatter["Batter_Contact_SlapChargeBuntStar"]][niceSour]
+        contactArray = BALL_HIT_ARRAY[self.inMemBatter.Batter_Contact_SlapChargeBuntStar][niceSour]
 
-        if (self.inMemBatter["AtBat_Mystery_CaptainStarSwing"] == 0):
-            if (self.inMemBatter["nonCaptainStarSwingContact"] != 0):
+        if (self.inMemBatter.AtBat_Mystery_CaptainStarSwing == 0):
+            if (self.inMemBatter.nonCaptainStarSwingContact != 0):
                 charged = 0.0
                 # NonCaptainStarSwing array
-                contactArray = STAR_SWING_EXIT_VELOCITY_ARRAY[self.inMemBatter["nonCaptainStarSwingContact"] - 1][niceSour]
+                contactArray = STAR_SWING_EXIT_VELOCITY_ARRAY[self.inMemBatter.nonCaptainStarSwingContact - 1][niceSour]
 
         else:
             charged = 0.0
             # CaptainStarSwingArray
-            contactArray = CAPTAIN_STAR_SWING_EXIT_VELOCITY_ARRAY[self.inMemBatter["AtBat_Mystery_CaptainStarSwing"] - 1][niceSour]
+            contactArray = CAPTAIN_STAR_SWING_EXIT_VELOCITY_ARRAY[self.inMemBatter.AtBat_Mystery_CaptainStarSwing - 1][niceSour]
 
-        if (self.inMemBatter["AtBat_Mystery_DidPopFlyOrGrounderConnect"] != False):
-            self.inMemBatter["BatterAtPlate_BatterCharge_Down"] = 1.0
+        if (self.inMemBatter.AtBat_Mystery_DidPopFlyOrGrounderConnect != False):
+            self.inMemBatter.BatterAtPlate_BatterCharge_Down = 1.0
 
-        if (self.inMemBatter["AtBat_MoonShot"]):
+        if (self.inMemBatter.AtBat_MoonShot):
             # Moonshot array
-            contactArray = BALL_HIT_ARRAY[1][self.inMemBatter["Batter_ContactType"]]
+            contactArray = BALL_HIT_ARRAY[1][self.inMemBatter.Batter_ContactType]
 
         # Low value
         arrayV1 = contactArray[0]
         # High Value
         arrayV2 = contactArray[1]
         # 0x44 is a range 0-1 towards the better contact
-        calcedDistance = self.inMemBatter["ContactQuality"] * (arrayV2 - arrayV1) + arrayV1
+        calcedDistance = self.inMemBatter.ContactQuality * (arrayV2 - arrayV1) + arrayV1
         # Non star swing
-        if (self.inMemBatter["AtBat_Mystery_CaptainStarSwing"] == 0):
+        if (self.inMemBatter.AtBat_Mystery_CaptainStarSwing == 0):
             if (charged <= 0.0):
                 # If not charged, use slap hit power
-                power = self.inMemBatter["Batter_SlapHitPower"]
+                power = self.inMemBatter.Batter_SlapHitPower
 
             else:
                 # use charge power
-                power = (self.inMemBatter["BatterAtPlate_ChargePower"] - (self.inMemBatter["BatterAtPlate_ChargePower"] - self.inMemBatter["Batter_SlapHitPower"]) * 0.5 * (1.0 - self.inMemBatter["BatterAtPlate_BatterCharge_Down"]))
+                power = (self.inMemBatter.BatterAtPlate_ChargePower - (self.inMemBatter.BatterAtPlate_ChargePower - self.inMemBatter.Batter_SlapHitPower) * 0.5 * (1.0 - self.inMemBatter.BatterAtPlate_BatterCharge_Down))
 
         else:
             # if star swing, power is always 100
             power = 100.0
 
-        if ((self.inMemBatter["AtBat_Mystery_CaptainStarSwing"] == 0) and (self.inMemBatter["nonCaptainStarSwingContact"] == 0)):
+        if ((self.inMemBatter.AtBat_Mystery_CaptainStarSwing == 0) and (self.inMemBatter.nonCaptainStarSwingContact == 0)):
             perfectNiceSour = 2
-            if ((self.inMemBatter["Batter_ContactType"] == LEFT_NICE) or (self.inMemBatter["Batter_ContactType"] == RIGHT_NICE)):
+            if ((self.inMemBatter.Batter_ContactType == LEFT_NICE) or (self.inMemBatter.Batter_ContactType == RIGHT_NICE)):
                 perfectNiceSour = 1
 
-            elif (self.inMemBatter["Batter_ContactType"] == PERFECT):
+            elif (self.inMemBatter.Batter_ContactType == PERFECT):
                 perfectNiceSour = 0
 
-            dVar3 = BattingCalculator.LinearInterpolateToNewRange(self.inMemPitcher["calced_cursedBall"], 0.0, 100.0,
+            dVar3 = BattingCalculator.LinearInterpolateToNewRange(self.inMemPitcher.calced_cursedBall, 0.0, 100.0,
                                                 CURSED_BALL_DEBUFF_ARRAY[perfectNiceSour][0], CURSED_BALL_DEBUFF_ARRAY[perfectNiceSour][1])
             power = (power * dVar3)
 
-        if ((self.inMemBatter["RandomBattingFactors_ChemLinksOnBase"] != 0) and (0.0 < charged)):
+        if ((self.inMemBatter.RandomBattingFactors_ChemLinksOnBase != 0) and (0.0 < charged)):
             # If charging, add a multiplier for chem on base
             power = (
-                power * POWER_CHEM_LINK_MULTIPLIERS[self.inMemBatter["RandomBattingFactors_ChemLinksOnBase"]])
+                power * POWER_CHEM_LINK_MULTIPLIERS[self.inMemBatter.RandomBattingFactors_ChemLinksOnBase])
 
-        if (-1 < self.inMemBatter["Batter_HitType"]):
+        if (-1 < self.inMemBatter.Batter_HitType):
             power = (
-                power * UINT_ARRAY_ARRAY_807B7134[self.inMemBatter["Batter_HitType"]][1 - self.inMemBatter["EasyBatting"]]) / 100.0
+                power * UINT_ARRAY_ARRAY_807B7134[self.inMemBatter.Batter_HitType][1 - self.inMemBatter.EasyBatting]) / 100.0
 
-        fVar1 = (calcedDistance * ((power / 100.0) * (1.0 - 0.8) + 0.8))
+        self.Hit_BasePower = (calcedDistance * ((power / 100.0) * (1.0 - 0.8) + 0.8))
 
         self.AddedContactGravity = 0.00001 * contactArray[2]
 
@@ -716,7 +825,13 @@ class BattingCalculator:
             "AddedGravity" : contactArray[2],
         }
 
-        if (self.inMemBatter["AtBat_Mystery_CaptainStarSwing"] == 0):
+
+    def calculateFieldBonus(self):
+        # split from calculateHitPower, the vertical angle can turn the ball around and change the field area
+        fVar1 = self.Hit_BasePower
+        self.Display_Output["PowerDetails"] = dict(self.Display_Output["PowerDetails"])
+
+        if (self.inMemBatter.AtBat_Mystery_CaptainStarSwing == 0):
             ballAngle = self.Hit_HorizontalAngle
             if (ballAngle < 0x200):
                 niceSour = 0
@@ -727,7 +842,7 @@ class BattingCalculator:
             else:
                 niceSour = 0x400
 
-            if (self.inMemBatter["AtBat_BatterHand"] != RIGHTY):
+            if (self.inMemBatter.AtBat_BatterHand != RIGHTY):
                 niceSour = 0x400 - niceSour
 
             if (niceSour < 0x100):
@@ -746,12 +861,12 @@ class BattingCalculator:
                 niceSour -= 0x300
             
             fieldAreaBonus = BattingCalculator.LinearInterpolateToNewRange(
-                (niceSour / 256), 0.0, 1.0, FIELD_TRAJECTORY_BONUSES[self.inMemBatter["BatterAtPlate_TrajectoryNearFar"]][iVar1], FIELD_TRAJECTORY_BONUSES[self.inMemBatter["BatterAtPlate_TrajectoryNearFar"]][iVar1 + 1])
+                (niceSour / 256), 0.0, 1.0, FIELD_TRAJECTORY_BONUSES[self.inMemBatter.BatterAtPlate_TrajectoryNearFar][iVar1], FIELD_TRAJECTORY_BONUSES[self.inMemBatter.BatterAtPlate_TrajectoryNearFar][iVar1 + 1])
             self.Display_Output["PowerDetails"]["FieldBonus"] = fieldAreaBonus
             fVar1 = (fVar1 * fieldAreaBonus)
         else:
             self.Display_Output["PowerDetails"]["FieldBonus"] = 0.0
-        if (self.inMemBatter["AtBat_MoonShot"]):
+        if (self.inMemBatter.AtBat_MoonShot):
             fVar1 = (fVar1 * MOONSHOT_MULTIPLIER)
 
         self.Hit_HorizontalPower = BattingCalculator.floor(fVar1)
@@ -763,119 +878,115 @@ class BattingCalculator:
 
     def parseValues(self):
         self.Display_Output = {}
-        self.inMemBall = {}
-        self.inMemPitcher = {}
-        self.inMemPitcher["calced_cursedBall"] = STATS[self.readValues["pitcher_id"]]["Cursed Ball"]
-        pitcherChargeVal = self.readValues["pitcherChargeVal"]
+        self.inMemBall = BallState()
+        self.inMemPitcher = PitcherState()
+        self.inMemPitcher.calced_cursedBall = STATS[self.request.pitcher_id]["Cursed Ball"]
+        pitcherChargeVal = self.request.pitch_type
         if (pitcherChargeVal == 0):
-            self.inMemPitcher["Pitcher_TypeOfPitch"] = PITCHCURVE
-            self.inMemPitcher["ChargePitchType"] = PITCHCHARGETYPE_NONE
+            self.inMemPitcher.Pitcher_TypeOfPitch = PITCHCURVE
+            self.inMemPitcher.ChargePitchType = PITCHCHARGETYPE_NONE
 
         elif (pitcherChargeVal == 1):
-            self.inMemPitcher["Pitcher_TypeOfPitch"] = PITCHCHARGE
-            self.inMemPitcher["ChargePitchType"] = PITCHCHARGETYPE_CHARGE
+            self.inMemPitcher.Pitcher_TypeOfPitch = PITCHCHARGE
+            self.inMemPitcher.ChargePitchType = PITCHCHARGETYPE_CHARGE
 
         elif (pitcherChargeVal == 2):
-            self.inMemPitcher["Pitcher_TypeOfPitch"] = PITCHCHARGE
-            self.inMemPitcher["ChargePitchType"] = PITCHCHARGETYPE_PERFECT
+            self.inMemPitcher.Pitcher_TypeOfPitch = PITCHCHARGE
+            self.inMemPitcher.ChargePitchType = PITCHCHARGETYPE_PERFECT
 
         elif (pitcherChargeVal == 3):
-            self.inMemPitcher["Pitcher_TypeOfPitch"] = PITCHCHANGEUP
-            self.inMemPitcher["ChargePitchType"] = PITCHCHARGETYPE_NONE
+            self.inMemPitcher.Pitcher_TypeOfPitch = PITCHCHANGEUP
+            self.inMemPitcher.ChargePitchType = PITCHCHARGETYPE_NONE
 
         self.StaticRandomInt1 = None
         self.StaticRandomInt2 = None
         self.USHORT_8089269c = None
 
-        if (self.readValues["StaticRandomInt1"] != None):
-            self.StaticRandomInt1 = self.readValues["StaticRandomInt1"]
+        if (self.request.rand_1 != None):
+            self.StaticRandomInt1 = self.request.rand_1
         else:
             self.StaticRandomInt1 = BattingCalculator.floor(random() * 2 ** 15)
 
-        if (self.readValues["StaticRandomInt2"] != None):
-            self.StaticRandomInt2 = self.readValues["StaticRandomInt2"]
+        if (self.request.rand_2 != None):
+            self.StaticRandomInt2 = self.request.rand_2
         else:
             self.StaticRandomInt2 = BattingCalculator.floor(random() * 2 ** 15)
 
-        if (self.readValues["USHORT_8089269c"] != None):
-            self.USHORT_8089269c = self.readValues["USHORT_8089269c"]
+        if (self.request.rand_3 != None):
+            self.USHORT_8089269c = self.request.rand_3
         else:
             self.USHORT_8089269c = BattingCalculator.floor(random() * 2 ** 15)
 
-        self.inMemBatter = {}
-        id = self.readValues["batter_id"]
+        self.inMemBatter = BatterState()
+        id = self.request.batter_id
 
-        self.inMemBatter["Batter_CharID"] = id
-        self.inMemBatter["IsCaptain"] = self.readValues["IsCaptain"]
-        self.inMemBatter["Name"] = STATS[id]["Name"]
-        self.inMemBatter["AtBat_Mystery_BatDirection"] = 0
-        self.inMemBatter["AtBat_TrimmedBat"] = 0 if BATTER_HITBOXES[id]["TrimmedBat"] == 0.0 else 1
+        self.inMemBatter.Batter_CharID = id
+        self.inMemBatter.IsCaptain = self.request.is_batter_captain
+        self.inMemBatter.Name = STATS[id]["Name"]
+        self.inMemBatter.AtBat_Mystery_BatDirection = 0
+        self.inMemBatter.AtBat_TrimmedBat = 0 if BATTER_HITBOXES[id]["TrimmedBat"] == 0.0 else 1
 
-        self.inMemBatter["ballContact_X"] = self.readValues["ballContact_X"]
-        self.inMemBatter["ballContact_Z"] = self.readValues["ballContact_Z"]
-        self.inMemBatter["posX"] = self.readValues["posX"]
+        self.inMemBatter.ballContact_X = self.request.ball_x
+        # hit_ball has always passed ball_x as the contact z
+        self.inMemBatter.ballContact_Z = self.request.ball_x
+        self.inMemBatter.posX = self.request.batter_x
 
-        self.inMemBatter["AtBat_BatterHand"] = self.readValues["AtBat_BatterHand"]
+        self.inMemBatter.AtBat_BatterHand = self.request.handedness
 
-        self.inMemBatter["Batter_Contact_SlapChargeBuntStar"] = self.readValues["Batter_Contact_SlapChargeBuntStar"]
-        self.inMemBatter["Batter_IsBunting"] = self.inMemBatter["Batter_Contact_SlapChargeBuntStar"] == BUNT
+        self.inMemBatter.Batter_Contact_SlapChargeBuntStar = self.request.hit_type
+        self.inMemBatter.Batter_IsBunting = self.inMemBatter.Batter_Contact_SlapChargeBuntStar == BUNT
 
-        self.inMemBatter["BatterAtPlate_BatterCharge_Up"] = self.readValues["chargeUp"]
-        self.inMemBatter["BatterAtPlate_BatterCharge_Down"] = self.readValues["chargeDown"]
-        self.inMemBatter["AtBat_IsFullyCharged"] = self.inMemBatter["BatterAtPlate_BatterCharge_Up"] == 1.0
+        self.inMemBatter.BatterAtPlate_BatterCharge_Up = self.request.charge_up
+        self.inMemBatter.BatterAtPlate_BatterCharge_Down = self.request.charge_down
+        self.inMemBatter.AtBat_IsFullyCharged = self.inMemBatter.BatterAtPlate_BatterCharge_Up == 1.0
 
-        self.inMemBatter["Batter_SlapHitPower"] = STATS[id]["Slap Hit Power"]
-        self.inMemBatter["BatterAtPlate_ChargePower"] = STATS[id]["Charge Hit Power"]
+        self.inMemBatter.Batter_SlapHitPower = STATS[id]["Slap Hit Power"]
+        self.inMemBatter.BatterAtPlate_ChargePower = STATS[id]["Charge Hit Power"]
 
-        self.inMemBatter["Batter_SlapContactSize"] = STATS[id]["Slap Contact Spot Size"]
-        self.inMemBatter["Batter_ChargeContactSize"] = STATS[id]["Charge Contact Spot Size"]
-        self.inMemBatter["Batter_Bunting"] = STATS[id]["Bunting"]
+        self.inMemBatter.Batter_SlapContactSize = STATS[id]["Slap Contact Spot Size"]
+        self.inMemBatter.Batter_ChargeContactSize = STATS[id]["Charge Contact Spot Size"]
+        self.inMemBatter.Batter_Bunting = STATS[id]["Bunting"]
 
-        self.inMemBatter["BatterAtPlate_TrajectoryNearFar"] = STATS[id]["Horizontal Hit Trajectory"]
-        self.inMemBatter["AtBat_HitTrajectoryLow"] = STATS[id]["Vertical Hit Trajectory"]
+        self.inMemBatter.BatterAtPlate_TrajectoryNearFar = STATS[id]["Horizontal Hit Trajectory"]
+        self.inMemBatter.AtBat_HitTrajectoryLow = STATS[id]["Vertical Hit Trajectory"]
 
-        self.inMemBatter["RandomBattingFactors_ChemLinksOnBase"] = self.readValues["RandomBattingFactors_ChemLinksOnBase"]
-        self.inMemBatter["Frame_SwingContact1"] = self.readValues["frameOfContact"]
+        self.inMemBatter.RandomBattingFactors_ChemLinksOnBase = self.request.chem
+        self.inMemBatter.Frame_SwingContact1 = self.request.frame
 
-        self.inMemBatter["EasyBatting"] = self.readValues["EasyBatting"]
-        self.inMemBatter["isStar"] = self.readValues["isStar"]
+        self.inMemBatter.EasyBatting = self.request.easy_batting
+        self.inMemBatter.isStar = self.request.is_star_hit
 
-        self.inMemBatter["AtBat_MoonShot"] = False
+        self.inMemBatter.AtBat_MoonShot = False
 
-        self.inMemBatter["ControllerInput"] = {
-            "Up": self.readValues["Up"],
-            "Down": self.readValues["Down"],
-            "Left": self.readValues["Left"],
-            "Right": self.readValues["Right"]
-        }
+        self.inMemBatter.ControllerInput = ControllerInput(self.request.stick_up, self.request.stick_down, self.request.stick_left, self.request.stick_right)
 
-        self.inMemBatter["AtBat_CaptainStarHitPitch"] = STATS[id]["Captain Star Hit/Pitch"]
-        self.inMemBatter["AtBat_NonCaptainStarSwing"] = STATS[id]["Non Captain Star Swing"]
+        self.inMemBatter.AtBat_CaptainStarHitPitch = STATS[id]["Captain Star Hit/Pitch"]
+        self.inMemBatter.AtBat_NonCaptainStarSwing = STATS[id]["Non Captain Star Swing"]
 
-        self.inMemBatter["nonCaptainStarSwingContact"] = 0
-        self.inMemBatter["nonCaptainStarSwingContact"] = 0
-        self.inMemBatter["AtBat_Mystery_CaptainStarSwing"] = 0
-        self.inMemBatter["AtBat_Mystery_DidPopFlyOrGrounderConnect"] = False
+        self.inMemBatter.nonCaptainStarSwingContact = 0
+        self.inMemBatter.nonCaptainStarSwingContact = 0
+        self.inMemBatter.AtBat_Mystery_CaptainStarSwing = 0
+        self.inMemBatter.AtBat_Mystery_DidPopFlyOrGrounderConnect = False
 
-        self.inMemBatter["Stars"] = self.readValues["numStars"]
+        self.inMemBatter.Stars = self.request.num_stars
 
-        if(self.readValues["is_starred"]):
-            self.inMemBatter["Batter_SlapContactSize"] = min(self.inMemBatter["Batter_SlapContactSize"]+ 50, 100)
-            self.inMemBatter["Batter_ChargeContactSize"] = min(self.inMemBatter["Batter_ChargeContactSize"]+ 50, 100)
+        if(self.request.is_starred):
+            self.inMemBatter.Batter_SlapContactSize = min(self.inMemBatter.Batter_SlapContactSize+ 50, 100)
+            self.inMemBatter.Batter_ChargeContactSize = min(self.inMemBatter.Batter_ChargeContactSize+ 50, 100)
 
-            self.inMemBatter["Batter_SlapHitPower"] = min(self.inMemBatter["Batter_SlapHitPower"]+ 50, 100)
-            self.inMemBatter["BatterAtPlate_ChargePower"] = min(self.inMemBatter["BatterAtPlate_ChargePower"]+ 50, 100)
-            self.inMemBatter["Batter_Bunting"] = min(self.inMemBatter["Batter_Bunting"]+ 50, 100)
+            self.inMemBatter.Batter_SlapHitPower = min(self.inMemBatter.Batter_SlapHitPower+ 50, 100)
+            self.inMemBatter.BatterAtPlate_ChargePower = min(self.inMemBatter.BatterAtPlate_ChargePower+ 50, 100)
+            self.inMemBatter.Batter_Bunting = min(self.inMemBatter.Batter_Bunting+ 50, 100)
 
-            self.inMemPitcher["calced_cursedBall"] = min(self.inMemPitcher["calced_cursedBall"]+ 50, 100)
+            self.inMemPitcher.calced_cursedBall = min(self.inMemPitcher.calced_cursedBall+ 50, 100)
 
 
     def hitBall(self):
-        fVar1 = self.inMemBatter["ballContact_X"]
+        fVar1 = self.inMemBatter.ballContact_X
 
-        if (BATTING_REACHES[self.inMemBatter["AtBat_TrimmedBat"]][0] <= fVar1 - self.inMemBatter["posX"]):
-            if (fVar1 - self.inMemBatter["posX"] <= BATTING_REACHES[self.inMemBatter["AtBat_TrimmedBat"]][1]):
-                self.inMemBatter["interstitialBallContact_X"] = fVar1
+        if (BATTING_REACHES[self.inMemBatter.AtBat_TrimmedBat][0] <= fVar1 - self.inMemBatter.posX):
+            if (fVar1 - self.inMemBatter.posX <= BATTING_REACHES[self.inMemBatter.AtBat_TrimmedBat][1]):
+                self.inMemBatter.interstitialBallContact_X = fVar1
                 return True
 
         return False
@@ -896,8 +1007,8 @@ class BattingCalculator:
 
 
     def convertPowerToVelocity(self):
-        self.inMemBall["ballVelocity"] = {"X": 0, "Y": 0, "Z": 0}
-        self.inMemBall["ballAcceleration"] = {"X": 0, "Y": 0, "Z": 0}
+        self.inMemBall.ballVelocity = {"X": 0, "Y": 0, "Z": 0}
+        self.inMemBall.ballAcceleration = {"X": 0, "Y": 0, "Z": 0}
 
         half_power = self.Hit_HorizontalPower * 0.5
 
@@ -915,27 +1026,27 @@ class BattingCalculator:
         x_groundVelocity = c_horizontalAngle * half_power_x_cos_vert_angle
         z_groundVelocity = s_horizontalAngle * half_power_x_cos_vert_angle
 
-        self.inMemBall["ballVelocity"]["X"] = x_groundVelocity / 100.0
-        self.inMemBall["ballVelocity"]["Y"] = (half_power * s_verticalAngle) / 100.0
-        self.inMemBall["ballVelocity"]["Z"] = z_groundVelocity / 100.0
+        self.inMemBall.ballVelocity["X"] = x_groundVelocity / 100.0
+        self.inMemBall.ballVelocity["Y"] = (half_power * s_verticalAngle) / 100.0
+        self.inMemBall.ballVelocity["Z"] = z_groundVelocity / 100.0
 
-        self.inMemBall["ballAcceleration"]["X"] = 0.0
-        self.inMemBall["ballAcceleration"]["Y"] = self.AddedContactGravity
-        self.inMemBall["ballAcceleration"]["Z"] = 0.0
+        self.inMemBall.ballAcceleration["X"] = 0.0
+        self.inMemBall.ballAcceleration["Y"] = self.AddedContactGravity
+        self.inMemBall.ballAcceleration["Z"] = 0.0
 
-        if ((self.inMemBatter["Batter_IsBunting"] == False) and (self.Hit_HorizontalAngle < 0x901 or 0xeff < self.Hit_HorizontalAngle)):
+        if ((self.inMemBatter.Batter_IsBunting == False) and (self.Hit_HorizontalAngle < 0x901 or 0xeff < self.Hit_HorizontalAngle)):
             # has Super Curve
-            hasSuperCurve = 1 if self.inMemBatter["Batter_CharID"] in [
+            hasSuperCurve = 1 if self.inMemBatter.Batter_CharID in [
                 0xe, 0x35, 0x25] else 0
 
             # non-captain star swing 3 has super curve
-            if (self.inMemBatter["nonCaptainStarSwingContact"] == 3):
+            if (self.inMemBatter.nonCaptainStarSwingContact == 3):
                 hasSuperCurve = 1
 
             # if contact above 100, flip it
-            contact = self.inMemBatter["CalculatedBallPos"]
-            if (100.0 < self.inMemBatter["CalculatedBallPos"]):
-                contact = 200.0 - self.inMemBatter["CalculatedBallPos"]
+            contact = self.inMemBatter.CalculatedBallPos
+            if (100.0 < self.inMemBatter.CalculatedBallPos):
+                contact = 200.0 - self.inMemBatter.CalculatedBallPos
 
             vAngle = self.Hit_VerticalAngle
             fVar1 = (1.0 - (1.0 - contact * 0.01) *
@@ -958,7 +1069,7 @@ class BattingCalculator:
             else:
                 hAngle = 0x100
 
-            if (self.inMemBatter["AtBat_BatterHand"] != RIGHTY):
+            if (self.inMemBatter.AtBat_BatterHand != RIGHTY):
                 hAngle = 0x800 - hAngle
 
             if (hAngle < 0x460):
@@ -979,123 +1090,124 @@ class BattingCalculator:
                 x_groundVelocity = -s_horizontalAngle
 
             # finalize acceleration
-            self.inMemBall["ballAcceleration"]["Z"] = (
+            self.inMemBall.ballAcceleration["Z"] = (
                 z_groundVelocity * contact) * FLOAT_ARRAY_ARRAY_807B72BC[hasSuperCurve][2]
-            self.inMemBall["ballAcceleration"]["X"] = (
+            self.inMemBall.ballAcceleration["X"] = (
                 x_groundVelocity * contact) * FLOAT_ARRAY_ARRAY_807B72BC[hasSuperCurve][1]
 
             # if z is backwards, flip it
-            if (0.0 < self.inMemBall["ballAcceleration"]["Z"]):
-                self.inMemBall["ballAcceleration"]["Z"] = -self.inMemBall["ballAcceleration"]["Z"]
+            if (0.0 < self.inMemBall.ballAcceleration["Z"]):
+                self.inMemBall.ballAcceleration["Z"] = -self.inMemBall.ballAcceleration["Z"]
 
             # if batting lefty, flip it
-            if (self.inMemBatter["AtBat_BatterHand"] != RIGHTY):
-                self.inMemBall["ballAcceleration"]["X"] = -self.inMemBall["ballAcceleration"]["X"]
+            if (self.inMemBatter.AtBat_BatterHand != RIGHTY):
+                self.inMemBall.ballAcceleration["X"] = -self.inMemBall.ballAcceleration["X"]
         
         self.Display_Output["BallDetails"] = { 
             "HorizontalAngle":self.Hit_HorizontalAngle,
             "VerticalAngle":self.Hit_VerticalAngle,
             "Power":self.Hit_HorizontalPower,
 
-            "Velocity":self.inMemBall["ballVelocity"],
-            "Acceleration":self.inMemBall["ballAcceleration"],
+            "Velocity":self.inMemBall.ballVelocity,
+            "Acceleration":self.inMemBall.ballAcceleration,
         }
 
     def calculateHitGround(self):
-        p = {"X": self.inMemBatter["ballContact_X"], "Y": BATTER_HITBOXES[self.inMemBatter["Batter_CharID"]]["PitchingHeight"], "Z": self.inMemBatter["ballContact_Z"]}
-        if self.inMemBatter["AtBat_BatterHand"] != RIGHTY:
+        p = {"X": self.inMemBatter.ballContact_X, "Y": BATTER_HITBOXES[self.inMemBatter.Batter_CharID]["PitchingHeight"], "Z": self.inMemBatter.ballContact_Z}
+        if self.inMemBatter.AtBat_BatterHand != RIGHTY:
             p["X"] = -p["X"]
 
-        CalculatedPoints = []
-
-        v = {k: v for k, v in self.inMemBall["ballVelocity"].items()}
-        a = {k: v for k, v in self.inMemBall["ballAcceleration"].items()}
+        v = self.inMemBall.ballVelocity
+        a = self.inMemBall.ballAcceleration
 
-        airResistance = 0.996
-        gravity = 0.00275
+        flight = Flight((p["X"], p["Y"], p["Z"]), (v["X"], v["Y"], v["Z"]), (a["X"], a["Y"], a["Z"]))
+        frames = flight.landing_frame()
+        if frames is None:
+            raise ValueError("the ball never comes down")
 
-        while (p["Y"] > 0):
-            CalculatedPoints.append({k: v for k, v in p.items()})
+        # a ball that starts on the ground (0 frames) lands where it is
+        hitGround = dict(zip("XYZ", flight.position(max(frames - 1, 0))))
 
-            p["X"] = p["X"] + v["X"]
-            p["Y"] = p["Y"] + v["Y"]
-            p["Z"] = p["Z"] + v["Z"]
-
-            v["X"] = v["X"] * airResistance + a["X"]
-            v["Y"] = (v["Y"] - gravity) * airResistance + a["Y"]
-            v["Z"] = v["Z"] * airResistance + a["Z"]
-        
         self.Display_Output["FlightDetails"] = {
-            "Frames": len(CalculatedPoints), 
-            "HitGround": CalculatedPoints[-1], 
-            "Distance": math.sqrt(CalculatedPoints[-1]["X"] ** 2 + CalculatedPoints[-1]["Z"] ** 2),
-            "Path": CalculatedPoints
+            "Frames": frames, 
+            "HitGround": hitGround, 
+            "Distance": math.sqrt(hitGround["X"] ** 2 + hitGround["Z"] ** 2),
         } 
-        # print(CalculatedPoints)
 
+        if self.includePath:
+            self.Display_Output["FlightDetails"]["Path"] = [dict(zip("XYZ", point)) for point in flight.path(max(frames, 1)).tolist()]
 
-    def calculateValues(self):
+
+    def calculateSharedStages(self):
+        # everything up to the vertical angle, none of it depends on the vertical zone
         if(not self.hitBall()):
             self.Display_Output["err"] = "The ball would not hit the bat with these values"
-            return
+            return False
 
-        starsForBatter = self.inMemBatter["Stars"]
-        if (self.inMemBatter["isStar"]):
-            if (self.inMemBatter["Batter_IsBunting"] == False):
+        starsForBatter = self.inMemBatter.Stars
+        if (self.inMemBatter.isStar):
+            if (self.inMemBatter.Batter_IsBunting == False):
                 if (starsForBatter != 0):
-                    if ((self.inMemBatter["AtBat_IsFullyCharged"] == False) or (starsForBatter < 5)):
-                        if (self.inMemBatter["AtBat_CaptainStarHitPitch"] == 0):
-                            if ((starsForBatter < 1) or (self.inMemBatter["AtBat_NonCaptainStarSwing"] == 0)):
-                                self.inMemBatter["isStar"] = False
+                    if ((self.inMemBatter.AtBat_IsFullyCharged == False) or (starsForBatter < 5)):
+                        if (self.inMemBatter.AtBat_CaptainStarHitPitch == 0):
+                            if ((starsForBatter < 1) or (self.inMemBatter.AtBat_NonCaptainStarSwing == 0)):
+                                self.inMemBatter.isStar = False
 
                             else:
-                                self.inMemBatter["nonCaptainStarSwingContact"] = self.inMemBatter["AtBat_NonCaptainStarSwing"]
-                                if (self.inMemBatter["AtBat_NonCaptainStarSwing"] == 2):
-                                    self.inMemBatter["Batter_Contact_SlapChargeBuntStar"] = CHARGE
-                                    self.inMemBatter["AtBat_Mystery_DidPopFlyOrGrounderConnect"] = True
-                                    self.inMemBatter["BatterAtPlate_BatterCharge_Up"] = 1.0
-
-                                elif (self.inMemBatter["AtBat_NonCaptainStarSwing"] < 2):
-                                    if (self.inMemBatter["AtBat_NonCaptainStarSwing"] != 0):
-                                        self.inMemBatter["Batter_Contact_SlapChargeBuntStar"] = CHARGE
-                                        self.inMemBatter["AtBat_Mystery_DidPopFlyOrGrounderConnect"] = True
-                                        self.inMemBatter["BatterAtPlate_BatterCharge_Up"] = 1.0
-
-                                elif (self.inMemBatter["AtBat_NonCaptainStarSwing"] < 4):
-                                    self.inMemBatter["Batter_Contact_SlapChargeBuntStar"] = SLAP
-
-                        elif (self.inMemBatter["IsCaptain"]):
+                                self.inMemBatter.nonCaptainStarSwingContact = self.inMemBatter.AtBat_NonCaptainStarSwing
+                                if (self.inMemBatter.AtBat_NonCaptainStarSwing == 2):
+                                    self.inMemBatter.Batter_Contact_SlapChargeBuntStar = CHARGE
+                                    self.inMemBatter.AtBat_Mystery_DidPopFlyOrGrounderConnect = True
+                                    self.inMemBatter.BatterAtPlate_BatterCharge_Up = 1.0
+
+                                elif (self.inMemBatter.AtBat_NonCaptainStarSwing < 2):
+                                    if (self.inMemBatter.AtBat_NonCaptainStarSwing != 0):
+                                        self.inMemBatter.Batter_Contact_SlapChargeBuntStar = CHARGE
+                                        self.inMemBatter.AtBat_Mystery_DidPopFlyOrGrounderConnect = True
+                                        self.inMemBatter.BatterAtPlate_BatterCharge_Up = 1.0
+
+                                elif (self.inMemBatter.AtBat_NonCaptainStarSwing < 4):
+                                    self.inMemBatter.Batter_Contact_SlapChargeBuntStar = SLAP
+
+                        elif (self.inMemBatter.IsCaptain):
                             if (starsForBatter < 1):
-                                self.inMemBatter["isStar"] = False
+                                self.inMemBatter.isStar = False
 
                             else:
-                                self.inMemBatter["Batter_Contact_SlapChargeBuntStar"] = STAR
+                                self.inMemBatter.Batter_Contact_SlapChargeBuntStar = STAR
 
                         elif (starsForBatter < 2):
-                            self.inMemBatter["isStar"] = False
+                            self.inMemBatter.isStar = False
 
                         else:
-                            self.inMemBatter["Batter_Contact_SlapChargeBuntStar"] = STAR
+                            self.inMemBatter.Batter_Contact_SlapChargeBuntStar = STAR
 
                     else:
-                        self.inMemBatter["Batter_Contact_SlapChargeBuntStar"] = STAR
-                        self.inMemBatter["AtBat_MoonShot"] = True
+                        self.inMemBatter.Batter_Contact_SlapChargeBuntStar = STAR
+                        self.inMemBatter.AtBat_MoonShot = True
 
-                    if ((self.inMemBatter["Batter_Contact_SlapChargeBuntStar"] == STAR) or (self.inMemBatter["AtBat_Mystery_DidPopFlyOrGrounderConnect"] != False)):
-                        self.inMemBatter["AtBat_Mystery7"] = 0
-                        self.inMemBatter["AtBat_Mystery_CaptainStarSwing"] = self.inMemBatter["AtBat_CaptainStarHitPitch"]
+                    if ((self.inMemBatter.Batter_Contact_SlapChargeBuntStar == STAR) or (self.inMemBatter.AtBat_Mystery_DidPopFlyOrGrounderConnect != False)):
+                        self.inMemBatter.AtBat_Mystery7 = 0
+                        self.inMemBatter.AtBat_Mystery_CaptainStarSwing = self.inMemBatter.AtBat_CaptainStarHitPitch
 
             else:
-                self.inMemBatter["Batter_Contact_SlapChargeBuntStar"] = BUNT
-                self.inMemBatter["AtBat_MoonShot"] = False
+                self.inMemBatter.Batter_Contact_SlapChargeBuntStar = BUNT
+                self.inMemBatter.AtBat_MoonShot = False
 
         self.calculateContact()
-        if(not self.inMemBatter["Batter_IsBunting"]):
+        if(not self.inMemBatter.Batter_IsBunting):
             self.calculateHorizontalAngle()
 
+            self.calculateHitPower()
+
+        return True
+
+
+    def calculateTrajectory(self):
+        if(not self.inMemBatter.Batter_IsBunting):
             self.calculateVerticalAngle()
 
-            self.calculateHitPower()
+            self.calculateFieldBonus()
         else:
             self.calculateBuntAngle()
 
@@ -1110,6 +1222,22 @@ class BattingCalculator:
         return self.Display_Output
 
 
+    def branch(self, **changes):
+        # copy taken after calculateSharedStages, the batter and pitcher are shared since calculateTrajectory only reads them
+        c = copy.copy(self)
+        c.request = self.request.replace(**changes)
+        c.Display_Output = dict(self.Display_Output)
+        c.inMemBall = BallState()
+        return c
+
+
+    def calculateValues(self):
+        if(not self.calculateSharedStages()):
+            return
+
+        return self.calculateTrajectory()
+
+
     def valueToDegrees(v):
         return (v / 4096) * 360
 
@@ -1119,9 +1247,11 @@ class BattingCalculator:
 
 
 
-def hit_ball(**kwargs) -> dict:
+def hit_ball(request = None, **kwargs) -> dict:
     """ Returns power, trajectory, and other information about hitting a ball.
 
+    Takes either a HitRequest or its fields as keyword arguments.
+
     batter_id: int, default 0, (short) 80890972
     is_batter_captain: bool, default False
     pitcher_id: int, default 0, (short) 80890ada
@@ -1156,97 +1286,65 @@ def hit_ball(**kwargs) -> dict:
     rand_1: int, default 0, (uint) 80892684
     rand_2: int, default 0, (uint) 80892688
     rand_3: int, default 0, (ushort) 8089269C
-    """
-
-    kwargs.setdefault("batter_id", 0)
-    kwargs.setdefault("is_batter_captain", False)
-    kwargs.setdefault("pitcher_id", 0)
-
-    kwargs.setdefault("easy_batting", False)
-    kwargs.setdefault("handedness", 0)
-
-    kwargs.setdefault("batter_x", 0.0)
-    kwargs.setdefault("ball_x", 0.0)
-    kwargs.setdefault("ball_z", 0.0)
-
-    kwargs.setdefault("chem", 0)
-    kwargs.setdefault("num_stars", 4)
-    
-    kwargs.setdefault("hit_type", 0)
-    kwargs.setdefault("is_star_hit", False)
-    kwargs.setdefault("is_starred", False)
-
-    kwargs.setdefault("pitch_type", 0)
-
-    kwargs.setdefault("charge_up", 0.0)
-    kwargs.setdefault("charge_down", 0.0)
 
-    kwargs.setdefault("frame", 0)
-
-    kwargs.setdefault("stick_up", False)
-    kwargs.setdefault("stick_down", False)
-    kwargs.setdefault("stick_left", False)
-    kwargs.setdefault("stick_right", False)
-
-    kwargs.setdefault("rand_1", 0)
-    kwargs.setdefault("rand_2", 0)
-    kwargs.setdefault("rand_3", 0)
-
-
-    newArgs = {
-        "batter_id": kwargs["batter_id"],
-        "IsCaptain": kwargs["is_batter_captain"],
-        "pitcher_id": kwargs["pitcher_id"],
-
-        "EasyBatting": kwargs["easy_batting"],
-        "AtBat_BatterHand": kwargs["handedness"],
-        
-        "posX": kwargs["batter_x"],
-        "ballContact_X": kwargs["ball_x"],
-        "ballContact_Z": kwargs["ball_x"],
+    include_path: bool, default True, leave out the frame by frame path when only the landing spot is needed
+    """
+    c = BattingCalculator(request if request is not None else HitRequest(**kwargs))
+    try:
+        return c.calculateValues()
+    except BaseException as e:
+        return {"err": f"{e=}"}
 
-        "RandomBattingFactors_ChemLinksOnBase": kwargs["chem"],
 
-        "Batter_Contact_SlapChargeBuntStar": kwargs["hit_type"],
-        "isStar": kwargs["is_star_hit"],
-        "is_starred": kwargs["is_starred"],
+def hit_ball_zones(request = None, zones=range(5), **kwargs) -> tuple:
+    """ hit_ball, plus the results of the other vertical zones in zones.
 
-        "pitcherChargeVal": kwargs["pitch_type"],
+    Takes the same arguments as hit_ball. Everything before the vertical angle is calculated once,
+    only the vertical angle, power and flight are redone per zone.
+    Returns (result, alternates), alternates is empty when the swing has a single vertical zone.
+    """
+    c = BattingCalculator(request if request is not None else HitRequest(**kwargs))
+    try:
+        if(not c.calculateSharedStages()):
+            return None, []
 
-        "chargeUp": kwargs["charge_up"],
-        "chargeDown": kwargs["charge_down"],
+        shared = c.branch()
+        res = c.calculateTrajectory()
+    except BaseException as e:
+        return {"err": f"{e=}"}, []
 
-        "frameOfContact" : kwargs["frame"],
+    alternates = []
+    if "Vertical Details" in res and len(res["Vertical Details"]["Zones"]) > 1:
+        for zone in zones:
+            if zone != res["Vertical Details"]["Selected Zone"]:
+                try:
+                    alternates.append(shared.branch(override_vertical_range=zone).calculateTrajectory())
+                except BaseException as e:
+                    alternates.append({"err": f"{e=}"})
 
-        "Up" : kwargs["stick_up"],
-        "Down" : kwargs["stick_down"],
-        "Left" : kwargs["stick_left"],
-        "Right" : kwargs["stick_right"],
+    return res, alternates
 
-        "StaticRandomInt1" : kwargs["rand_1"],
-        "StaticRandomInt2" : kwargs["rand_2"],
-        "USHORT_8089269c" : kwargs["rand_3"],
 
-        "numStars" : kwargs["num_stars"]
-    }
+def _hit_ball_one(request):
+    # module level so process pools can pickle it
+    if isinstance(request, HitRequest):
+        return hit_ball(request)
+    return hit_ball(**request)
 
-    if "override_vertical_range" in kwargs:
-        newArgs["override_vertical_range"] = kwargs["override_vertical_range"]
 
-    if "override_vertical_angle" in kwargs:
-        newArgs["override_vertical_angle"] = kwargs["override_vertical_angle"]
-    
-    if "override_horizontal_angle" in kwargs:
-        newArgs["override_horizontal_angle"] = kwargs["override_horizontal_angle"]
+def hit_ball_many(requests, executor = None, processes = False, max_workers = None, chunksize = 64) -> list:
+    """ hit_ball for every request, each one a HitRequest or a dict of hit_ball arguments.
 
-    c = BattingCalculator()
+    Runs on executor when one is given, otherwise on a new thread pool, or a process pool with processes = True.
+    Calculators share no state, but threads still take turns on the GIL, use processes to spread over cores.
+    Results are in the order of requests.
+    """
+    if executor is not None:
+        return list(executor.map(_hit_ball_one, requests, chunksize=chunksize))
 
-    c.readValues = newArgs
-    c.parseValues()
-    try:
-        return c.calculateValues()
-    except BaseException as e:
-        return {"err": f"{e=}"}
+    pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with pool(max_workers=max_workers) as executor:
+        return list(executor.map(_hit_ball_one, requests, chunksize=chunksize))
 
 def get_hitbox(char_id) -> tuple:
     return HBP_ARRAY[CHARACTER_INDICES[char_id][2]]
@@ -1267,6 +1365,53 @@ def get_bat_hitbox(char_id, pos_x, handedness):
 
    return (near, far)
 
+@lru_cache(maxsize=None)
+def get_contact_zones(char_id, handedness, hit_type, chem = 0, easy_batting = 0, is_starred = False, charged = None) -> tuple:
+    """ The ball_x - batter_x intervals of every contact zone, worked back from calculateContact's thresholds.
+
+    Returns a (low, high) pair per zone in LEFT_SOUR to RIGHT_SOUR order, or None when the bat can't reach the zone.
+    charged is whether charge_up is above 0, by default charge swings are charged. Star swings are taken as captain star swings.
+    """
+    stats = STATS[char_id]
+    boost = 50 if is_starred else 0
+    if charged is None:
+        charged = hit_type == CHARGE
+    if hit_type == BUNT:
+        contact_size = min(stats["Bunting"] + boost, 100)
+    elif charged and hit_type != STAR:
+        contact_size = min(stats["Charge Contact Spot Size"] + boost, 100)
+    else:
+        # a captain star swing isn't charged, so it gets the chem links like a slap
+        contact_size = 100.0 if hit_type == STAR else min(stats["Slap Contact Spot Size"] + boost, 100)
+        if chem != 0:
+            contact_size *= CONTACT_CHEM_LINK_MULTIPLIERS[chem]
+
+    trimmed = 0 if BATTER_HITBOXES[char_id]["TrimmedBat"] == 0.0 else 1
+    sizes = BALL_CONTACT_ARRAY_807B6294[trimmed][hit_type][easy_batting]
+    thresholds = [contact_size / 100.0 * (sizes[i + 4] - sizes[i]) + sizes[i] for i in range(4)]
+
+    def to_offset(pos):
+        # the inverse of CalculatedBallPos, past the clamp at 0 and 200 every offset gives the same position
+        if pos <= 0.0:
+            return -math.inf
+        if pos > 200.0:
+            return math.inf
+        if pos >= 100.0:
+            return (pos - 100.0) / 100.0 * BATTER_HITBOXES[char_id]["HorizontalRangeFar"]
+        return (100.0 - pos) / 100.0 * BATTER_HITBOXES[char_id]["HorizontalRangeNear"]
+
+    reach_low, reach_high = BATTING_REACHES[trimmed]
+    zones = []
+    for zone in range(5):
+        # a zone is reached by passing every threshold before it and not the next one
+        low = to_offset(max(thresholds[:zone])) if zone > 0 else -math.inf
+        high = to_offset(thresholds[zone]) if zone < 4 else math.inf
+        if handedness == LEFTY:
+            low, high = -high, -low
+        low, high = max(low, reach_low), min(high, reach_high)
+        zones.append((low, high) if low < high else None)
+    return tuple(zones)
+
 def get_name(char_id)->str:
     return STATS[char_id]["Name"]
 
@@ -0,0 +1,16 @@
+import pytest
+import memory_engine
+from memory_engine import RamImageBackend, get_backend, set_backend, unhook, wait_hooked
+
+BASE = 0x80000000
+
+@pytest.fixture
+def ram(tmp_path, monkeypatch):
+    # a 64KB MEM1 image with every byte distinct enough to catch offset mistakes
+    path = tmp_path / "mem1.raw"
+    path.write_bytes(bytes((i * 7 + (i >> 8)) & 0xff for i in range(1 << 16)))
+    monkeypatch.setattr(memory_engine, "_backend", get_backend())
+    set_backend(RamImageBackend(str(path)))
+    wait_hooked(1.0)
+    yield get_backend()
+    unhook()
@@ -0,0 +1,178 @@
+import math
+import numpy as np
+
+AIR_RESISTANCE = 0.996
+GRAVITY = 0.00275
+
+class Flight:
+    # the ball's per frame update
+    #   p += v
+    #   v = (v - g) * r + a     (g only on Y)
+    # is linear, so v_n = r^n v0 + c (1 - r^n) / (1 - r) with c = a - g r,
+    # and p_n = p0 + v0 S_n + c / (1 - r) (n - S_n) with S_n = (1 - r^n) / (1 - r)
+
+    def __init__(self, position, velocity, acceleration, air_resistance = AIR_RESISTANCE, gravity = GRAVITY) -> None:
+        self.r = air_resistance
+        self.p0 = tuple(position)
+        self.v0 = tuple(velocity)
+        self.c = (acceleration[0], acceleration[1] - gravity * air_resistance, acceleration[2])
+
+    def _sum(self, n):
+        # S_n, works for arrays of frames too
+        return (1 - self.r ** n) / (1 - self.r)
+
+    def position(self, n:int) -> tuple[float, float, float]:
+        s = self._sum(n)
+        return tuple(p + v * s + c / (1 - self.r) * (n - s) for p, v, c in zip(self.p0, self.v0, self.c))
+
+    def velocity(self, n:int) -> tuple[float, float, float]:
+        rn = self.r ** n
+        return tuple(rn * v + c * (1 - rn) / (1 - self.r) for v, c in zip(self.v0, self.c))
+
+    def height(self, n) -> float:
+        s = self._sum(n)
+        return self.p0[1] + self.v0[1] * s + self.c[1] / (1 - self.r) * (n - s)
+
+    def _turning_point(self):
+        # Y(t) = p0 + K S(t) + c t / (1 - r) has at most one stationary point
+        k = self.v0[1] - self.c[1] / (1 - self.r)
+        log_r = math.log(self.r)
+        if k == 0:
+            return None
+        x = self.c[1] / (k * log_r)
+        if x <= 0:
+            return None
+        t = math.log(x) / log_r
+        return t if t > 0 else None
+
+    def landing_frame(self, limit = 1 << 20) -> int:
+        # first frame at or below the ground, None if the ball doesn't come down before limit
+        if self.height(0) <= 0:
+            return 0
+
+        # Y is monotonic between these, so a crossing inside one can be bisected
+        bounds = [0]
+        t = self._turning_point()
+        if t is not None and t < limit:
+            bounds += sorted({math.floor(t), math.ceil(t)} - {0})
+
+        for start, end in zip(bounds, bounds[1:]):
+            if self.height(end) <= 0:
+                return self._bisect(start, end)
+
+        start = bounds[-1]
+        step = 16
+        end = start + step
+        while self.height(end) > 0:
+            if end >= limit:
+                return None
+            start, step = end, step * 2
+            end = min(start + step, limit)
+        return self._bisect(start, end)
+
+    def _bisect(self, above:int, below:int) -> int:
+        while below - above > 1:
+            mid = (above + below) // 2
+            if self.height(mid) > 0:
+                above = mid
+            else:
+                below = mid
+        return below
+
+    def path(self, frames:int) -> np.ndarray:
+        # positions for frames 0 until frames, as a (frames, 3) array
+        n = np.arange(frames, dtype=np.float64)
+        s = self._sum(n)
+        p0, v0, c = np.array(self.p0), np.array(self.v0), np.array(self.c)
+        return p0 + np.outer(s, v0) + np.outer(n - s, c / (1 - self.r))
+
+# the same solution for (N, 3) arrays of trajectories
+
+def _closed_form(velocity, acceleration, air_resistance, gravity):
+    c = np.array(acceleration, dtype=np.float64)
+    c[..., 1] -= gravity * air_resistance
+    return np.asarray(velocity, dtype=np.float64), c
+
+def positions(start, velocity, acceleration, frames, air_resistance = AIR_RESISTANCE, gravity = GRAVITY) -> np.ndarray:
+    v0, c = _closed_form(velocity, acceleration, air_resistance, gravity)
+    n = np.asarray(frames, dtype=np.float64)[..., None]
+    s = (1 - air_resistance ** n) / (1 - air_resistance)
+    return start + v0 * s + c / (1 - air_resistance) * (n - s)
+
+def landing_frames(start, velocity, acceleration, air_resistance = AIR_RESISTANCE, gravity = GRAVITY, limit = 1 << 20) -> np.ndarray:
+    # Flight.landing_frame for every row, -1 for balls that don't come down before limit
+    r = air_resistance
+    log_r = math.log(r)
+    v0, c = _closed_form(velocity, acceleration, air_resistance, gravity)
+    y0, vy, cy = np.asarray(start, dtype=np.float64)[:, 1], v0[:, 1], c[:, 1]
+
+    # Y(t) = y0 + K S(t) + b t = a + b t + k r^t
+    b = cy / (1 - r)
+    k = -(vy - b) / (1 - r)
+    a = y0 - k
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        x = cy / ((vy - b) * log_r)
+        turn = np.where((vy != b) & (x > 0), np.log(np.where(x > 0, x, 1)) / log_r, 0.0)
+    turn = np.clip(np.nan_to_num(turn), 0, limit)
+
+    def height(n, rows = slice(None)):
+        # same form as Flight.height, so both agree on which frame is the first below ground
+        s = (1 - r ** n) / (1 - r)
+        return y0[rows] + vy[rows] * s + cy[rows] / (1 - r) * (n - s)
+
+    # a ball that curves down (k < 0) and keeps falling (b < 0) crosses the ground once after its apex,
+    # newton's method from past the apex lands right of the root and walks back to it
+    t = 2 * turn + 1
+    for _ in range(4):
+        e = np.exp(t * log_r)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = t - (a + b * t + k * e) / (b + k * log_r * e)
+
+    frames = np.ceil(np.nan_to_num(t, nan=-1.0, posinf=-1.0, neginf=-1.0)).clip(-1, limit)
+    # newton can be a frame off either way, the frame it's moved to is checked with one more height past it
+    at, before = height(frames), height(frames - 1)
+    early, late = at > 0, (at <= 0) & (before <= 0)
+    beyond = height(np.where(early, frames + 1, frames - 2))
+    landed = np.where(early, beyond <= 0, np.where(late, beyond > 0, (at <= 0) & (before > 0)))
+    frames = np.where(early, frames + 1, np.where(late, frames - 1, frames))
+    solved = (k < 0) & (b < 0) & (y0 > 0) & (frames >= 1) & landed
+
+    rows = np.flatnonzero(~solved)
+    if len(rows):
+        frames[rows] = _search_landing(lambda n: height(n, rows), turn[rows], limit)
+    return frames.astype(np.int64)
+
+def _search_landing(height, turn, limit) -> np.ndarray:
+    # bracket every crossing inside a stretch where the height is monotonic, then bisect
+    before, after = np.floor(turn), np.ceil(turn)
+    grounded = height(np.zeros(len(turn))) <= 0
+
+    above = np.zeros(len(turn))
+    below = np.full(len(turn), -1.0)
+    first = ~grounded & (before > 0) & (height(before) <= 0)
+    below[first] = before[first]
+    second = ~grounded & ~first & (after > before) & (height(after) <= 0)
+    above[second], below[second] = before[second], after[second]
+
+    searching = ~grounded & ~first & ~second
+    above[searching] = after[searching]
+    step = np.full(len(turn), 16.0)
+    while searching.any():
+        end = np.minimum(above + step, limit)
+        landed = searching & (height(end) <= 0)
+        below[landed] = end[landed]
+        searching &= ~landed
+        searching &= end < limit
+        above = np.where(searching, end, above)
+        step *= 2
+
+    bisecting = below > above + 1
+    while bisecting.any():
+        mid = np.floor((above + below) / 2)
+        high = height(mid) > 0
+        above = np.where(bisecting & high, mid, above)
+        below = np.where(bisecting & ~high, mid, below)
+        bisecting = below > above + 1
+
+    return np.where(grounded, 0, np.where(below >= 0, below, -1))
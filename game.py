@@ -1,11 +1,20 @@
-import sys, pygame, json, configparser
+import sys, pygame, json, configparser, atexit, threading
+import numpy as np
 from copy import deepcopy
+from functools import lru_cache
 from genericpath import exists
 from time import time
+from matplotlib import colormaps
 from matplotlib.colors import to_rgb
-from calc_batting import get_bat_hitbox, get_name, hit_ball, get_hitbox, get_box_movement
+from batch_batting import hit_ball_batch
+from spray_charts import load_spray, BINS, EXTENT
+from stadium import MARIO_STADIUM, label_results
+from calc_batting import get_bat_hitbox, get_name, hit_ball_zones, get_hitbox, get_box_movement, get_contact_zones, CONTACT_ZONE_NAMES, BATTER_HITBOXES, BATTING_REACHES, SLAP, CHARGE, LEFTY, PERFECT, LEFT_NICE, RIGHT_NICE
 from pygame import Rect, Vector2, Vector3
 from memory_engine import *
+from memory_poller import MemoryPoller
+from snapshot_publisher import SnapshotPublisher, layout_from_accessors
+from address_resolver import AddressResolver
 from visualizer import canvas
 
 class DisplayableInfo:
@@ -77,13 +86,10 @@ class DisplayHitView(DisplayableInfo):
         if not self.valid:
             return False
 
-        is_replay =         DolphinBool(0x80872540)
-        game_state =        DolphinByte(0x80892aaa)
-        was_contact_made =  DolphinBool(0x808909a1)
-
-        self.valid &= not is_replay.live_value
-        self.valid &= game_state.live_value in [0x1, 0x2]
-        self.valid &= was_contact_made.live_value
+        # through the table so the resolver's addresses are used
+        self.valid &= not EVERY_FRAME_ADDRESSES["is_replay"].live_value
+        self.valid &= EVERY_FRAME_ADDRESSES["gamestate"].live_value in [0x1, 0x2]
+        self.valid &= EVERY_FRAME_ADDRESSES["was_contact_made"].live_value
         return self.valid
 
     def draw_horizontal_trajectory(self, m_surface:pygame.Surface):
@@ -105,11 +111,6 @@ class DisplayHitView(DisplayableInfo):
         # m_surface = get_my_surface(my_square.left, my_square.top, my_square.width, my_square.height)
 
         corner = Vector2(0.5, -0.05)
-        right_post = Vector3(57.0, 0.0, 57.0)
-        left_post = Vector3(-57.0, 0.0, 57.0)
-        left_part = Vector3(-41.5, 0.0, 82.5)
-        middle_part = Vector3(-13.0, 0.0, 100.0)
-        right_part = Vector3(16.0, 0.0, 100.0)
         
         scale = 1 / 120.0
 
@@ -129,7 +130,17 @@ class DisplayHitView(DisplayableInfo):
         line_color = (*get_config_color("ball_trajectory"), alpha)
         line_outline_color = (*get_config_color("ball_trajectory_outline"), alpha)
 
-        pygame.draw.polygon(m_surface, stadium_color, [ plot_point(Vector3(0,0,0)), plot_point(left_post), plot_point(left_part), plot_point(middle_part), plot_point(right_part), plot_point(right_post)], width=LINE_WIDTH)
+        # draw the batter's spray chart under everything else
+        if get_config_value("VISUAL_TOGGLES", "display_spray_chart", bool):
+            vals = self.data["read_values"]
+            top_left = plot_point(Vector3(EXTENT[0], 0.0, EXTENT[3]))
+            size = plot_point(Vector3(EXTENT[1], 0.0, EXTENT[2])) - top_left
+            spray = get_spray_surface(vals["batter_id"], vals["handedness"], (int(size.x), int(size.y)))
+            if spray is not None:
+                spray.set_alpha(alpha)
+                m_surface.blit(spray, top_left)
+
+        pygame.draw.polygon(m_surface, stadium_color, [plot_point(Vector3(x, 0.0, z)) for x, z in MARIO_STADIUM.outline()], width=LINE_WIDTH)
 
 
         if get_config_value("VISUAL_TOGGLES", "display_bases", bool):
@@ -244,14 +255,9 @@ class DisplayStrikeView(DisplayableInfo):
         if not self.valid:
             return False
 
-        is_replay    =       DolphinBool(0x80872540)
-        game_state   =       DolphinByte(0x80892aaa)
-        missed_ball  =       DolphinBool(0x80890b18)
-        hit_by_pitch =       DolphinBool(0x808909a3)
-
-        self.valid &= not is_replay.live_value
-        self.valid &= game_state.live_value in [0x1]
-        self.valid &= (missed_ball.live_value or hit_by_pitch.live_value)
+        self.valid &= not EVERY_FRAME_ADDRESSES["is_replay"].live_value
+        self.valid &= EVERY_FRAME_ADDRESSES["gamestate"].live_value in [0x1]
+        self.valid &= (EVERY_FRAME_ADDRESSES["missed_ball"].live_value or EVERY_FRAME_ADDRESSES["hit_by_pitch"].live_value)
         return self.valid
 
     def draw_strike_view(self, my_surface:pygame.Surface):
@@ -404,11 +410,32 @@ class DisplayStrikeView(DisplayableInfo):
             # screen.draw_lines(left_post, strike_zone_color, line_width=HITBOX_LINE_WIDTH)
             # screen.draw_lines(right_post, strike_zone_color, line_width=HITBOX_LINE_WIDTH)
 
+        # draw contact quality across the bat's reach, under the bat
+        if get_config_value("VISUAL_TOGGLES", "display_contact_quality", bool) and get_contact_quality_strip(*get_swing_contact_key(vals)) is not None:
+            bat_left, bat_right = sorted(hbox_bat)
+            p0 = c.project_point(Vector3(bat_left, bat_p.y + hitbox_scale_y * 0.5, 0.0))
+            p1 = c.project_point(Vector3(bat_right, bat_p.y - hitbox_scale_y * 0.5, 0.0))
+            strip_rect = Rect(min(p0.x, p1.x), min(p0.y, p1.y), abs(p1.x - p0.x), abs(p1.y - p0.y))
+            strip = get_scaled_contact_quality_strip(get_swing_contact_key(vals), p0.x > p1.x, strip_rect.size)
+            strip.set_alpha(alpha)
+            c.screen.blit(strip, strip_rect)
+
         #draw bat
         if get_config_value("VISUAL_TOGGLES", "display_bat_hitbox", bool):            
             # draw bat
             c.draw_cube(bat_p, scale=hitbox_1_scaling, offset=hitbox1_offset, color=bat_hitbox_color, line_width=HITBOX_LINE_WIDTH)
             c.draw_cube(bat_p, scale=hitbox_2_scaling, offset=hitbox2_offset, color=bat_hitbox_color, line_width=HITBOX_LINE_WIDTH)
+
+        # draw contact zones along the bat
+        if get_config_value("VISUAL_TOGGLES", "display_contact_zones", bool):
+            zones = get_contact_zones(*get_swing_contact_key(vals))
+            for zone, interval in enumerate(zones):
+                if interval is None:
+                    continue
+                # same mirroring as the bat hitbox
+                low, high = [(vals["batter_x"] + d) * (-1 if handedness == 1 else 1) for d in interval]
+                zone_color = "perfect_zone" if zone == PERFECT else "nice_zone" if zone in [LEFT_NICE, RIGHT_NICE] else "sour_zone"
+                c.draw_lines([Vector3(low, bat_p.y, 0.0), Vector3(high, bat_p.y, 0.0)], (*get_config_color(zone_color), alpha), line_width=LINE_WIDTH)
         
         #draw ball
         if get_config_value("VISUAL_TOGGLES", "display_ball_hitbox", bool):
@@ -580,6 +607,16 @@ EVERY_FRAME_ADDRESSES = {
     "gamestate" : DolphinByte(0x80892aaa)
 }
 
+# written to replay a hit, never read
+FORCED_HIT_ADDRESSES = {
+    "ball_position": DolphinVec3(0x80890b38),
+    "ball_velocity": DolphinVec3(0x80890e50),
+    "ball_acceleration": DolphinVec3(0x80890e5c),
+}
+
+CALCULATE_SNAPSHOT = DolphinSnapshot(CALCULATE_ADDRESSES)
+EVERY_FRAME_SNAPSHOT = DolphinSnapshot(EVERY_FRAME_ADDRESSES)
+
 def missed_ball():
 
     res = {
@@ -661,6 +698,7 @@ def missed_ball():
         + optional_text(f"Batter Hitbox: {hitbox_left:.2f} to {hitbox_right:.2f}\n",                                get_config_value("TEXT_TOGGLES", "display_batter_hitbox_text", bool))
         + optional_text(f"Bat Hitbox: {min(hitbox_near, hitbox_far):.2f} to {max(hitbox_near, hitbox_far):.2f}\n",  get_config_value("TEXT_TOGGLES", "display_bat_hitbox_text", bool))
         + optional_text(f"Distance To Edge Of Bat: {bat_distance:.2f}\n",                                           get_config_value("TEXT_TOGGLES", "display_distance_from_bat", bool))
+        + optional_text(get_contact_zone_text(read_values),                                                         get_config_value("TEXT_TOGGLES", "display_distance_from_perfect", bool))
         + optional_text(f"Strike Box: {res['strike_range_left']:.2f} to {res['strike_range_right']:.2f}\n",         get_config_value("TEXT_TOGGLES", "display_strike_zone_text", bool))
         + optional_text(f"Pitch Type: {pitch_type}\n",                                                              get_config_value("TEXT_TOGGLES", "display_pitch_type_text", bool))
         + optional_text('Swung\n',                                                                                  get_config_value("TEXT_TOGGLES", "display_if_swung_text", bool) and read_values['swung'])
@@ -670,6 +708,64 @@ def missed_ball():
     global all_events
     all_events.append(DisplayStrikeView({"k": "StrikeBall", "v": res, "t": text, "read_values":deepcopy(read_values)}))
 
+def get_swing_contact_key(vals) -> tuple:
+    # (batter, handedness, hit type, chem, easy batting, starred, charged), everything the contact zones depend on,
+    # calculateContact picks the contact size by the charge and the thresholds by the hit type
+    return (vals["batter_id"], vals["handedness"], vals["slap_or_charge"], vals["chem"], vals["easy_batting"],
+            get_config_value("USAGE", "is_starred", bool), vals["charge_up"] > 0.0)
+
+CONTACT_QUALITY_STRIP_WIDTH = 512
+
+@lru_cache(maxsize=None)
+def get_contact_quality_strip(batter_id, handedness, hit_type, chem, easy_batting, is_starred, charged) -> pygame.Surface:
+    # contact quality over the bat's reach, one pixel high and left to right on the plate, None for bunts and star swings
+    if hit_type not in [SLAP, CHARGE]:
+        return None
+
+    low, high = BATTING_REACHES[0 if BATTER_HITBOXES[batter_id]["TrimmedBat"] == 0.0 else 1]
+    rows = hit_ball_batch(batter_id=batter_id, handedness=handedness, hit_type=hit_type, charge_up=float(charged), chem=chem,
+                          easy_batting=easy_batting, is_starred=is_starred, ball_x=np.linspace(low, high, CONTACT_QUALITY_STRIP_WIDTH), rand_1=0)
+    # contact_quality only means something inside a zone, so each zone gets its own color, darker where the quality is lower
+    zone_colors = np.array([get_config_color(name) for name in ["sour_zone", "nice_zone", "perfect_zone", "nice_zone", "sour_zone"]])
+    colors = zone_colors[rows["contact_zone"]] * (0.4 + 0.6 * rows["contact_quality"])[:, None]
+    # lefties are drawn mirrored, like the bat hitbox
+    if handedness == LEFTY:
+        colors = colors[::-1]
+    return pygame.surfarray.make_surface(colors[:, None, :].astype(np.uint8))
+
+@lru_cache(maxsize=16)
+def get_scaled_contact_quality_strip(key, flipped, size) -> pygame.Surface:
+    return pygame.transform.scale(pygame.transform.flip(get_contact_quality_strip(*key), flipped, False), (max(int(size[0]), 1), max(int(size[1]), 1)))
+
+@lru_cache(maxsize=16)
+def get_spray_surface(batter_id, handedness, size) -> pygame.Surface:
+    # the saved spray chart colormapped, faded where balls rarely land, None when the batter has none
+    chances = load_spray(batter_id, handedness)
+    if chances is None or chances.max() <= 0.0:
+        return None
+
+    density = np.sqrt(chances / chances.max())
+    # charts are indexed [x, z], screen rows go down while z goes up
+    colors = colormaps[config["COLORS"]["spray_chart"]](density[:, ::-1])
+    surface = pygame.Surface(BINS, pygame.SRCALPHA)
+    pygame.surfarray.pixels3d(surface)[:] = colors[..., :3] * 255
+    pygame.surfarray.pixels_alpha(surface)[:] = density[:, ::-1] * 255 * get_config_value("VISUAL_TOGGLES", "spray_chart_opacity", float)
+    return pygame.transform.smoothscale(surface, (max(size[0], 1), max(size[1], 1)))
+
+def get_contact_zone_text(vals) -> str:
+    # which zone the ball passed through and how far it was from perfect contact
+    zones = get_contact_zones(*get_swing_contact_key(vals))
+    offset = (vals["strike_x"] if vals["handedness"] == 0 else -vals["strike_x"]) - vals["batter_x"]
+    zone = next((i for i, z in enumerate(zones) if z is not None and z[0] <= offset <= z[1]), None)
+    if zone == PERFECT:
+        return "Contact Zone: Perfect\n"
+
+    name = "Off The Bat" if zone is None else CONTACT_ZONE_NAMES[zone]
+    if zones[PERFECT] is None:
+        return f"Contact Zone: {name}\n"
+    low, high = zones[PERFECT]
+    return f"Contact Zone: {name}, {max(low - offset, offset - high):.2f} from Perfect\n"
+
 def ordinal(n):
     return "%d%s" % (n,"tsnrhtdd"[(n//10%10!=1)*(n%10<4)*n%10::4])
 
@@ -679,9 +775,11 @@ def calculate_trajectory():
         ball_pos = last_hit_value.data["v"]["FlightDetails"]["Path"][0]
         ball_acc = last_hit_value.data["v"]["BallDetails"]["Acceleration"]
         ball_vel = last_hit_value.data["v"]["BallDetails"]["Velocity"]
-        write_vec3(0x80890b38, Vector3(ball_pos["X"], ball_pos["Y"], ball_pos["Z"]))
-        write_vec3(0x80890e50, Vector3(ball_vel["X"], ball_vel["Y"], ball_vel["Z"]))
-        write_vec3(0x80890e5c, Vector3(ball_acc["X"], ball_acc["Y"], ball_acc["Z"]))
+        # position is its own write, velocity and acceleration are next to each other and merge into one
+        with write_batch():
+            FORCED_HIT_ADDRESSES["ball_position"].write(Vector3(ball_pos["X"], ball_pos["Y"], ball_pos["Z"]))
+            FORCED_HIT_ADDRESSES["ball_velocity"].write(Vector3(ball_vel["X"], ball_vel["Y"], ball_vel["Z"]))
+            FORCED_HIT_ADDRESSES["ball_acceleration"].write(Vector3(ball_acc["X"], ball_acc["Y"], ball_acc["Z"]))
         return
 
     team_batting = read_values["team_batting"]
@@ -720,7 +818,9 @@ def calculate_trajectory():
 
     read_values["num_stars"] = num_stars
 
-    res = hit_ball(
+    multiple_trajectories = get_config_value("VISUAL_TOGGLES", "display_multiple_trajectories_vertical", bool) or get_config_value("VISUAL_TOGGLES", "display_multiple_trajectories_horizontal", bool)
+
+    res, e = hit_ball_zones(
         batter_id=read_values["batter_id"],
         pitcher_id=read_values["pitcher_id"],
         easy_batting=read_values["easy_batting"],
@@ -744,41 +844,9 @@ def calculate_trajectory():
         stick_right=read_values["stick_right"],
         num_stars=read_values["num_stars"],
         is_starred=is_starred,
+        zones=range(5) if multiple_trajectories else (),
     )
-
-    e = []
-
-    if "Vertical Details" in res and len(res["Vertical Details"]["Zones"]) > 1 and (get_config_value("VISUAL_TOGGLES", "display_multiple_trajectories_vertical", bool) or get_config_value("VISUAL_TOGGLES", "display_multiple_trajectories_horizontal", bool)):
-        for i in range(5):
-            if i != res["Vertical Details"]["Selected Zone"]:
-                new_res = hit_ball(
-                    batter_id=read_values["batter_id"],
-                    pitcher_id=read_values["pitcher_id"],
-                    easy_batting=read_values["easy_batting"],
-                    handedness=read_values["handedness"],
-                    batter_x=read_values["batter_x"],
-                    ball_x=read_values["ball_x"],
-                    ball_z=read_values["ball_z"],
-                    chem=read_values["chem"],
-                    hit_type=read_values["slap_or_charge"],
-                    is_star_hit=read_values["is_hit_star"],
-                    pitch_type=read_values["pitch_type"],
-                    charge_up=read_values["charge_up"],
-                    charge_down=read_values["charge_down"],
-                    frame=read_values["frame"],
-                    rand_1=read_values["rand_1"],
-                    rand_2=read_values["rand_2"],
-                    rand_3=read_values["rand_3"],
-                    stick_up=read_values["stick_up"],
-                    stick_down=read_values["stick_down"],
-                    stick_left=read_values["stick_left"],
-                    stick_right=read_values["stick_right"],
-                    num_stars=read_values["num_stars"],
-                    is_starred=is_starred,
-                    override_vertical_range = i,
-                )
-
-                e.append(new_res)
+    label_results([res] + e)
 
     runners_text = ""
     runners_value = read_values["where_are_runners"] >> 4
@@ -803,6 +871,7 @@ def calculate_trajectory():
             + optional_text(f'Contact Zone: {res["Contact"]["ContactZone"]}\n',                                                                                                                                 get_config_value("TEXT_TOGGLES" ,"display_contact_zone_text", bool))
             + optional_text(f'Contact Quality: {res["Contact"]["ContactQuality"] * 100: .1f}%\n',                                                                                                               get_config_value("TEXT_TOGGLES" ,"display_contact_quality_text", bool))
             + optional_text(f'Dist: {res["FlightDetails"]["Distance"]:.2f}\n',                                                                                                                                  get_config_value("TEXT_TOGGLES" ,"display_ball_distance_text", bool))
+            + optional_text(f'Result (approx.): {res["FlightDetails"].get("Fence", "")}\n',                                                                                                                     get_config_value("TEXT_TOGGLES" ,"display_fence_result_text", bool))
             + optional_text(f'Hit Ground: {res["FlightDetails"]["Path"][-1]}\n',                                                                                                                                get_config_value("TEXT_TOGGLES" ,"display_hit_ground_text", bool))
             + optional_text(f'Stick Input: {stick_text}\n',                                                                                                                                                     get_config_value("TEXT_TOGGLES" ,"display_stick_input_text", bool))
             + optional_text(f'Power: {res["BallDetails"]["Power"]}\n',                                                                                                                                          get_config_value("TEXT_TOGGLES" ,"display_power_text", bool))
@@ -817,6 +886,7 @@ def calculate_trajectory():
             + optional_text(f'Contact Zone: {res["Contact"]["ContactZone"]}\n',                                                                                                                                 get_config_value("TEXT_TOGGLES" ,"display_contact_zone_text", bool))
             + optional_text(f'Contact Quality: {res["Contact"]["ContactQuality"] * 100: .1f}%\n',                                                                                                               get_config_value("TEXT_TOGGLES" ,"display_contact_quality_text", bool))
             + optional_text(f'Dist: {res["FlightDetails"]["Distance"]:.2f}\n',                                                                                                                                  get_config_value("TEXT_TOGGLES" ,"display_ball_distance_text", bool))
+            + optional_text(f'Result (approx.): {res["FlightDetails"].get("Fence", "")}\n',                                                                                                                     get_config_value("TEXT_TOGGLES" ,"display_fence_result_text", bool))
             + optional_text(f'Hit Ground: {res["FlightDetails"]["Path"][-1]}\n',                                                                                                                                get_config_value("TEXT_TOGGLES" ,"display_hit_ground_text", bool))
             + optional_text(f'Stick Input: {stick_text}\n',                                                                                                                                                     get_config_value("TEXT_TOGGLES" ,"display_stick_input_text", bool))
             + optional_text(f'Frame: {read_values["frame"]}\n',                                                                                                                                                 get_config_value("TEXT_TOGGLES" ,"display_contact_frame_text", bool))
@@ -877,19 +947,10 @@ def draw_unhooked_screen(my_screen:pygame.Surface):
     font = pygame.font.SysFont(get_config_value("GRAPHICS", "font", str), int(height / 8))
     blit_text(my_screen, s, (0,0), font)
 
-def new_read(name:str, v):
-    return read_values.get(name, None) == v and last_read_values.get(name, None) != v
-
 def update_read_values():
-    for k, v in CALCULATE_ADDRESSES.items():
-        read_values[k] = v.live_value
-   
-def update_every_frame_values():
-    for k, v in EVERY_FRAME_ADDRESSES.items():
-        read_values[k] = v.live_value
+    read_values.update(CALCULATE_SNAPSHOT.read())
 
 read_values = {}
-last_read_values = {}
 
 last_hit_value = {}
 all_events = []
@@ -932,10 +993,17 @@ def get_sub_screen(region_name:str):
         return s
 
 def main():
-    global size, width, height, last_hit_value, last_read_values, read_values, all_events, config, screen, force_hit, previous_event
+    global size, width, height, last_hit_value, read_values, all_events, config, screen, force_hit, previous_event
 
     background = get_config_color("background")
 
+    if get_config_value("USAGE", "dump_io_stats", bool):
+        atexit.register(io_stats.dump)
+
+    ram_image = get_config_value("USAGE", "ram_image", str)
+    if ram_image:
+        set_backend(RamImageBackend(ram_image))
+
     pygame.init()
     screen = pygame.display.set_mode(size)
 
@@ -971,7 +1039,7 @@ def main():
             pass
 
         # if not viewing, but displaying current data
-        elif previous_event == -1 and all_events[previous_event].is_valid():
+        elif previous_event == -1 and is_live_event_valid():
             # if there are at least 2 object
             if len(all_events) >= 2:
                 # show second to most recent
@@ -986,6 +1054,12 @@ def main():
             # show last
             previous_event = len(all_events) - 1
 
+    def is_live_event_valid():
+        try:
+            return all_events[-1].is_valid()
+        except DolphinDisconnectedError:
+            return False
+
     def reset_bat_watch():
         global previous_event, force_hit
 
@@ -1079,7 +1153,36 @@ def main():
 
             pygame.display.flip()
 
+    # older config files have no poll_rate
+    poller = MemoryPoller(EVERY_FRAME_SNAPSHOT, get_config_value("USAGE", "poll_rate", float) or 240.0,
+                          capture=CALCULATE_SNAPSHOT, capture_on=["was_contact_made", "missed_ball", "hit_by_pitch"])
+    poller.start()
+
+    publisher = None
+    if get_config_value("USAGE", "publish_snapshots", bool):
+        publisher = SnapshotPublisher(get_config_value("USAGE", "snapshot_name", str),
+                                      layout_from_accessors(CALCULATE_ADDRESSES, EVERY_FRAME_ADDRESSES, extra_fields=[("time", "d")]))
+        atexit.register(publisher.close)
+
+    # moves the fields to where this build of the game keeps them, once per hook
+    resolver = None
+    if get_config_value("USAGE", "resolve_addresses", bool):
+        resolver = AddressResolver([CALCULATE_ADDRESSES, EVERY_FRAME_ADDRESSES, FORCED_HIT_ADDRESSES], [CALCULATE_SNAPSHOT, EVERY_FRAME_SNAPSHOT])
+    resolved = False
+
+    def resolve_addresses():
+        # reads the whole code section, so it runs on its own thread instead of stalling the frame
+        try:
+            resolver.apply()
+        except DolphinDisconnectedError:
+            # lost the hook halfway, the next hook starts another one
+            pass
+
     while True:
+        # everything read on this thread during the frame goes through one cache,
+        # starting with the flags the poller already fetched
+        begin_frame(EVERY_FRAME_SNAPSHOT.raw)
+
         for event in pygame.event.get():
 
             if event.type == pygame.QUIT: 
@@ -1106,8 +1209,9 @@ def main():
         pygame.draw.line(screen, (0,0,0), (0, height * 1/3), (width, height * 1/3))
         pygame.draw.line(screen, (0,0,0), (0, height * 2/3), (width, height * 2/3))
 
-        if not dme.is_hooked():
-            dme.hook()
+        if not connection.hooked:
+            connection.start()
+            resolved = False
 
             # let user know it's unhooked
             draw_unhooked_screen(get_sub_screen("top"))
@@ -1116,33 +1220,43 @@ def main():
             pygame.display.flip()
             continue
 
-        try:
-            update_every_frame_values()
-        except:
-            # unable to talk to dolphin
-            dme.un_hook()
-
         data_events = [
             {"name": "was_contact_made", "value": True, "func": calculate_trajectory},
             {"name": "missed_ball", "value": True, "func": missed_ball},
             {"name": "hit_by_pitch", "value": True, "func": missed_ball},
         ]
 
-        if not read_values["is_replay"] and read_values["gamestate"] in [0x1, 0x2]:
-            for d in data_events:
-                if new_read(d["name"], d["value"]):
-                    update_read_values()
+        try:
+            if resolver is not None and not resolved:
+                threading.Thread(target=resolve_addresses, name="address-resolver", daemon=True).start()
+                resolved = True
 
-                    d["func"]()
+            events = poller.drain()
+            for e in events:
+                read_values.update(e.values)
 
-        last_read_values = {k: v for k, v in read_values.items()}
+                if e.captured is None or e.values["is_replay"] or e.values["gamestate"] not in [0x1, 0x2]:
+                    continue
 
-        if len(all_events) == 0:
-            # if there is no recorded hit, end
-            pygame.display.flip()
-            continue
+                for d in data_events:
+                    if e.name == d["name"] and e.value == d["value"]:
+                        read_values.update(e.captured)
+
+                        d["func"]()
+
+            if publisher is not None and len(events) > 0:
+                publisher.publish({"time": time(), **read_values})
+
+            if len(all_events) == 0:
+                # if there is no recorded hit, end
+                pygame.display.flip()
+                continue
 
-        if previous_event == -1 and not all_events[-1].is_valid():
+            if previous_event == -1 and not all_events[-1].is_valid():
+                pygame.display.flip()
+                continue
+        except DolphinDisconnectedError:
+            # unable to talk to dolphin, it reconnects in the background while we keep drawing
             pygame.display.flip()
             continue
 
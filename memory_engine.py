@@ -1,38 +1,483 @@
 import abc
-import _dolphin_memory_engine as dme
+import json
+import mmap
+import sys
+import numpy as np
 from pygame import Vector3
 from visualizer import mat
 import struct
+import threading
+from bisect import bisect_left
+from collections import Counter, deque
+from contextlib import contextmanager
+from functools import lru_cache
+from time import perf_counter, sleep
+
+try:
+    import _dolphin_memory_engine as dme
+except ImportError:
+    # no emulator access on this machine, only file backed memory is available
+    dme = None
+
+@lru_cache(maxsize=None)
+def get_struct(fmt:str) -> struct.Struct:
+    # every layout is big-endian, like the GameCube
+    if fmt[0] not in "@=<>!":
+        fmt = ">" + fmt
+    return struct.Struct(fmt)
+
+class RecordLayout:
+    # fields are (name, offset, format) tuples, e.g. ("batter_id", 0x0, "H"), ("charge_up", 0x8, "f")
+    # the whole record is compiled into a single struct with pad bytes between fields
+    def __init__(self, fields, size:int = None) -> None:
+        fields = sorted(fields, key=lambda f: f[1])
+        self._fields = [(name, offset, field_fmt.lstrip("@=<>!")) for name, offset, field_fmt in fields]
+
+        fmt = ">"
+        position = 0
+        self._names = []
+        self._slices = []
+        value_count = 0
+        for name, offset, field_fmt in fields:
+            field_fmt = field_fmt.lstrip("@=<>!")
+            assert offset >= position, f"{name} overlaps the previous field"
+            if offset > position:
+                fmt += f"{offset - position}x"
+            fmt += field_fmt
+
+            field_struct = get_struct(field_fmt)
+            count = len(field_struct.unpack(bytes(field_struct.size)))
+            self._names.append(name)
+            self._slices.append(value_count if count == 1 else slice(value_count, value_count + count))
+
+            value_count += count
+            position = offset + field_struct.size
+
+        if size is not None and size > position:
+            fmt += f"{size - position}x"
+
+        self._struct = get_struct(fmt)
+        self._flat = all(type(s) == int for s in self._slices)
+
+    @property
+    def size(self) -> int:
+        return self._struct.size
+
+    @property
+    def names(self) -> list[str]:
+        return self._names
+
+    def unpack_from(self, b, offset = 0) -> tuple:
+        return self._struct.unpack_from(b, offset)
+
+    def decode(self, b, offset = 0) -> dict:
+        values = self._struct.unpack_from(b, offset)
+        if self._flat:
+            return dict(zip(self._names, values))
+        return {name: values[s] for name, s in zip(self._names, self._slices)}
+
+    @property
+    def fields(self) -> list[tuple[str, int, str]]:
+        return self._fields
+
+    def pack_into(self, b, offset, *values) -> None:
+        self._struct.pack_into(b, offset, *values)
+
+    def encode_into(self, b, offset, values:dict) -> None:
+        # missing names are written as zero
+        flat = []
+        for (name, _, fmt), s in zip(self._fields, self._slices):
+            if type(s) == int:
+                flat.append(values.get(name, b"" if fmt.endswith("s") else 0))
+            else:
+                flat.extend(values.get(name, [0] * (s.stop - s.start)))
+        self._struct.pack_into(b, offset, *flat)
+
+VEC3_STRUCT = get_struct(">3f")
 
 def floats_from_bytes(b: bytes) -> list[float]:
-    ba = bytearray(b)
-    n = 4
-    return [struct.unpack("f", bytes(reversed(b[i:i+n])))[0] for i in range(0, len(b), n)]
+    return list(get_struct(f">{len(b) // 4}f").unpack_from(b))
     
-def bytes_from_floats(*f) -> bytearray:   
-    return b"".join([bytes(reversed(struct.pack("f", ff))) for ff in f])
+def bytes_from_floats(*f) -> bytes:   
+    return get_struct(f">{len(f)}f").pack(*f)
 
-def read_word(addr) -> int:
-    hook()
-    return dme.read_word(addr)
+class MemoryBackend(abc.ABC):
+    # where the accessors get their bytes from, everything above this works on raw big-endian bytes
 
-def write_word(addr, v):
-    hook()
-    dme.write_word(addr, v & 0xffffffff)
+    @abc.abstractmethod
+    def hook(self) -> bool:
+        pass
+
+    @abc.abstractmethod
+    def is_hooked(self) -> bool:
+        pass
 
-def read_bytes(addr, c:int):
-    return dme.read_bytes(addr, c)
+    def unhook(self) -> None:
+        pass
+
+    @abc.abstractmethod
+    def read_bytes(self, addr:int, size:int):
+        pass
+
+    @abc.abstractmethod
+    def write_bytes(self, addr:int, b) -> None:
+        pass
+
+class DolphinBackend(MemoryBackend):
+    def hook(self) -> bool:
+        if dme is None:
+            return False
+        dme.hook()
+        return dme.is_hooked()
 
-def write_bytes(addr, b):
-    dme.write_bytes(addr, b)
+    def is_hooked(self) -> bool:
+        return dme is not None and dme.is_hooked()
+
+    def unhook(self) -> None:
+        if dme is not None:
+            dme.un_hook()
+
+    def read_bytes(self, addr:int, size:int):
+        return dme.read_bytes(addr, size)
+
+    def write_bytes(self, addr:int, b) -> None:
+        dme.write_bytes(addr, bytes(b))
+
+class RamImageBackend(MemoryBackend):
+    # serves a MEM1 dump through mmap, reads are memoryviews into the mapping so nothing is copied
+    # writes land in a private copy of the mapping and never reach the file
+    MEM1_BASE = 0x80000000
+
+    def __init__(self, path:str) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        self._view = memoryview(self._mmap)
+
+    def _offset(self, addr:int, size:int) -> int:
+        # 0x80000000 (cached) and 0xC0000000 (uncached) both mirror physical address 0
+        offset = (addr & 0x3fffffff) if addr >= self.MEM1_BASE else addr
+        if offset < 0 or offset + size > len(self._view):
+            raise IndexError(f"{addr:#x}+{size:#x} is outside of {self.path}")
+        return offset
+
+    def hook(self) -> bool:
+        return True
+
+    def is_hooked(self) -> bool:
+        return True
+
+    def read_bytes(self, addr:int, size:int):
+        offset = self._offset(addr, size)
+        return self._view[offset:offset + size]
+
+    def write_bytes(self, addr:int, b) -> None:
+        offset = self._offset(addr, len(b))
+        self._view[offset:offset + len(b)] = b
+
+_backend = DolphinBackend()
+
+def get_backend() -> MemoryBackend:
+    return _backend
+
+def set_backend(backend:MemoryBackend) -> None:
+    global _backend
+    _backend = backend
+    connection.lost()
+
+class DolphinDisconnectedError(Exception):
+    pass
+
+class DolphinConnection:
+    # keeps a cached hooked state so accessors don't ask dolphin before every read,
+    # when the hook is lost a background thread retries with an increasing backoff
+    def __init__(self, min_backoff = 0.25, max_backoff = 4.0) -> None:
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self._hooked = False
+        self._hooked_event = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def hooked(self) -> bool:
+        return self._hooked
+
+    def start(self) -> None:
+        with self._lock:
+            if self._hooked or (self._thread is not None and self._thread.is_alive()):
+                return
+            self._thread = threading.Thread(target=self._reconnect, name="dolphin-reconnect", daemon=True)
+            self._thread.start()
+
+    def _reconnect(self) -> None:
+        backoff = self.min_backoff
+        while True:
+            start = perf_counter()
+            try:
+                hooked = get_backend().hook()
+            except RuntimeError:
+                hooked = False
+            io_stats.record("hook", "hook", 0, 0, perf_counter() - start, failed=not hooked)
+            if hooked:
+                self._hooked = True
+                self._hooked_event.set()
+                return
+            sleep(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def require(self) -> None:
+        if not self._hooked:
+            self.start()
+            raise DolphinDisconnectedError("Not hooked to Dolphin")
+
+    def wait(self, timeout = None) -> bool:
+        # blocks until the reconnect thread hooks, returns False if it didn't within timeout seconds
+        self.start()
+        return self._hooked_event.wait(timeout)
+
+    def lost(self) -> None:
+        self._hooked = False
+        self._hooked_event.clear()
+        self.start()
+
+    def unhook(self) -> None:
+        self._hooked = False
+        self._hooked_event.clear()
+        get_backend().unhook()
+
+connection = DolphinConnection()
+
+# the poller thread and the render loop share the backend, one request at a time
+io_lock = threading.RLock()
+
+class IOStats:
+    # counts every backend call by operation, accessor kind and 4KB address block, with a latency histogram per operation
+    LATENCY_BUCKETS_US = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000]
+    FRAME_HISTORY = 600
+
+    def __init__(self) -> None:
+        self.enabled = True
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls = Counter()
+            self.bytes = Counter()
+            self.failures = Counter()
+            self.seconds = Counter()
+            self.by_kind = Counter()
+            self.by_block = Counter()
+            self.latency = {}
+            self.frames = deque(maxlen=self.FRAME_HISTORY)
+            self._frame_calls = Counter()
+            self._frame_bytes = 0
+
+    def record(self, op:str, kind:str, addr:int, size:int, seconds:float, failed:bool = False) -> None:
+        if not self.enabled:
+            return
+
+        bucket = bisect_left(self.LATENCY_BUCKETS_US, seconds * 1e6)
+        with self._lock:
+            self.calls[op] += 1
+            self.bytes[op] += size
+            self.seconds[op] += seconds
+            self.by_kind[(op, kind)] += 1
+            self.by_block[(op, addr & ~0xfff)] += 1
+            self.latency.setdefault(op, [0] * (len(self.LATENCY_BUCKETS_US) + 1))[bucket] += 1
+            if failed:
+                self.failures[op] += 1
+            self._frame_calls[op] += 1
+            self._frame_bytes += size
+
+    def next_frame(self) -> None:
+        with self._lock:
+            self.frames.append((sum(self._frame_calls.values()), self._frame_bytes, dict(self._frame_calls)))
+            self._frame_calls = Counter()
+            self._frame_bytes = 0
+
+    def summary(self) -> dict:
+        with self._lock:
+            frame_calls = [f[0] for f in self.frames]
+            frame_bytes = [f[1] for f in self.frames]
+            labels = [f"<={b}us" for b in self.LATENCY_BUCKETS_US] + [f">{self.LATENCY_BUCKETS_US[-1]}us"]
+            return {
+                "calls": dict(self.calls),
+                "bytes": dict(self.bytes),
+                "failures": dict(self.failures),
+                "mean_latency_us": {op: self.seconds[op] / n * 1e6 for op, n in self.calls.items()},
+                "by_kind": {f"{op} {kind}": n for (op, kind), n in self.by_kind.most_common()},
+                "by_block": {f"{op} {block:#010x}": n for (op, block), n in self.by_block.most_common()},
+                "latency": {op: dict(zip(labels, counts)) for op, counts in self.latency.items()},
+                "frames": len(frame_calls),
+                "calls_per_frame": {
+                    "mean": sum(frame_calls) / len(frame_calls) if frame_calls else 0.0,
+                    "max": max(frame_calls, default=0),
+                },
+                "bytes_per_frame": {
+                    "mean": sum(frame_bytes) / len(frame_bytes) if frame_bytes else 0.0,
+                    "max": max(frame_bytes, default=0),
+                },
+            }
+
+    def dump(self, file = None) -> None:
+        print(json.dumps(self.summary(), indent=2), file=file if file is not None else sys.stdout)
+
+io_stats = IOStats()
+
+class FrameCache:
+    # bytes already fetched this frame, any read that falls inside one of them is answered locally
+    def __init__(self) -> None:
+        self._ranges = []
+
+    def add(self, addr:int, b) -> None:
+        self._ranges.append((addr, addr + len(b), b))
+
+    def get(self, addr:int, size:int):
+        for start, end, b in self._ranges:
+            if start <= addr and addr + size <= end:
+                return memoryview(b)[addr - start:addr - start + size]
+        return None
+
+    def invalidate(self, addr:int, size:int) -> None:
+        self._ranges = [r for r in self._ranges if r[1] <= addr or addr + size <= r[0]]
+
+_frame = threading.local()
+
+def begin_frame(seed = ()) -> None:
+    # every read on this thread until the next begin_frame/end_frame hits dolphin at most once per address,
+    # seed takes (address, bytes) pairs that were already read, e.g. DolphinSnapshot.raw
+    io_stats.next_frame()
+    cache = FrameCache()
+    for addr, b in seed:
+        cache.add(addr, b)
+    _frame.cache = cache
+
+def end_frame() -> None:
+    _frame.cache = None
+
+def read_bytes(addr, c:int, kind = "bytes"):
+    cache = getattr(_frame, "cache", None)
+    if cache is not None:
+        b = cache.get(addr, c)
+        if b is not None:
+            io_stats.record("cached_read", kind, addr, c, 0.0)
+            return b
+
+    connection.require()
+    start = perf_counter()
+    try:
+        with io_lock:
+            b = _backend.read_bytes(addr, c)
+    except RuntimeError as e:
+        io_stats.record("read", kind, addr, c, perf_counter() - start, failed=True)
+        connection.lost()
+        raise DolphinDisconnectedError(str(e)) from e
+    io_stats.record("read", kind, addr, c, perf_counter() - start)
+
+    if cache is not None:
+        cache.add(addr, b)
+    return b
+
+class WriteBatch:
+    # collects writes and sends them back to back, touching or overlapping writes become one write_bytes
+    def __init__(self) -> None:
+        self._writes = []
+
+    def add(self, addr:int, b) -> None:
+        self._writes.append((addr, bytes(b)))
+
+    def merged(self) -> list[tuple[int, bytes]]:
+        spans = []
+        for addr, b in sorted(self._writes, key=lambda w: w[0]):
+            if spans and addr <= spans[-1][1]:
+                spans[-1][1] = max(spans[-1][1], addr + len(b))
+            else:
+                spans.append([addr, addr + len(b)])
+
+        merged = []
+        for start, end in spans:
+            buffer = bytearray(end - start)
+            # applied in the order they were written so a later write to the same byte wins
+            for addr, b in self._writes:
+                if start <= addr < end:
+                    buffer[addr - start:addr - start + len(b)] = b
+            merged.append((start, bytes(buffer)))
+        return merged
+
+    def flush(self) -> None:
+        merged = self.merged()
+        self._writes = []
+        if len(merged) == 0:
+            return
+
+        connection.require()
+        try:
+            # hold the lock for the whole batch so the poller can't read between the writes
+            with io_lock:
+                for addr, b in merged:
+                    start = perf_counter()
+                    _backend.write_bytes(addr, b)
+                    io_stats.record("write", "batch", addr, len(b), perf_counter() - start)
+        except RuntimeError as e:
+            io_stats.record("write", "batch", addr, len(b), perf_counter() - start, failed=True)
+            connection.lost()
+            raise DolphinDisconnectedError(str(e)) from e
+
+@contextmanager
+def write_batch():
+    # every write on this thread inside the block is deferred and flushed together at the end,
+    # a nested batch hands its writes to the outer one
+    outer = getattr(_frame, "batch", None)
+    batch = WriteBatch()
+    _frame.batch = batch
+    try:
+        yield batch
+    finally:
+        _frame.batch = outer
+
+    if outer is not None:
+        outer._writes.extend(batch._writes)
+    else:
+        batch.flush()
+
+def write_bytes(addr, b, kind = "bytes"):
+    cache = getattr(_frame, "cache", None)
+    if cache is not None:
+        cache.invalidate(addr, len(b))
+
+    batch = getattr(_frame, "batch", None)
+    if batch is not None:
+        batch.add(addr, b)
+        return
+
+    connection.require()
+    start = perf_counter()
+    try:
+        with io_lock:
+            _backend.write_bytes(addr, b)
+    except RuntimeError as e:
+        io_stats.record("write", kind, addr, len(b), perf_counter() - start, failed=True)
+        connection.lost()
+        raise DolphinDisconnectedError(str(e)) from e
+    io_stats.record("write", kind, addr, len(b), perf_counter() - start)
+
+def _read_value(fmt:str, addr, kind:str):
+    s = get_struct(fmt)
+    return s.unpack_from(read_bytes(addr, s.size, kind))[0]
+
+def read_word(addr) -> int:
+    return _read_value(">I", addr, "word")
+
+def write_word(addr, v):
+    write_bytes(addr, get_struct(">I").pack(v & 0xffffffff), "word")
 
 def read_byte(addr) -> int:
-    hook()
-    return dme.read_byte(addr)
+    return _read_value(">B", addr, "byte")
 
 def write_byte(addr, v:int):
-    hook()
-    dme.write_byte(addr, v & 0xff)
+    write_bytes(addr, get_struct(">B").pack(v & 0xff), "byte")
 
 def read_bool(addr) -> bool:
     return read_byte(addr) != 0
@@ -41,59 +486,49 @@ def write_bool(addr, v:bool):
     write_byte(addr, 1 if v else 0)
 
 def read_half_word(addr) -> int:
-    hook()
-    return read_word(addr) >> 16
+    return _read_value(">H", addr, "half_word")
     
 def write_half_word(addr, v):
-    hook()
-    dme.write_byte(addr+0, v >> 8 & 0xff) 
-    dme.write_byte(addr+1, v & 0xff) 
+    write_bytes(addr, get_struct(">H").pack(v & 0xffff), "half_word")
 
 def read_float(addr) -> float:
-    hook()
-    return dme.read_float(addr)
+    return _read_value(">f", addr, "float")
 
 def write_float(addr, value):
-    hook()
-    dme.write_float(addr, value)
-
-def write_vec3(addr, value:Vector3):
-    hook()
-    dme.write_float(addr + 0, value.x)
-    dme.write_float(addr + 4, value.y)
-    dme.write_float(addr + 8, value.z)
+    write_bytes(addr, get_struct(">f").pack(value), "float")
 
 def read_vec3(addr)-> Vector3:
-    hook()
-    byte_output = read_bytes(addr, 0x4 * 0x3)
-    return Vector3(*floats_from_bytes(byte_output))
+    return Vector3(*VEC3_STRUCT.unpack_from(memoryview(read_bytes(addr, VEC3_STRUCT.size, "vec3"))))
 
 def write_vec3(addr, v: Vector3) -> None:
-    hook()
-    write_bytes(addr, bytes_from_floats(v.x, v.y, v.z))
+    write_bytes(addr, VEC3_STRUCT.pack(v.x, v.y, v.z), "vec3")
 
 def write_mat(addr, m:mat):
-    hook()
-    write_bytes(addr, bytes_from_floats(*m.all_values()))
+    write_bytes(addr, bytes_from_floats(*m.all_values()), "mat")
 
 def read_mat(addr, rows, columns):
-    b = read_bytes(addr, 4 * rows * columns)
-    floats = floats_from_bytes(b)
-    v = [[floats[a * columns + b] for b in range(columns)] for a in range(rows)]
-    return mat(v)
+    s = get_struct(f">{rows * columns}f")
+    floats = s.unpack_from(memoryview(read_bytes(addr, s.size, "mat")))
+    return mat([list(floats[a * columns:(a + 1) * columns]) for a in range(rows)])
 
 def is_hooked(): 
-    return dme.is_hooked()
+    return connection.hooked
 
 def hook():
-    while not is_hooked():
-        dme.hook()
+    # never blocks, raises DolphinDisconnectedError while a reconnect is pending
+    connection.require()
+
+def wait_hooked(timeout = 10.0):
+    # blocks until hooked, for scripts that can't do anything without dolphin
+    if not connection.wait(timeout):
+        raise DolphinDisconnectedError(f"Couldn't hook to Dolphin within {timeout:g}s, is the game running?")
 
 def unhook():
-    dme.unhook()
+    connection.unhook()
 
 
 class DolphinFloat():
+    _fmt = ">f"
 
     def __init__(self, address:int, struct_size = 4) -> None:
         self._addr = address
@@ -105,6 +540,9 @@ class DolphinFloat():
     def write(self, v:float, index = 0) -> None:
         write_float(self._addr + index * self._struct_size, v)
 
+    def decode(self, b, offset = 0) -> float:
+        return get_struct(self._fmt).unpack_from(b, offset)[0]
+
     @property
     def live_value(self) -> float:
         return self.read()
@@ -114,6 +552,7 @@ class DolphinFloat():
         self.write(v)
 
 class DolphinWord():
+    _fmt = ">I"
 
     def __init__(self, address:int, struct_size = 4) -> None:
         self._addr = address
@@ -125,6 +564,9 @@ class DolphinWord():
     def write(self, v:int, index = 0) -> None:
         write_word(self._addr + index * self._struct_size, v)
 
+    def decode(self, b, offset = 0) -> int:
+        return get_struct(self._fmt).unpack_from(b, offset)[0]
+
     @property
     def live_value(self) -> int:
         return self.read()
@@ -135,6 +577,7 @@ class DolphinWord():
 
 
 class DolphinHalfWord():
+    _fmt = ">H"
 
     def __init__(self, address:int, struct_size = 4) -> None:
         self._addr = address
@@ -146,6 +589,9 @@ class DolphinHalfWord():
     def write(self, v:int, index = 0) -> None:
         write_half_word(self._addr + index * self._struct_size, v)
 
+    def decode(self, b, offset = 0) -> int:
+        return get_struct(self._fmt).unpack_from(b, offset)[0]
+
     @property
     def live_value(self) -> int:
         return self.read()
@@ -156,6 +602,7 @@ class DolphinHalfWord():
 
 
 class DolphinBool():
+    _fmt = ">?"
 
     def __init__(self, address:int, struct_size = 1) -> None:
         self._addr = address
@@ -167,6 +614,9 @@ class DolphinBool():
     def write(self, v:bool, index = 0) -> None:
         write_bool(self._addr + index * self._struct_size, v)
 
+    def decode(self, b, offset = 0) -> bool:
+        return get_struct(self._fmt).unpack_from(b, offset)[0]
+
     @property
     def live_value(self) -> bool:
         return self.read()
@@ -177,6 +627,8 @@ class DolphinBool():
 
 
 class DolphinByte():
+    _fmt = ">B"
+
     def __init__(self, address:int, struct_size = 1) -> None:
         self._addr = address
         self._struct_size = struct_size
@@ -187,6 +639,9 @@ class DolphinByte():
     def write(self, v:int, index = 0) -> None:
         write_byte(self._addr + index * self._struct_size, v)
 
+    def decode(self, b, offset = 0) -> int:
+        return get_struct(self._fmt).unpack_from(b, offset)[0]
+
     @property
     def live_value(self) -> int:
         return self.read()
@@ -200,6 +655,7 @@ class DolphinMat():
         self._addr = address
         self._struct_size = struct_size
         self._dims = dims
+        self._fmt = f">{dims[0] * dims[1]}f"
 
     def read(self, index = 0) -> mat:
         return read_mat(self._addr + index * self._struct_size, self._dims[0], self._dims[1])
@@ -207,6 +663,14 @@ class DolphinMat():
     def write(self, v:mat, index = 0) -> None:
         write_mat(self._addr + index * self._struct_size, v)
 
+    def decode(self, b, offset = 0) -> mat:
+        rows, columns = self._dims
+        return self.convert(get_struct(self._fmt).unpack_from(b, offset))
+
+    def convert(self, floats) -> mat:
+        rows, columns = self._dims
+        return mat([list(floats[a * columns:(a + 1) * columns]) for a in range(rows)])
+
     @property
     def live_value(self) -> mat:
         return self.read()
@@ -216,6 +680,8 @@ class DolphinMat():
         self.write(v)
 
 class DolphinVec3:
+    _fmt = ">3f"
+
     def __init__(self, address:int, struct_size = 0xc) -> None:
         self._addr = address
         self._struct_size = struct_size
@@ -226,10 +692,145 @@ class DolphinVec3:
     def write(self, v:Vector3, index = 0) -> None:
         write_vec3(self._addr + index * self._struct_size, v)
 
+    def decode(self, b, offset = 0) -> Vector3:
+        return Vector3(*VEC3_STRUCT.unpack_from(b, offset))
+
+    def convert(self, floats) -> Vector3:
+        return Vector3(*floats)
+
     @property
     def live_value(self) -> Vector3:
         return self.read()
 
     @live_value.setter
     def live_value(self, v:Vector3) -> None:
-        self.write(v)
\ No newline at end of file
+        self.write(v)
+
+
+class DolphinArray:
+    # count elements spaced struct_size bytes apart, read with one read_bytes into a strided numpy view
+    _dtype = np.dtype(">u1")
+    _shape = ()
+
+    def __init__(self, address:int, count:int, struct_size:int = None) -> None:
+        self._addr = address
+        self._count = count
+        self._element_size = self._dtype.itemsize * int(np.prod(self._shape))
+        self._struct_size = self._element_size if struct_size is None else struct_size
+        self._fmt = f">{self.nbytes}s"
+
+    @property
+    def nbytes(self) -> int:
+        return (self._count - 1) * self._struct_size + self._element_size if self._count > 0 else 0
+
+    def _view(self, b, offset = 0) -> np.ndarray:
+        inner_strides = tuple(self._dtype.itemsize * int(np.prod(self._shape[i+1:])) for i in range(len(self._shape)))
+        return np.ndarray((self._count,) + self._shape, dtype=self._dtype, buffer=b, offset=offset, strides=(self._struct_size,) + inner_strides)
+
+    def decode(self, b, offset = 0) -> np.ndarray:
+        a = self._view(b, offset)
+        # the buffer may be dolphin's memory image, don't let callers write through it
+        a.flags.writeable = False
+        return a
+
+    def convert(self, b) -> np.ndarray:
+        return self.decode(b)
+
+    def read(self) -> np.ndarray:
+        return self.decode(read_bytes(self._addr, self.nbytes, "array"))
+
+    def write(self, values) -> None:
+        if self._struct_size == self._element_size:
+            b = np.ascontiguousarray(values, dtype=self._dtype).reshape((self._count,) + self._shape).tobytes()
+        else:
+            # keep the bytes between elements intact
+            b = bytearray(read_bytes(self._addr, self.nbytes, "array"))
+            self._view(b)[...] = values
+        write_bytes(self._addr, b, "array")
+
+    @property
+    def live_value(self) -> np.ndarray:
+        return self.read()
+
+    @live_value.setter
+    def live_value(self, v) -> None:
+        self.write(v)
+
+class DolphinFloatArray(DolphinArray):
+    _dtype = np.dtype(">f4")
+
+class DolphinVec3Array(DolphinArray):
+    _dtype = np.dtype(">f4")
+    _shape = (3,)
+
+# reads a table of Dolphin* accessors with one read_bytes per contiguous range,
+# accessors closer than max_gap bytes share a range and are decoded locally
+class DolphinSnapshot:
+
+    def __init__(self, accessors:dict, max_gap = 0x1000) -> None:
+        self._accessors = accessors
+        self._max_gap = max_gap
+        self._ranges = self._build_ranges()
+        # (address, bytes) of every range from the last read, can seed a FrameCache
+        self.raw = []
+
+    def _build_ranges(self) -> list:
+        fields = sorted(((a._addr, struct.calcsize(a._fmt), name, a) for name, a in self._accessors.items()), key=lambda f: f[0])
+
+        ranges = []
+        for addr, size, name, accessor in fields:
+            if ranges and addr - (ranges[-1][0] + ranges[-1][1]) <= self._max_gap:
+                start, _, members = ranges[-1]
+                ranges[-1] = (start, max(ranges[-1][1], addr + size - start), members)
+            else:
+                ranges.append((addr, size, []))
+                members = ranges[-1][2]
+            members.append((name, addr - ranges[-1][0], accessor))
+
+        return [(start, size) + self._compile_range(size, members) for start, size, members in ranges]
+
+    def _compile_range(self, size, members) -> tuple:
+        # one RecordLayout per range, names that alias the same field share it,
+        # anything overlapping a different field is decoded on its own
+        layout_fields = []
+        aliases = []
+        overlapping = []
+        seen = {}
+        end = 0
+        for name, offset, accessor in members:
+            key = (offset, accessor._fmt)
+            if key not in seen:
+                if offset < end:
+                    overlapping.append((name, offset, accessor))
+                    continue
+                seen[key] = name
+                layout_fields.append((name, offset, accessor._fmt))
+                end = offset + struct.calcsize(accessor._fmt)
+            aliases.append((name, seen[key], getattr(accessor, "convert", None)))
+
+        return RecordLayout(layout_fields, size), aliases, overlapping
+
+    def rebuild(self) -> None:
+        # after the accessors were moved to other addresses
+        self._ranges = self._build_ranges()
+
+    @property
+    def ranges(self) -> list[tuple[int, int]]:
+        return [(start, size) for start, size, _, _, _ in self._ranges]
+
+    def read(self) -> dict:
+        hook()
+
+        values = {}
+        buffers = []
+        for start, size, layout, aliases, overlapping in self._ranges:
+            b = memoryview(read_bytes(start, size, "snapshot"))
+            buffers.append((start, b))
+            raw = layout.decode(b)
+            for name, key, convert in aliases:
+                values[name] = raw[key] if convert is None else convert(raw[key])
+            for name, offset, accessor in overlapping:
+                values[name] = accessor.decode(b, offset)
+
+        self.raw = buffers
+        return values
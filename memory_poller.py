@@ -0,0 +1,77 @@
+import queue
+import threading
+from collections import namedtuple
+from time import perf_counter, sleep
+from memory_engine import DolphinSnapshot, DolphinDisconnectedError
+
+# name changed from previous to value at time (perf_counter seconds)
+# values is the whole watch set at that sample, captured is the capture snapshot taken on the same sample
+PollEvent = namedtuple("PollEvent", ["time", "name", "value", "previous", "values", "captured"])
+
+class MemoryPoller:
+    # samples a watch snapshot on its own thread at a fixed rate, so one-frame flags are seen no matter how long a draw takes
+    # when a name in capture_on becomes truthy the capture snapshot is read right away, on the same sample
+    def __init__(self, watch:DolphinSnapshot, rate:float = 240.0, capture:DolphinSnapshot = None, capture_on = ()) -> None:
+        self.watch = watch
+        self.rate = rate
+        self.capture = capture
+        self.capture_on = set(capture_on)
+
+        self.events = queue.SimpleQueue()
+        self.values = {}
+
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="memory-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def drain(self) -> list[PollEvent]:
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def poll(self) -> None:
+        now = perf_counter()
+        values = self.watch.read()
+
+        changed = [k for k, v in values.items() if self.values.get(k, None) != v]
+        captured = None
+        if self.capture is not None and any(values[k] for k in changed if k in self.capture_on):
+            captured = self.capture.read()
+
+        for k in changed:
+            self.events.put(PollEvent(now, k, values[k], self.values.get(k, None), values, captured))
+
+        self.values = values
+
+    def _run(self) -> None:
+        period = 1.0 / self.rate
+        next_poll = perf_counter()
+
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except DolphinDisconnectedError:
+                # the connection reconnects on its own, just keep the schedule
+                pass
+
+            next_poll += period
+            now = perf_counter()
+            if next_poll < now:
+                # fell behind, don't try to catch up with a burst of reads
+                next_poll = now
+            else:
+                sleep(next_poll - now)
@@ -0,0 +1,127 @@
+import argparse
+from collections import Counter
+from time import perf_counter, sleep
+import numpy as np
+from memory_engine import DolphinBool, DolphinWord, DolphinSnapshot, DolphinDisconnectedError, read_bytes
+
+# edges that mark an event, name: (accessor, test on (previous, current))
+EVENTS = {
+    "contact": (DolphinBool(0x808909a1), lambda p, c: c and not p),
+    "missed_ball": (DolphinBool(0x80890b18), lambda p, c: c and not p),
+    "hit_by_pitch": (DolphinBool(0x808909a3), lambda p, c: c and not p),
+    "out": (DolphinWord(0x80892970), lambda p, c: c != p),
+}
+
+class MemoryScanner:
+    # snapshots a RAM window every step and counts, per byte, how often it changed on event steps and on quiet steps,
+    # bytes that change with an event and rarely otherwise are the candidates for a new field
+    def __init__(self, start:int = 0x80890000, end:int = 0x80894000) -> None:
+        self.start = start
+        self.end = end
+        self.reset()
+
+    def reset(self) -> None:
+        size = self.end - self.start
+        self.previous = None
+        self.current = None
+        self.event_changes = {}
+        self.event_steps = Counter()
+        self.event_values = {}
+        self.idle_changes = np.zeros(size, dtype=np.uint32)
+        self.idle_steps = 0
+
+    def capture(self) -> np.ndarray:
+        return np.frombuffer(read_bytes(self.start, self.end - self.start, "scan"), dtype=np.uint8).copy()
+
+    def step(self, events = (), snapshot:np.ndarray = None) -> np.ndarray:
+        # events are the names of the events that happened between the previous step and this one
+        self.previous, self.current = self.current, self.capture() if snapshot is None else snapshot
+        if self.previous is None:
+            return np.zeros(self.current.shape, dtype=bool)
+
+        changed = self.current != self.previous
+        if len(events) == 0:
+            self.idle_changes += changed
+            self.idle_steps += 1
+            return changed
+
+        for e in events:
+            self.event_changes.setdefault(e, np.zeros(self.current.shape, dtype=np.uint32))
+            self.event_changes[e] += changed
+            self.event_steps[e] += 1
+            self.event_values[e] = (self.previous, self.current)
+        return changed
+
+    def report(self, event:str, min_event_rate = 0.9, max_idle_rate = 0.05, limit = 50) -> list[dict]:
+        # runs of neighbouring candidate bytes are merged into one entry
+        if self.event_steps[event] == 0:
+            return []
+
+        event_rate = self.event_changes[event] / self.event_steps[event]
+        idle_rate = self.idle_changes / max(self.idle_steps, 1)
+        candidates = np.flatnonzero((event_rate >= min_event_rate) & (idle_rate <= max_idle_rate))
+        if len(candidates) == 0:
+            return []
+
+        run_starts = np.flatnonzero(np.diff(candidates, prepend=-2) != 1)
+        run_ends = np.append(run_starts[1:], len(candidates))
+        before, after = self.event_values[event]
+
+        found = []
+        for s, e in zip(run_starts, run_ends):
+            first, last = candidates[s], candidates[e - 1] + 1
+            found.append({
+                "address": self.start + int(first),
+                "size": int(last - first),
+                "event_rate": float(event_rate[first:last].min()),
+                "idle_rate": float(idle_rate[first:last].max()),
+                "before": bytes(before[first:last]).hex(),
+                "after": bytes(after[first:last]).hex(),
+            })
+
+        found.sort(key=lambda f: f["event_rate"] - f["idle_rate"], reverse=True)
+        return found[:limit]
+
+def main():
+    parser = argparse.ArgumentParser(description="Find addresses that change together with a game event")
+    parser.add_argument("--start", type=lambda v: int(v, 0), default=0x80890000)
+    parser.add_argument("--end", type=lambda v: int(v, 0), default=0x80894000)
+    parser.add_argument("--rate", type=float, default=60.0, help="snapshots per second")
+    parser.add_argument("--seconds", type=float, default=None, help="stop after this long, otherwise stop with ctrl-c")
+    parser.add_argument("--min-event-rate", type=float, default=0.9)
+    parser.add_argument("--max-idle-rate", type=float, default=0.05)
+    args = parser.parse_args()
+
+    scanner = MemoryScanner(args.start, args.end)
+    watch = DolphinSnapshot({name: accessor for name, (accessor, _) in EVENTS.items()})
+
+    last_values = None
+    started = perf_counter()
+    try:
+        while args.seconds is None or perf_counter() - started < args.seconds:
+            try:
+                values = watch.read()
+                snapshot = scanner.capture()
+            except DolphinDisconnectedError:
+                sleep(0.5)
+                continue
+
+            events = []
+            if last_values is not None:
+                events = [name for name, (_, test) in EVENTS.items() if test(last_values[name], values[name])]
+            last_values = values
+
+            scanner.step(events, snapshot)
+            if events:
+                print(f"{', '.join(events)} ({scanner.idle_steps} quiet steps so far)")
+            sleep(1 / args.rate)
+    except KeyboardInterrupt:
+        pass
+
+    for name in EVENTS:
+        print(f"\n{name}: {scanner.event_steps[name]} events")
+        for f in scanner.report(name, args.min_event_rate, args.max_idle_rate):
+            print(f"  {f['address']:#010x} +{f['size']}  changed on {f['event_rate']:.0%} of events, {f['idle_rate']:.1%} otherwise  {f['before']} -> {f['after']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+import argparse
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from batch_batting import ANGLE_RANGES, hit_ball_batch
+from calc_batting import BattingCalculator, HitRequest, STATS, BATTER_HITBOXES, BATTING_REACHES, SLAP, CHARGE, RIGHTY, LEFTY, PUSHPULL_NONE, PUSHPULL_PULL, PUSHPULL_PUSH
+
+# one record per batter, handedness, slap/charge, pitch type, stick up/down, stick left/right, contact frame and contact zone,
+# for a batter without stars, chem or easy batting. both hands are generated, a lefty reaches and makes contact differently
+# angles and power are exact. frames, distance and landing come from the swings at those extremes so they can be a little off,
+# in random swings of every batter frames went at most 1 past their range and distance and landing at most 0.87
+AXES = ("batter_id", "handedness", "hit_type", "pitch_type", "stick_vertical", "stick_horizontal", "frame", "contact_zone")
+SHAPE = (len(STATS), 2, 2, 4, 3, 3, ANGLE_RANGES.shape[2], 5)
+# so the frames, distance and landing ranges only hold within this much, widen them by it before ruling a swing out
+RANGE_MARGIN = 1.0
+
+OUTCOME_DTYPE = np.dtype([
+    ("count", np.uint32),
+    ("vertical_weights", np.uint8, (5,)),
+    ("horizontal_angle", np.int16, (2,)),
+    ("vertical_angle", np.int16, (2,)),
+    ("power", np.int16, (2,)),
+    ("frames", np.int16, (2,)),
+    ("distance", np.float32, (2,)),
+    ("landing_x", np.float32, (2,)),
+    ("landing_z", np.float32, (2,)),
+])
+RANGE_FIELDS = [name for name in OUTCOME_DTYPE.names if OUTCOME_DTYPE[name].shape == (2,)]
+
+TABLE_FILE = "outcome_table.npy"
+
+# the pitchers with the weakest and strongest cursed ball bound its power debuff
+CURSED_BALL_PITCHERS = [min(range(len(STATS)), key=lambda i: STATS[i]["Cursed Ball"]), max(range(len(STATS)), key=lambda i: STATS[i]["Cursed Ball"])]
+# horizontal angles where the field bonus or the curve bends
+HORIZONTAL_KNOTS = np.array([0x200, 0x300, 0x400, 0x460, 0x500, 0x600])
+# vertical angles where the angle folds over or the curve bends, and the steepest climb
+VERTICAL_KNOTS = np.array([-0x401, -0x400, -1, 0, 0x180, 0x200, 0x400, 0x401])
+VERTICAL_SAMPLES = 5
+# rolled rand_1 values are searched above the widest horizontal range, so rand_3 = rolled - rand_1 stays positive
+ROLL_SEARCH = np.arange(0x200, 0x200 + (1 << 15))
+
+def stick_axes(stick_up = False, stick_down = False, stick_left = False, stick_right = False) -> tuple:
+    # (stick_vertical, stick_horizontal) indices, up beats down and right beats left like in the game
+    return (1 if stick_up else 2 if stick_down else 0), (2 if stick_right else 1 if stick_left else 0)
+
+def _contact_samples(batter_id, hit_type, charge_up, handedness = RIGHTY):
+    # ball_x of the lowest and highest contact and contact quality in every zone, the zone edges are solved from the thresholds
+    c = BattingCalculator(HitRequest(batter_id=batter_id, hit_type=hit_type, charge_up=charge_up, handedness=handedness))
+    c.calculateSharedStages()
+    contact = c.Display_Output["Contact"]
+    hitbox = BATTER_HITBOXES[batter_id]
+    low, high = BATTING_REACHES[c.inMemBatter.AtBat_TrimmedBat]
+
+    def zones(ball_x):
+        return hit_ball_batch(batter_id=batter_id, hit_type=hit_type, charge_up=charge_up, handedness=handedness, ball_x=ball_x, rand_1=0)
+
+    # perfect contact peaks at 100
+    edges = np.array([contact[k] for k in ["LeftNiceThreshold", "LeftPerfectThreshold", "RightPerfectThreshold", "RightNiceThreshold"]] + [100.0])
+    edges = (edges - 100.0) / 100.0 * np.where(edges >= 100.0, hitbox["HorizontalRangeFar"], -hitbox["HorizontalRangeNear"])
+    # a lefty's contact is measured the other way along the bat, but the reach isn't
+    if handedness == LEFTY:
+        edges = -edges
+    ball_x = np.concatenate([np.linspace(low, high, 129), edges, np.nextafter(edges, -np.inf), np.nextafter(edges, np.inf)])
+    ball_x = np.unique(ball_x[(low <= ball_x) & (ball_x <= high)])
+
+    # the best contact of a zone is right at its edge, which the solved edges can miss by rounding,
+    # so every zone change is bisected down to the last ball_x before it and the first after it
+    zone = zones(ball_x)["contact_zone"]
+    change = np.flatnonzero(zone[1:] != zone[:-1])
+    before, after, zone = ball_x[change], ball_x[change + 1], zone[change]
+    while True:
+        apart = np.nextafter(before, np.inf) < after
+        if not apart.any():
+            break
+        middle = (before + after) / 2
+        same = zones(middle)["contact_zone"] == zone
+        before = np.where(apart & same, middle, before)
+        after = np.where(apart & ~same, middle, after)
+    ball_x = np.concatenate([ball_x, before, after])
+
+    rows = zones(ball_x)
+    samples = []
+    for zone in range(5):
+        in_zone = np.flatnonzero(rows["contact_zone"] == zone)
+        if not len(in_zone):
+            samples.append(np.zeros(0))
+            continue
+        picks = [np.argmin(rows["absolute_contact"][in_zone]), np.argmax(rows["absolute_contact"][in_zone]),
+                 np.argmin(rows["contact_quality"][in_zone]), np.argmax(rows["contact_quality"][in_zone])]
+        samples.append(np.unique(ball_x[in_zone[picks]]))
+    return samples
+
+def _vertical_shape(batter_id, hit_type, charge_up, pitch_type, stick_vertical, ball_x, handedness = RIGHTY):
+    up, down = stick_vertical == 1, stick_vertical == 2
+    c = BattingCalculator(HitRequest(batter_id=batter_id, hit_type=hit_type, charge_up=charge_up, pitch_type=pitch_type, stick_up=up, stick_down=down,
+                                     ball_x=ball_x, handedness=handedness))
+    c.calculateSharedStages()
+    c.calculateVerticalAngle()
+    return c.Display_Output["Vertical Details"]
+
+def _spread(low, high):
+    # offsets into a vertical range, evenly spread and at the knots
+    span = max(high - low, 1)
+    knots = VERTICAL_KNOTS - low
+    return np.unique(np.concatenate([np.linspace(0, span - 1, VERTICAL_SAMPLES).round().astype(np.int64), knots[(0 <= knots) & (knots < span)]]))
+
+def _rolled_targets(details):
+    # rolled rand_1 values that give the low, high and in between angles of every zone that can be rolled
+    weights = np.array(details["Weights"])
+    zones = np.array(details["Zones"])
+    zone = np.searchsorted(np.cumsum(weights), ROLL_SEARCH % weights.sum(), side="right")
+    offset = ROLL_SEARCH % np.maximum(zones[zone, 1] - zones[zone, 0], 1)
+
+    targets = []
+    for z in np.flatnonzero(weights):
+        # the roll picks both the zone and the angle in it, so a zone can't reach every angle in its range,
+        # the reachable angles closest to every spread one on either side are taken, the lowest and highest included
+        reachable, first = np.unique(offset[zone == z], return_index=True)
+        at = np.searchsorted(reachable, _spread(zones[z, 0], zones[z, 1]))
+        picks = np.unique(np.clip(np.concatenate([at - 1, at, [0, len(reachable) - 1]]), 0, len(reachable) - 1))
+        targets.extend(ROLL_SEARCH[zone == z][first[picks]])
+    return np.array(targets, dtype=np.int64)
+
+def _horizontal_targets(hit_type, stick_horizontal, frame, handedness = RIGHTY):
+    # rand_1 offsets at both ends of the range and where the field bonus or curve bends,
+    # a lefty's angle is mirrored after the range is rolled so the bends are at the same offsets
+    directions = [PUSHPULL_NONE, PUSHPULL_PULL, PUSHPULL_PUSH] if handedness == RIGHTY else [PUSHPULL_NONE, PUSHPULL_PUSH, PUSHPULL_PULL]
+    direction = directions[stick_horizontal]
+    low, high = ANGLE_RANGES[direction, int(hit_type != SLAP), frame]
+    width = abs(high - low)
+    knots = HORIZONTAL_KNOTS - low - 0x400
+    return np.unique(np.concatenate([[0, max(width - 1, 0)], knots[(0 <= knots) & (knots < width)]])), max(width, 1)
+
+def generate_batter(batter_id, handedness = RIGHTY) -> np.ndarray:
+    """ The records of one batter batting with handedness, shaped like SHAPE[2:]. """
+    out = np.zeros(SHAPE[2:], dtype=OUTCOME_DTYPE)
+    columns = {k: [] for k in ["slot", "hit_type", "charge_up", "charge_down", "pitcher_id", "pitch_type", "stick_up", "stick_down",
+                                 "stick_left", "stick_right", "frame", "ball_x", "rand_1", "rand_3"]}
+
+    def add(slot, rand_1, rand_3, ball_xs, charge_downs, **fixed):
+        # the rand pairs for every ball_x, charge_down and cursed ball pitcher
+        for ball_x in ball_xs:
+            for charge_down in charge_downs:
+                for pitcher_id in CURSED_BALL_PITCHERS:
+                    for k, v in dict(fixed, slot=slot, ball_x=ball_x, charge_down=charge_down, pitcher_id=pitcher_id).items():
+                        columns[k].append(np.full(len(rand_1), v))
+                    columns["rand_1"].append(rand_1)
+                    columns["rand_3"].append(rand_3)
+
+    for h, hit_type in enumerate([SLAP, CHARGE]):
+        charge_up = 0.0 if hit_type == SLAP else 1.0
+        charge_downs = [0.0] if hit_type == SLAP else [0.0, 1.0]
+        contact = _contact_samples(batter_id, hit_type, charge_up, handedness)
+        for pitch_type in range(SHAPE[3]):
+            for stick_vertical in range(3):
+                for zone in range(5):
+                    if not len(contact[zone]):
+                        continue
+
+                    details = _vertical_shape(batter_id, hit_type, charge_up, pitch_type, stick_vertical, contact[zone][0], handedness)
+                    rolled = len(details["Zones"]) > 1 and abs(sum(details["Weights"])) >= 2
+                    if rolled:
+                        out[h, pitch_type, stick_vertical, :, :, zone]["vertical_weights"] = details["Weights"]
+                        targets = _rolled_targets(details)
+                    else:
+                        low, high = details["Zones"][details["Selected Zone"]]
+
+                    for stick_horizontal in range(3):
+                        for frame in range(SHAPE[6]):
+                            slot = np.ravel_multi_index((h, pitch_type, stick_vertical, stick_horizontal, frame, zone), SHAPE[2:])
+                            offsets, width = _horizontal_targets(hit_type, stick_horizontal, frame, handedness)
+                            if rolled:
+                                rand_1 = np.repeat(offsets, len(targets))
+                                rand_3 = np.tile(targets, len(offsets)) - rand_1
+                            else:
+                                # without a roll both angles come from rand_1, keep the ones at an edge of either range
+                                r1 = np.arange(1 << 15)
+                                _, first = np.unique((r1 % width) * 0x1000 + r1 % max(high - low, 1), return_index=True)
+                                r1 = r1[first]
+                                rand_1 = r1[np.isin(r1 % width, offsets) | np.isin(r1 % max(high - low, 1), _spread(low, high))]
+                                rand_3 = np.zeros_like(rand_1)
+
+                            add(slot, rand_1, rand_3, contact[zone], charge_downs, hit_type=hit_type, charge_up=charge_up,
+                                pitch_type=pitch_type, stick_up=stick_vertical == 1, stick_down=stick_vertical == 2,
+                                stick_left=stick_horizontal == 1, stick_right=stick_horizontal == 2, frame=frame)
+
+    columns = {k: np.concatenate(v) for k, v in columns.items()}
+    slot = columns.pop("slot")
+    rows = hit_ball_batch(batter_id=batter_id, handedness=handedness, rand_2=0, **columns)
+    slot, rows = slot[rows["valid"]], rows[rows["valid"]]
+
+    flat = out.reshape(-1)
+    flat["count"] = np.bincount(slot, minlength=len(flat))
+    values = {
+        "horizontal_angle": rows["horizontal_angle"], "vertical_angle": rows["vertical_angle"], "power": rows["power"], "frames": rows["frames"],
+        "distance": rows["distance"], "landing_x": rows["landing"][:, 0], "landing_z": rows["landing"][:, 2],
+    }
+    for name, v in values.items():
+        low = np.full(len(flat), np.inf)
+        high = np.full(len(flat), -np.inf)
+        np.minimum.at(low, slot, v)
+        np.maximum.at(high, slot, v)
+        empty = flat["count"] == 0
+        flat[name] = np.stack([np.where(empty, 0, low), np.where(empty, 0, high)], axis=1)
+    return out
+
+def generate(path = TABLE_FILE, batters = None, workers = None):
+    """ Writes the records of batters (default all) into path, other batters already in the file are kept. """
+    if os.path.exists(path):
+        table = np.load(path, mmap_mode="r+")
+        if table.shape != SHAPE or table.dtype != OUTCOME_DTYPE:
+            raise ValueError(f"{path} has a different layout, delete it to regenerate")
+    else:
+        table = np.lib.format.open_memmap(path, mode="w+", dtype=OUTCOME_DTYPE, shape=SHAPE)
+
+    batters = range(SHAPE[0]) if batters is None else batters
+    jobs = [(batter_id, handedness) for batter_id in batters for handedness in (RIGHTY, LEFTY)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for (batter_id, handedness), records in zip(jobs, executor.map(generate_batter, *zip(*jobs))):
+            table[batter_id, handedness] = records
+            table.flush()
+            hand = "righty" if handedness == RIGHTY else "lefty"
+            print(f"batter {batter_id} {STATS[batter_id]['Name']} {hand}: {np.count_nonzero(records['count'])} records")
+
+class OutcomeTable:
+    def __init__(self, path = TABLE_FILE) -> None:
+        self.table = np.load(path, mmap_mode="r")
+
+    def _select(self, selection):
+        unknown = set(selection) - set(AXES)
+        if unknown:
+            raise TypeError(f"unknown axes {', '.join(sorted(unknown))}")
+
+        # each axis takes an index, a list of them or None for all
+        index = [np.atleast_1d(selection[a]) if selection.get(a) is not None else np.arange(n) for a, n in zip(AXES, SHAPE)]
+        return self.table[np.ix_(*index)].reshape(-1)
+
+    def lookup(self, batter_id, hit_type, pitch_type, stick_vertical, stick_horizontal, frame, contact_zone, handedness = RIGHTY) -> dict:
+        """ The ranges of one swing, None when it can't make that contact. """
+        record = self.table[batter_id, handedness, hit_type, pitch_type, stick_vertical, stick_horizontal, frame, contact_zone]
+        if record["count"] == 0:
+            return None
+        return {name: tuple(record[name].tolist()) for name in RANGE_FIELDS} | {"vertical_weights": record["vertical_weights"].tolist()}
+
+    def envelope(self, **selection) -> dict:
+        """ The ranges covering every swing in the selection, the axes are the names in AXES. None when nothing matches. """
+        records = self._select(selection)
+        records = records[records["count"] > 0]
+        if not len(records):
+            return None
+        ranges = {name: (records[name][:, 0].min().item(), records[name][:, 1].max().item()) for name in RANGE_FIELDS}
+        return ranges | {"count": int(records["count"].sum())}
+
+def main():
+    parser = argparse.ArgumentParser(description="Generates the per character outcome table, or queries it")
+    parser.add_argument("--table", default=TABLE_FILE)
+    parser.add_argument("--batters", type=int, nargs="*", help="only (re)generate these batters")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--envelope", nargs="*", metavar="AXIS=INDEX", help=f"print the envelope of a selection, axes are {', '.join(AXES)}")
+    args = parser.parse_args()
+
+    if args.envelope is not None:
+        selection = {k: [int(i) for i in v.split(",")] for k, v in (a.split("=") for a in args.envelope)}
+        print(OutcomeTable(args.table).envelope(**selection))
+        return
+
+    generate(args.table, args.batters, args.workers)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+import json
+import sys
+from multiprocessing import shared_memory
+from time import sleep
+from memory_engine import RecordLayout, get_struct
+
+# shared memory layout
+#   header: magic, version, slot count, slot size, layout json length, then the sequence of the newest record
+#   layout: the RecordLayout fields as json, so a consumer needs nothing but the name
+#   slots:  a ring of [slot sequence (Q)][record], the slot sequence is odd while the record is being written
+MAGIC = b"RIOV"
+VERSION = 1
+HEADER = get_struct(">4sIIII4xQ")
+SEQUENCE_OFFSET = HEADER.size - 8
+SEQUENCE = get_struct(">Q")
+
+def layout_from_accessors(*tables, extra_fields = ()) -> RecordLayout:
+    # packs every accessor of the tables one after another, names seen twice are only stored once
+    fields = []
+    offset = 0
+    for name, fmt in list(extra_fields) + [(name, a._fmt) for table in tables for name, a in table.items()]:
+        if any(f[0] == name for f in fields):
+            continue
+        fields.append((name, offset, fmt))
+        offset += get_struct(fmt).size
+    return RecordLayout(fields)
+
+def _align(n:int) -> int:
+    return (n + 7) & ~7
+
+def _attach(name:str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        # before python 3.13 attaching registers the segment, which would unlink it when this process exits
+        from multiprocessing import resource_tracker
+        shm = shared_memory.SharedMemory(name)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+class SnapshotPublisher:
+    # writes each snapshot into a ring buffer in shared memory, readers never block the writer
+    def __init__(self, name:str, layout:RecordLayout, slots:int = 64) -> None:
+        self.layout = layout
+        self.slots = slots
+
+        layout_json = json.dumps(layout.fields).encode()
+        self._slot_size = _align(SEQUENCE.size + layout.size)
+        self._slots_offset = _align(HEADER.size + len(layout_json))
+
+        size = self._slots_offset + slots * self._slot_size
+        try:
+            self._shm = shared_memory.SharedMemory(name, create=True, size=size)
+            self.sequence = 0
+        except FileExistsError:
+            # left behind by a run that didn't close, readers may still be attached
+            # so carry on from its newest record instead of replacing it
+            self._shm = _attach(name)
+            self.sequence = self._resume(layout_json, size)
+
+        self._buf = self._shm.buf
+        self._buf[HEADER.size:HEADER.size + len(layout_json)] = layout_json
+        HEADER.pack_into(self._buf, 0, MAGIC, VERSION, slots, self._slot_size, len(layout_json), self.sequence)
+
+    def _resume(self, layout_json:bytes, size:int) -> int:
+        header = HEADER.unpack_from(self._shm.buf, 0) if self._shm.size >= HEADER.size else None
+        if (header is None or header[:5] != (MAGIC, VERSION, self.slots, self._slot_size, len(layout_json))
+                or bytes(self._shm.buf[HEADER.size:HEADER.size + len(layout_json)]) != layout_json or self._shm.size < size):
+            name = self._shm.name
+            self._shm.close()
+            raise FileExistsError(f"{name} already exists and isn't a snapshot buffer with this layout, "
+                                  "close whatever made it or set another snapshot_name")
+        return header[5]
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def publish(self, values:dict) -> int:
+        self.sequence += 1
+        slot = self._slots_offset + ((self.sequence - 1) % self.slots) * self._slot_size
+
+        SEQUENCE.pack_into(self._buf, slot, 2 * self.sequence - 1)
+        self.layout.encode_into(self._buf, slot + SEQUENCE.size, values)
+        SEQUENCE.pack_into(self._buf, slot, 2 * self.sequence)
+
+        SEQUENCE.pack_into(self._buf, SEQUENCE_OFFSET, self.sequence)
+        return self.sequence
+
+    def close(self) -> None:
+        self._buf = None
+        self._shm.close()
+        self._shm.unlink()
+
+class SnapshotSubscriber:
+    def __init__(self, name:str) -> None:
+        self._shm = _attach(name)
+        self._buf = self._shm.buf
+        magic, version, self.slots, self._slot_size, layout_length, _ = HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{name} is not a version {VERSION} snapshot buffer")
+
+        fields = json.loads(bytes(self._buf[HEADER.size:HEADER.size + layout_length]))
+        self.layout = RecordLayout([tuple(f) for f in fields])
+        self._slots_offset = _align(HEADER.size + layout_length)
+
+    @property
+    def sequence(self) -> int:
+        return SEQUENCE.unpack_from(self._buf, SEQUENCE_OFFSET)[0]
+
+    def read(self, sequence:int):
+        # None if the record was never written or has been overwritten
+        if sequence < 1 or sequence > self.sequence or self.sequence - sequence >= self.slots:
+            return None
+
+        slot = self._slots_offset + ((sequence - 1) % self.slots) * self._slot_size
+        while True:
+            before = SEQUENCE.unpack_from(self._buf, slot)[0]
+            if before != 2 * sequence:
+                if before > 2 * sequence:
+                    return None
+                continue
+            values = self.layout.decode(self._buf, slot + SEQUENCE.size)
+            if SEQUENCE.unpack_from(self._buf, slot)[0] == before:
+                return values
+
+    def latest(self):
+        while True:
+            sequence = self.sequence
+            if sequence == 0:
+                return 0, None
+            values = self.read(sequence)
+            if values is not None:
+                return sequence, values
+
+    def close(self) -> None:
+        self._buf = None
+        self._shm.close()
+
+if __name__ == "__main__":
+    # prints every new snapshot, as an example consumer
+    subscriber = SnapshotSubscriber(sys.argv[1] if len(sys.argv) > 1 else "rio_visualizer")
+    last = subscriber.sequence
+    while True:
+        sequence = subscriber.sequence
+        for s in range(max(last + 1, sequence - subscriber.slots + 1), sequence + 1):
+            values = subscriber.read(s)
+            if values is not None:
+                print(s, values)
+        last = sequence
+        sleep(1 / 120)
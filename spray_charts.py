@@ -0,0 +1,74 @@
+import argparse
+import os
+import numpy as np
+from batch_batting import CONTACT_FRAMES, hit_ball_batch
+from calc_batting import STATS, BATTER_HITBOXES, BATTING_REACHES, SLAP, CHARGE, RIGHTY, LEFTY
+
+# the part of the field the horizontal view shows, (x_min, x_max, z_min, z_max), one bin per unit
+EXTENT = (-60.0, 60.0, -6.0, 114.0)
+BINS = (120, 120)
+SPRAY_DIR = "spray_charts"
+SAMPLES = 1 << 21
+CHUNK_SIZE = 1 << 18
+
+def spray_path(batter_id, handedness = RIGHTY, directory = SPRAY_DIR) -> str:
+    return os.path.join(directory, f"spray {batter_id} {'lefty' if handedness == LEFTY else 'righty'}.npz")
+
+def sample_spray(batter_id, handedness = RIGHTY, samples = SAMPLES, chem = 0, seed = 0) -> np.ndarray:
+    """ Landing chances of a batter over the horizontal view's field, shaped like BINS, indexed [x, z].
+
+    Every swing is drawn at random: slap or charge (charge_down 0 to 1), stick direction, contact frame, ball_x anywhere
+    the bat reaches, pitcher, pitch type and rand_1, rand_2, rand_3. The chances sum to the share of swings that land.
+    """
+    rng = np.random.default_rng(seed)
+    low, high = BATTING_REACHES[0 if BATTER_HITBOXES[batter_id]["TrimmedBat"] == 0.0 else 1]
+    counts = np.zeros(BINS)
+    for start in range(0, samples, CHUNK_SIZE):
+        n = min(CHUNK_SIZE, samples - start)
+        hit_type = rng.choice([SLAP, CHARGE], n)
+        stick = rng.integers(0, 9, n)
+        rows = hit_ball_batch(
+            batter_id=batter_id, handedness=handedness, chem=chem, hit_type=hit_type, charge_up=(hit_type == CHARGE).astype(float),
+            charge_down=np.where(hit_type == CHARGE, rng.random(n), 0.0), stick_up=stick // 3 == 1, stick_down=stick // 3 == 2,
+            stick_left=stick % 3 == 1, stick_right=stick % 3 == 2, frame=rng.choice(CONTACT_FRAMES, n), ball_x=rng.uniform(low, high, n),
+            pitcher_id=rng.integers(0, len(STATS), n), pitch_type=rng.integers(0, 4, n),
+            rand_1=rng.integers(0, 1 << 15, n), rand_2=rng.integers(0, 1 << 15, n), rand_3=rng.integers(0, 1 << 15, n),
+        )
+        landing = rows["landing"][rows["valid"]]
+        counts += np.histogram2d(landing[:, 0], landing[:, 2], BINS, [EXTENT[:2], EXTENT[2:]])[0]
+    return counts / samples
+
+def save_spray(batter_id, handedness = RIGHTY, directory = SPRAY_DIR, **kwargs) -> np.ndarray:
+    chances = sample_spray(batter_id, handedness, **kwargs)
+    os.makedirs(directory, exist_ok=True)
+    np.savez_compressed(spray_path(batter_id, handedness, directory), chances=chances, extent=np.array(EXTENT))
+    return chances
+
+def load_spray(batter_id, handedness = RIGHTY, directory = SPRAY_DIR) -> np.ndarray:
+    """ The saved chart of a batter batting with handedness, None when there isn't one or it's for another field layout. """
+    path = spray_path(batter_id, handedness, directory)
+    if not os.path.exists(path):
+        return None
+    with np.load(path) as f:
+        chances, extent = f["chances"], f["extent"]
+    if chances.shape != BINS or tuple(extent) != EXTENT:
+        return None
+    return chances
+
+def main():
+    parser = argparse.ArgumentParser(description="Makes the spray charts shown in the horizontal view")
+    parser.add_argument("batters", type=int, nargs="*", help="default all")
+    parser.add_argument("--samples", type=int, default=SAMPLES)
+    parser.add_argument("--chem", type=int, default=0)
+    parser.add_argument("--directory", default=SPRAY_DIR)
+    args = parser.parse_args()
+
+    for batter_id in args.batters or range(len(STATS)):
+        # a lefty reaches and makes contact differently, so both hands get their own chart
+        for handedness in (RIGHTY, LEFTY):
+            chances = save_spray(batter_id, handedness, args.directory, samples=args.samples, chem=args.chem)
+            hand = "righty" if handedness == RIGHTY else "lefty"
+            print(f"batter {batter_id} {STATS[batter_id]['Name']} {hand}: {chances.sum():.1%} of swings land in view")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import numpy as np
+from flight import positions, AIR_RESISTANCE, GRAVITY
+
+IN_PLAY = 0
+FOUL = 1
+OFF_THE_WALL = 2
+HOME_RUN = 3
+FENCE_LABELS = ["In Play", "Foul", "Off The Wall", "Home Run"]
+
+def _cross(a, b):
+    return a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
+
+class Stadium:
+    # fence is the (x, z) corners from the left foul pole to the right one, home plate is at (0, 0)
+    # and the foul lines run from it to the poles, wall_heights has one height per fence segment
+    def __init__(self, fence, wall_heights) -> None:
+        self.fence = np.array(fence, dtype=np.float64)
+        self.wall_heights = np.array(wall_heights, dtype=np.float64)
+        if len(self.wall_heights) != len(self.fence) - 1:
+            raise ValueError("wall_heights needs one height per fence segment")
+
+        self.starts = self.fence[:-1]
+        self.directions = self.fence[1:] - self.fence[:-1]
+        # nothing closer to home plate than this can touch the fence
+        along = np.clip(np.sum(-self.starts * self.directions, axis=1) / np.sum(self.directions ** 2, axis=1), 0.0, 1.0)
+        self.reach = np.hypot(*(self.starts + along[:, None] * self.directions).T).min()
+
+    def outline(self) -> list:
+        # home plate and the fence, as (x, z) points
+        return [(0.0, 0.0)] + [tuple(p) for p in self.fence.tolist()]
+
+    def is_fair(self, x, z) -> np.ndarray:
+        p = np.stack([x, z], axis=-1)
+        return (_cross(self.fence[0], p) <= 0.0) & (_cross(self.fence[-1], p) >= 0.0)
+
+    def classify_paths(self, paths) -> np.ndarray:
+        """ A label per path of a (N, frames, 3) array of x, y, z points, rows that landed early are padded with nan.
+
+        The first fence segment a path crosses decides between HOME_RUN, over the wall, and OFF_THE_WALL, paths that
+        never cross it are IN_PLAY or FOUL by where they come down.
+        """
+        paths = np.asarray(paths, dtype=np.float64)
+        last = np.maximum(np.sum(~np.isnan(paths[..., 0]), axis=1) - 1, 0)
+        landing = paths[np.arange(len(paths)), last]
+        labels = np.where(self.is_fair(landing[:, 0], landing[:, 2]), IN_PLAY, FOUL).astype(np.int8)
+
+        with np.errstate(invalid="ignore"):
+            rows = np.flatnonzero(np.nanmax(np.hypot(paths[..., 0], paths[..., 2]), axis=1, initial=0.0) >= self.reach)
+        if not len(rows):
+            return labels
+
+        # only the steps with an end past the closest part of the fence, against every fence segment
+        radius = np.hypot(paths[rows, :, 0], paths[rows, :, 2])
+        with np.errstate(invalid="ignore"):
+            row, at_step = np.nonzero((radius[:, :-1] >= self.reach) | (radius[:, 1:] >= self.reach))
+        p0 = paths[rows[row], at_step][:, None, :]
+        step = paths[rows[row], at_step + 1][:, None, :] - p0
+        step_xz, to_start = step[..., [0, 2]], self.starts - p0[..., [0, 2]]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            denominator = _cross(step_xz, self.directions)
+            t = _cross(to_start, self.directions) / denominator
+            u = _cross(to_start, step_xz) / denominator
+            crossed = (denominator != 0.0) & (0.0 <= t) & (t <= 1.0) & (0.0 <= u) & (u <= 1.0)
+
+        # the earliest crossing of every path, by step and then by how far along the step
+        step_index, segment = np.nonzero(crossed)
+        t = t[step_index, segment]
+        order = np.lexsort((at_step[step_index] + t, row[step_index]))
+        hit_rows, first = np.unique(row[step_index][order], return_index=True)
+        first = order[first]
+        step_index, segment, t = step_index[first], segment[first], t[first]
+        height = p0[step_index, 0, 1] + t * step[step_index, 0, 1]
+        labels[rows[hit_rows]] = np.where(height > self.wall_heights[segment], HOME_RUN, OFF_THE_WALL)
+        return labels
+
+    def classify_flights(self, start, velocity, acceleration, frames, air_resistance = AIR_RESISTANCE, gravity = GRAVITY) -> np.ndarray:
+        """ classify_paths for (N, 3) arrays of flights that hit the ground on frames, like hit_ball_batch's rows. """
+        start, frames = np.asarray(start, dtype=np.float64), np.asarray(frames)
+        # frames is the first frame under ground, the path stops a frame before it like hit_ball's path and landing
+        landing = positions(start, velocity, acceleration, np.maximum(frames - 1, 0), air_resistance, gravity)
+        labels = np.where(self.is_fair(landing[:, 0], landing[:, 2]), IN_PLAY, FOUL).astype(np.int8)
+
+        # only balls that come down past the closest part of the fence can have reached it
+        rows = np.flatnonzero(np.hypot(landing[:, 0], landing[:, 2]) >= self.reach)
+        if not len(rows):
+            return labels
+
+        n = np.arange(frames[rows].max())
+        paths = positions(start[rows, None], np.asarray(velocity)[rows, None], np.asarray(acceleration)[rows, None], n[None, :], air_resistance, gravity)
+        paths[n[None, :] >= frames[rows, None]] = np.nan
+        labels[rows] = self.classify_paths(paths)
+        return labels
+
+def path_array(paths) -> np.ndarray:
+    # hit_ball's FlightDetails paths, lists of {"X", "Y", "Z"} points, as a nan padded (N, frames, 3) array
+    out = np.full((len(paths), max([len(p) for p in paths], default=0), 3), np.nan)
+    for i, path in enumerate(paths):
+        out[i, :len(path)] = [(p["X"], p["Y"], p["Z"]) for p in path]
+    return out
+
+def label_results(results, stadium = None):
+    # adds a "Fence" label to the FlightDetails of every hit_ball result that has a path
+    flown = [r for r in results if r is not None and "Path" in r.get("FlightDetails", {})]
+    if not flown:
+        return
+    labels = (stadium or MARIO_STADIUM).classify_paths(path_array([r["FlightDetails"]["Path"] for r in flown]))
+    for r, label in zip(flown, labels):
+        r["FlightDetails"]["Fence"] = FENCE_LABELS[label]
+
+# the fence as the horizontal view has always drawn it, the wall heights are estimates and not measured in game,
+# so the labels are approximate
+MARIO_STADIUM = Stadium(
+    fence=[(-57.0, 57.0), (-41.5, 82.5), (-13.0, 100.0), (16.0, 100.0), (57.0, 57.0)],
+    wall_heights=[2.5, 2.5, 2.5, 2.5],
+)
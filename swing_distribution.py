@@ -0,0 +1,117 @@
+import numpy as np
+from batch_batting import hit_ball_batch
+from calc_batting import BattingCalculator, HitRequest, BUNT
+
+RAND_RANGE = 1 << 15
+# every rand_1, rand_2, rand_3 combination
+TOTAL = float(RAND_RANGE) ** 3
+
+def _swing_shape(kwargs):
+    # horizontal range width and vertical weights from one scalar run, None when the ball misses the bat
+    c = BattingCalculator(HitRequest(**kwargs, include_path=False))
+    if not c.calculateSharedStages():
+        return None
+
+    c.calculateVerticalAngle()
+    low, high = c.Display_Output["Horizontal Range"]
+    details = c.Display_Output["Vertical Details"]
+    weighted = len(details["Zones"]) > 1
+    return max(abs(high - low), 1), weighted, abs(sum(details["Weights"])), np.array(details["Zones"])
+
+def _roll_offsets(weight_sum):
+    # distribution of how much WeightedRandomIndex moves rand_1, over every rand_2 and rand_3
+    # returns the counts and the offset of the first one
+    r2 = np.arange(RAND_RANGE)
+    from_r2 = -(r2 & 0xff) + np.trunc(r2 / weight_sum).astype(np.int64)
+    counts = np.bincount(from_r2 - from_r2.min()).astype(np.float64)
+
+    # rand_3 is added as is, which is a box filter of RAND_RANGE wide
+    counts = np.cumsum(np.concatenate([counts, np.zeros(RAND_RANGE - 1)]))
+    counts[RAND_RANGE:] -= counts[:-RAND_RANGE].copy()
+    return counts, from_r2.min()
+
+def _rolled_outcomes(kwargs, width, weight_sum, zones):
+    # rand_1 only matters through rand_1 % width for the horizontal angle and through the rolled
+    # rand_1 for the vertical one, so the vertical angles are only worked out once per rolled value
+    offsets, first_offset = _roll_offsets(weight_sum)
+
+    # rand_1 = a + width * m, summing the offsets over m gives the rolled values of every a at once
+    shift = RAND_RANGE // width * width
+    length = -(-(len(offsets) + shift) // width) * width
+    padded = np.zeros(length)
+    padded[:len(offsets)] = offsets
+    summed = padded.reshape(-1, width).cumsum(0).ravel()
+    common = summed.copy()
+    common[shift:] -= summed[:length - shift]
+    # the first RAND_RANGE % width classes get one more rand_1
+    extra = common.copy()
+    extra[shift:] += padded[:length - shift]
+
+    rolled = first_offset + np.arange(length + width - 1)
+    vertical = hit_ball_batch(**kwargs, rand_1=rolled, rand_2=0, rand_3=0)
+    zone = vertical["vertical_zone"].astype(np.int64)
+    span = zones[zone, 1] - zones[zone, 0]
+    angle = zones[zone, 0] + np.fmod(rolled, np.where(span == 0, 1, span))
+    keys, representative, key_of = np.unique(zone * 0x4000 + angle, return_index=True, return_inverse=True)
+    key_of = key_of.ravel()
+
+    weights = np.empty((width, len(keys)))
+    for a in range(width):
+        weights[a] = np.bincount(key_of[a:a + length], extra if a < RAND_RANGE % width else common, minlength=len(keys))
+
+    a, key = np.nonzero(weights)
+    # any rand_3 that lands on the representative rolled value gives the same swing
+    rows = hit_ball_batch(**kwargs, rand_1=a, rand_2=0, rand_3=rolled[representative[key]] - a)
+    return rows, weights[a, key]
+
+def swing_distribution(distance_bins = 64, landing_bins = 64, **kwargs) -> dict:
+    """ What a swing does over every rand_1, rand_2 and rand_3, exactly.
+
+    Takes the same arguments as hit_ball_batch as scalars, rand_1, rand_2 and rand_3 are the ones swept.
+    distance_bins and landing_bins are passed on to np.histogram and np.histogram2d.
+
+    Returns a dict of probabilities, the histograms sum to "valid", the chance the ball is hit and lands:
+    contact_zone and vertical_zone have 5 entries, vertical_zone is all 0 when the swing has a fixed range,
+    distance is (counts, edges), landing is (counts, x edges, z edges) of the landing x and z.
+    """
+    for k in ("rand_1", "rand_2", "rand_3"):
+        kwargs.pop(k, None)
+    if kwargs.get("hit_type") == BUNT:
+        raise ValueError("bunts aren't supported by the batch engine")
+
+    shape = _swing_shape(kwargs)
+    if shape is None:
+        rows, weights = hit_ball_batch(**kwargs, rand_1=0)[None], np.array([TOTAL])
+    else:
+        width, weighted, weight_sum, zones = shape
+        if weighted and weight_sum >= 2:
+            rows, weights = _rolled_outcomes(kwargs, width, weight_sum, zones)
+        else:
+            # without a roll both angles come from rand_1 alone
+            rows, weights = hit_ball_batch(**kwargs, rand_1=np.arange(RAND_RANGE)), np.full(RAND_RANGE, TOTAL / RAND_RANGE)
+
+    valid = rows["valid"]
+    rows, weights = rows[valid], weights[valid] / TOTAL
+    landing = rows["landing"]
+    weighted_zones = rows["vertical_zone"] >= 0
+
+    result = {
+        "valid": weights.sum(),
+        "contact_zone": np.bincount(rows["contact_zone"], weights, minlength=5),
+        "vertical_zone": np.bincount(rows["vertical_zone"][weighted_zones], weights[weighted_zones], minlength=5),
+        "distance": np.histogram(rows["distance"], distance_bins, weights=weights),
+        "landing": np.histogram2d(landing[:, 0], landing[:, 2], landing_bins, weights=weights),
+        "mean_distance": np.average(rows["distance"], weights=weights) if len(rows) else np.nan,
+    }
+    return result
+
+if __name__ == "__main__":
+    from time import perf_counter
+
+    start = perf_counter()
+    d = swing_distribution(batter_id=2, pitcher_id=26, ball_x=0.2101, chem=2, pitch_type=3, frame=4, stick_down=True)
+    print(f"{perf_counter() - start:.2f}s")
+    print("valid", d["valid"])
+    print("contact zones", d["contact_zone"])
+    print("vertical zones", d["vertical_zone"])
+    print("mean distance", d["mean_distance"])
@@ -0,0 +1,129 @@
+import argparse
+import os
+import numpy as np
+from batch_batting import CONTACT_FRAMES, hit_ball_batch
+from calc_batting import BATTING_REACHES, SLAP, CHARGE, LEFTY
+from outcome_tables import OutcomeTable, TABLE_FILE, SHAPE, RANGE_MARGIN, generate_batter
+
+# how many ball_x samples each contact zone is searched with
+BALL_X_SAMPLES = 4
+CHARGE_DOWNS = [0.0, 0.5, 1.0]
+# the outcome table's landing ranges are only sure to hold within RANGE_MARGIN, so they are widened by it before pruning
+PRUNE_MARGIN = RANGE_MARGIN
+# rng triples used for the first pass, every candidate that lands one is rerun with all of them
+COARSE_RNG = 64
+
+def _region(target, radius):
+    # (x_min, x_max, z_min, z_max) and a test for landing points, target is (x, z) or (x_min, x_max, z_min, z_max)
+    if len(target) == 4:
+        x_min, x_max, z_min, z_max = target
+        return target, lambda x, z: (x_min <= x) & (x <= x_max) & (z_min <= z) & (z <= z_max)
+    x, z = target
+    return (x - radius, x + radius, z - radius, z + radius), lambda lx, lz: (lx - x) ** 2 + (lz - z) ** 2 <= radius * radius
+
+def _ball_x_samples(batter_id, hit_type, chem, handedness, count):
+    # ball_x offsets spread through every contact zone, from a fine sweep of the bat
+    ball_x = np.linspace(np.min(BATTING_REACHES), np.max(BATTING_REACHES), 1201)
+    rows = hit_ball_batch(batter_id=batter_id, hit_type=hit_type, charge_up=float(hit_type == CHARGE), chem=chem, handedness=handedness, ball_x=ball_x, rand_1=0)
+    samples = []
+    for zone in range(5):
+        in_zone = ball_x[rows["valid"] & (rows["contact_zone"] == zone)]
+        samples.append(in_zone[np.unique(np.linspace(0, len(in_zone) - 1, count).round().astype(np.int64))] if len(in_zone) else in_zone)
+    return samples
+
+def _reachable(records, bounds):
+    # which (hit_type, stick_vertical, stick_horizontal, frame, contact_zone) records can land in bounds
+    x_min, x_max, z_min, z_max = bounds
+    landing_x, landing_z = records["landing_x"], records["landing_z"]
+    return ((records["count"] > 0) & (landing_x[..., 0] - PRUNE_MARGIN <= x_max) & (x_min <= landing_x[..., 1] + PRUNE_MARGIN)
+            & (landing_z[..., 0] - PRUNE_MARGIN <= z_max) & (z_min <= landing_z[..., 1] + PRUNE_MARGIN))
+
+def solve(batter_id, target, radius = 3.0, pitcher_id = 0, pitch_type = 0, chem = 0, handedness = 0, table = None,
+          rng_samples = 1024, ball_x_samples = BALL_X_SAMPLES, charge_downs = CHARGE_DOWNS, top = 20, seed = 0) -> list:
+    """ Swing inputs that land the ball on target, best first.
+
+    target is an (x, z) landing point, with radius, or an (x_min, x_max, z_min, z_max) region, in the horizontal view's coordinates.
+    Searches slap and charge, charge_down, stick direction, contact frame and the ball_x offset from the batter, the
+    situation (batter, pitcher, pitch type, chem and handedness) is fixed. table is an OutcomeTable, by default outcome_table.npy
+    is used when it exists and the batter's records are generated when it doesn't, whole branches that can't reach the
+    target are skipped with it. Pruning assumes no chem, with chem every branch is searched.
+
+    Each candidate is run over the same rng_samples random rand_1, rand_2, rand_3, and comes back as a dict of
+    hit_ball arguments with "success", the share of them that landed on target, and "rng", one that did.
+    """
+    bounds, on_target = _region(target, radius)
+
+    if chem != 0:
+        reachable = np.ones(SHAPE[2:3] + SHAPE[4:], dtype=bool)
+    else:
+        if table is None and os.path.exists(TABLE_FILE):
+            table = OutcomeTable(TABLE_FILE)
+        records = table.table[batter_id, handedness] if table is not None else generate_batter(batter_id, handedness)
+        reachable = _reachable(records[:, pitch_type], bounds)
+
+    candidates = {k: [] for k in ["hit_type", "charge_up", "charge_down", "stick_up", "stick_down", "stick_left", "stick_right", "frame", "ball_x"]}
+    for h, hit_type in enumerate([SLAP, CHARGE]):
+        ball_xs = _ball_x_samples(batter_id, hit_type, chem, handedness, ball_x_samples)
+        for stick_vertical, stick_horizontal, frame, zone in np.argwhere(reachable[h]).tolist():
+            if frame not in CONTACT_FRAMES:
+                continue
+            for charge_down in (charge_downs if hit_type == CHARGE else [0.0]):
+                for ball_x in ball_xs[zone]:
+                    for k, v in [("hit_type", hit_type), ("charge_up", float(hit_type == CHARGE)), ("charge_down", charge_down), ("stick_up", stick_vertical == 1),
+                                 ("stick_down", stick_vertical == 2), ("stick_left", stick_horizontal == 1), ("stick_right", stick_horizontal == 2),
+                                 ("frame", frame), ("ball_x", ball_x)]:
+                        candidates[k].append(v)
+    candidates = {k: np.array(v) for k, v in candidates.items()}
+    if not len(candidates["ball_x"]):
+        return []
+
+    rng = np.random.default_rng(seed).integers(0, 1 << 15, (3, rng_samples))
+    situation = dict(batter_id=batter_id, pitcher_id=pitcher_id, pitch_type=pitch_type, chem=chem, handedness=handedness)
+
+    def run(picked, rands):
+        # success share and the first hitting rng index of every picked candidate
+        rows = hit_ball_batch(**situation, **{k: v[picked, None] for k, v in candidates.items()},
+                              rand_1=rands[0], rand_2=rands[1], rand_3=rands[2])
+        hits = rows["valid"] & on_target(rows["landing"][..., 0], rows["landing"][..., 2])
+        return hits.mean(axis=1), hits.argmax(axis=1)
+
+    picked = np.arange(len(candidates["ball_x"]))
+    success, _ = run(picked, rng[:, :COARSE_RNG])
+    picked = picked[success > 0]
+    if not len(picked):
+        return []
+    success, first = run(picked, rng)
+
+    order = np.argsort(-success, kind="stable")[:top]
+    solutions = []
+    for i in order:
+        if success[i] == 0:
+            break
+        c = {k: v[picked[i]].item() for k, v in candidates.items()}
+        c.update(situation, success=success[i].item(), rng=tuple(rng[:, first[i]].tolist()))
+        solutions.append(c)
+    return solutions
+
+def main():
+    parser = argparse.ArgumentParser(description="Finds swing inputs that land the ball on a spot of the horizontal view")
+    parser.add_argument("batter_id", type=int)
+    parser.add_argument("target", type=float, nargs="+", help="x z, or x_min x_max z_min z_max")
+    parser.add_argument("--radius", type=float, default=3.0)
+    parser.add_argument("--pitcher", type=int, default=0)
+    parser.add_argument("--pitch-type", type=int, default=0)
+    parser.add_argument("--chem", type=int, default=0)
+    parser.add_argument("--lefty", action="store_true")
+    parser.add_argument("--table", default=TABLE_FILE)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+    if len(args.target) not in (2, 4):
+        parser.error("target takes 2 or 4 values")
+
+    table = OutcomeTable(args.table) if os.path.exists(args.table) else None
+    for s in solve(args.batter_id, args.target, args.radius, args.pitcher, args.pitch_type, args.chem, LEFTY if args.lefty else 0, table, top=args.top):
+        stick = "".join(d for d, on in zip("UDLR", [s["stick_up"], s["stick_down"], s["stick_left"], s["stick_right"]]) if on) or "-"
+        swing = "slap" if s["hit_type"] == SLAP else f"charge (down {s['charge_down']:.1f})"
+        print(f"{s['success']:6.1%}  {swing:18} stick {stick:2}  frame {s['frame']:2}  ball_x {s['ball_x']:+.3f}  rng {s['rng']}")
+
+if __name__ == "__main__":
+    main()
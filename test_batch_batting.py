@@ -0,0 +1,89 @@
+import numpy as np
+from batch_batting import CONTACT_FRAMES, _madd, hit_ball_batch
+from calc_batting import hit_ball, BATTING_REACHES, BUNT, CHARGE, CONTACT_ZONE_NAMES, SLAP
+from flight import AIR_RESISTANCE, GRAVITY
+
+def random_swings(n, seed = 0):
+    rng = np.random.default_rng(seed)
+    return dict(
+        batter_id=rng.integers(0, 54, n), pitcher_id=rng.integers(0, 54, n), handedness=rng.integers(0, 2, n),
+        batter_x=rng.uniform(-0.3, 0.3, n), ball_x=rng.uniform(np.min(BATTING_REACHES), np.max(BATTING_REACHES), n),
+        chem=rng.integers(0, 4, n), hit_type=rng.choice([SLAP, CHARGE, CHARGE, SLAP, BUNT], n), pitch_type=rng.integers(0, 4, n),
+        charge_up=rng.choice([0.0, 1.0, 0.5], n), charge_down=rng.random(n), frame=rng.choice(CONTACT_FRAMES, n),
+        stick_up=rng.random(n) < 0.3, stick_down=rng.random(n) < 0.3, stick_left=rng.random(n) < 0.3, stick_right=rng.random(n) < 0.3,
+        rand_1=rng.integers(0, 1 << 15, n), rand_2=rng.integers(0, 1 << 15, n), rand_3=rng.integers(0, 1 << 15, n),
+        is_star_hit=rng.random(n) < 0.3, num_stars=rng.integers(0, 6, n), is_batter_captain=rng.random(n) < 0.5,
+        is_starred=rng.random(n) < 0.2, easy_batting=rng.random(n) < 0.2,
+    )
+
+def test_batch_matches_hit_ball():
+    n = 2000
+    swings = random_swings(n)
+    # hit_ball uses ball_x as the contact z, the batch takes ball_z as given
+    rows = hit_ball_batch(**swings, ball_z=swings["ball_x"])
+
+    checked = 0
+    for i in range(n):
+        result = hit_ball(**{k: v[i].item() for k, v in swings.items()}, include_path=False)
+        valid = result is not None and not result.get("err") and swings["hit_type"][i] != BUNT
+        assert valid == rows["valid"][i], i
+        if not valid:
+            continue
+        checked += 1
+        row, ball, flight = rows[i], result["BallDetails"], result["FlightDetails"]
+        assert CONTACT_ZONE_NAMES[row["contact_zone"]] == result["Contact"]["ContactZone"], i
+        assert (row["horizontal_angle"], row["vertical_angle"], row["power"], row["frames"]) == \
+            (ball["HorizontalAngle"], ball["VerticalAngle"], ball["Power"], flight["Frames"]), i
+        assert np.allclose(row["velocity"], [ball["Velocity"][k] for k in "XYZ"], rtol=0, atol=1e-12), i
+        assert np.allclose(row["acceleration"], [ball["Acceleration"][k] for k in "XYZ"], rtol=0, atol=1e-12), i
+        assert abs(row["distance"] - flight["Distance"]) < 1e-7, i
+    assert checked > n // 2
+
+def test_broadcasts_and_chunks():
+    # scalars broadcast against arrays, and a run longer than one chunk matches the same rows one at a time
+    swings = random_swings(40000, seed=1)
+    rows = hit_ball_batch(**swings, ball_z=0.5)
+    picked = [3, 17, 16384, 39999]
+    alone = hit_ball_batch(**{k: v[picked] for k, v in swings.items()}, ball_z=0.5)
+    assert rows[picked].tobytes() == alone.tobytes()
+
+    grid = hit_ball_batch(batter_id=np.arange(54)[:, None], ball_x=np.linspace(-0.5, 0.5, 7), frame=CONTACT_FRAMES[0],
+                          rand_1=1, rand_2=2, rand_3=3)
+    assert grid.shape == (54, 7)
+
+def test_madd_rounds_once():
+    # (1 + 2^-12)^2 - (1 + 2^-11) is 2^-24, rounding the product to a single first loses it
+    x = np.float32(1 + 2 ** -12)
+    assert _madd(np.array([x]), x, np.float32(-(1 + 2 ** -11)))[0] == np.float32(2 ** -24)
+    assert x * x - np.float32(1 + 2 ** -11) == 0
+    assert _madd(np.array([x], dtype=np.float64), x, -(1 + 2 ** -11)).dtype == np.float64
+
+def fly_single(start, velocity, acceleration):
+    # one ball at a time in singles, p += v then v = (v - g) * r + a with the multiply-add rounded once
+    r, g = np.float32(AIR_RESISTANCE), np.float32(GRAVITY)
+    p, v, a = [np.array(x, dtype=np.float32) for x in (start, velocity, acceleration)]
+    last, frames = p, 0
+    while p[1] > 0:
+        last, p = p, p + v
+        v = v - np.array([0, g, 0], dtype=np.float32)
+        v = (v.astype(np.float64) * np.float64(r) + a.astype(np.float64)).astype(np.float32)
+        frames += 1
+    return frames, last
+
+def test_single_precision_flight():
+    swings = random_swings(3000, seed=2)
+    rows = hit_ball_batch(single_precision=True, **swings, ball_z=swings["ball_x"])
+    for i in np.flatnonzero(rows["valid"])[:300]:
+        frames, landing = fly_single(rows["start"][i], rows["velocity"][i], rows["acceleration"][i])
+        assert rows["frames"][i] == frames, i
+        assert (rows["landing"][i] == landing).all(), i
+
+    # and it stays close to the double precision closed form
+    double = hit_ball_batch(**swings, ball_z=swings["ball_x"])
+    both = rows["valid"] & double["valid"]
+    assert (rows["valid"] == double["valid"]).mean() > 0.999
+    for name in ["contact_zone", "horizontal_angle", "vertical_angle"]:
+        assert (rows[name][both] == double[name][both]).all(), name
+    assert (rows["power"][both] == double["power"][both]).mean() > 0.999
+    assert np.abs(rows["frames"][both] - double["frames"][both]).max() <= 1
+    assert np.median(np.abs(rows["distance"][both] - double["distance"][both])) < 1e-3
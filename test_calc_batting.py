@@ -0,0 +1,85 @@
+import json
+import random
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from calc_batting import BattingCalculator, HitRequest, STAR, RIGHTY, LEFTY, get_contact_zones, hit_ball, hit_ball_many, hit_ball_zones
+
+def random_requests(n, seed = 0):
+    rng = random.Random(seed)
+    return [dict(
+        batter_id=rng.randrange(54), pitcher_id=rng.randrange(54), easy_batting=rng.random() < 0.2, handedness=rng.randrange(2),
+        batter_x=rng.uniform(-0.5, 0.5), ball_x=rng.uniform(-1, 1), chem=rng.randrange(4), hit_type=rng.randrange(2),
+        is_star_hit=rng.random() < 0.2, pitch_type=rng.randrange(4), charge_up=rng.random(), charge_down=rng.random(),
+        frame=rng.randrange(2, 10), rand_1=rng.randrange(1 << 15), rand_2=rng.randrange(1 << 15), rand_3=rng.randrange(1 << 15),
+        stick_up=rng.random() < 0.3, stick_down=rng.random() < 0.3, num_stars=rng.randrange(6), is_starred=rng.random() < 0.5,
+    ) for _ in range(n)]
+
+def same(a, b) -> bool:
+    return json.dumps(a, sort_keys=True) == json.dumps(b, sort_keys=True)
+
+def test_zones_match_overrides():
+    with_alternates = 0
+    for kwargs in random_requests(500):
+        result, alternates = hit_ball_zones(**kwargs)
+        expected = hit_ball(**kwargs)
+        assert same(result, expected), kwargs
+
+        others = []
+        if expected and "Vertical Details" in expected and len(expected["Vertical Details"]["Zones"]) > 1:
+            others = [hit_ball(**kwargs, override_vertical_range=z) for z in range(5) if z != expected["Vertical Details"]["Selected Zone"]]
+        assert same(alternates, others), kwargs
+        with_alternates += len(others) > 0
+    assert with_alternates > 100
+
+def test_request_matches_keywords():
+    for kwargs in random_requests(200, seed=1):
+        request = HitRequest(**kwargs)
+        assert same(hit_ball(request), hit_ball(**kwargs)), kwargs
+
+    with pytest.raises(TypeError):
+        HitRequest(batter=3)
+    with pytest.raises(AttributeError):
+        HitRequest().batter = 3
+
+    # replace copies, the original stays as it was
+    request = HitRequest(batter_id=5)
+    moved = request.replace(ball_x=0.5, include_path=False)
+    assert (request.ball_x, request.include_path, moved.ball_x, moved.include_path, moved.batter_id) == (0.0, True, 0.5, False, 5)
+
+def test_calculator_state_is_slotted():
+    c = BattingCalculator(HitRequest())
+    for state in [c, c.inMemBatter, c.inMemBall, c.inMemPitcher]:
+        assert not hasattr(state, "__dict__"), type(state).__name__
+
+def test_weighted_random_index_is_pure():
+    weights = [10, 0, 25, 5, 60]
+    first = BattingCalculator.WeightedRandomIndex(weights, 5, 1234, 567, 89)
+    assert BattingCalculator.WeightedRandomIndex(weights, 5, 1234, 567, 89) == first
+    assert weights == [10, 0, 25, 5, 60]
+
+def test_many_matches_serial():
+    requests = random_requests(300, seed=2)
+    for r in requests:
+        r["include_path"] = False
+    serial = [hit_ball(**r) for r in requests]
+
+    assert same(hit_ball_many(requests, max_workers=4, chunksize=8), serial)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert same(hit_ball_many([HitRequest(**r) for r in requests], executor=executor), serial)
+    assert same(hit_ball_many([HitRequest(**r) for r in requests[:60]], processes=True, max_workers=2), serial[:60])
+
+def test_star_contact_zones_match_contact():
+    # captain star swings aren't charged, so the chem links widen their zones like a slap's
+    for handedness in (RIGHTY, LEFTY):
+        for chem in range(4):
+            zones = get_contact_zones(0, handedness, STAR, chem=chem)
+            for zone, reach in enumerate(zones):
+                if reach is None:
+                    continue
+                for offset in (reach[0] + 1e-5, reach[1] - 1e-5):
+                    c = BattingCalculator(HitRequest(batter_id=0, hit_type=STAR, chem=chem, handedness=handedness, charge_up=1.0))
+                    c.inMemBatter.Batter_Contact_SlapChargeBuntStar = STAR
+                    c.inMemBatter.AtBat_Mystery_CaptainStarSwing = 1
+                    c.inMemBatter.interstitialBallContact_X = c.inMemBatter.posX + offset
+                    c.calculateContact()
+                    assert c.inMemBatter.Batter_ContactType == zone, (handedness, chem, offset)
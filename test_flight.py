@@ -0,0 +1,41 @@
+import numpy as np
+from flight import AIR_RESISTANCE, GRAVITY, Flight, landing_frames, positions
+
+def step(p, v, a):
+    # the game's loop, one frame at a time until the ball is on the ground
+    p, v = list(p), list(v)
+    points = []
+    while p[1] > 0:
+        points.append(tuple(p))
+        p = [p[i] + v[i] for i in range(3)]
+        v = [v[0] * AIR_RESISTANCE + a[0], (v[1] - GRAVITY) * AIR_RESISTANCE + a[1], v[2] * AIR_RESISTANCE + a[2]]
+    return points
+
+def random_flights(n, seed = 0):
+    rng = np.random.default_rng(seed)
+    start = np.column_stack([rng.uniform(-1, 1, n), rng.uniform(0.01, 2, n), rng.uniform(-1, 1, n)])
+    velocity = np.column_stack([rng.uniform(-0.5, 0.5, n), rng.uniform(-0.2, 0.8, n), rng.uniform(-0.5, 0.5, n)])
+    acceleration = np.column_stack([rng.uniform(-0.002, 0.002, n), rng.uniform(-0.001, 0.002, n), rng.uniform(-0.002, 0.002, n)])
+    return start, velocity, acceleration
+
+def test_closed_form_matches_stepping():
+    for p, v, a in zip(*random_flights(300)):
+        points = step(p, v, a)
+        flight = Flight(p, v, a)
+        assert flight.landing_frame() == len(points)
+        assert np.allclose(flight.path(len(points)), points, rtol=0, atol=1e-9)
+        assert np.allclose(flight.position(len(points) - 1), points[-1], rtol=0, atol=1e-9)
+
+def test_batch_matches_flight():
+    start, velocity, acceleration = random_flights(2000, seed=1)
+    frames = landing_frames(start, velocity, acceleration)
+    assert list(frames) == [Flight(p, v, a).landing_frame() for p, v, a in zip(start, velocity, acceleration)]
+    at = positions(start, velocity, acceleration, frames - 1)
+    assert np.allclose(at, [Flight(p, v, a).position(n - 1) for p, v, a, n in zip(start, velocity, acceleration, frames)])
+
+def test_ground_and_never():
+    # on the ground already lands on frame 0, a ball pushed up harder than gravity never lands
+    assert Flight((0, 0, 0), (0, 1, 0), (0, 0, 0)).landing_frame() == 0
+    assert Flight((0, 1, 0), (0, 0.1, 0), (0, 0.01, 0)).landing_frame() is None
+    frames = landing_frames(np.array([[0, 0, 0], [0, 1, 0]]), np.array([[0, 1, 0], [0, 0.1, 0]]), np.array([[0, 0, 0], [0, 0.01, 0]]))
+    assert list(frames) == [0, -1]
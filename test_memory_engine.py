@@ -0,0 +1,238 @@
+import json
+import struct
+import threading
+import pytest
+import memory_engine
+from conftest import BASE
+from memory_engine import (DolphinByte, DolphinDisconnectedError, DolphinFloat, DolphinFloatArray, DolphinHalfWord,
+    DolphinSnapshot, DolphinVec3, DolphinVec3Array, DolphinWord, FrameCache, IOStats, MemoryBackend, RecordLayout, WriteBatch, begin_frame, bytes_from_floats,
+    connection, end_frame, floats_from_bytes, get_backend, io_stats, is_hooked, read_bytes, read_word, set_backend, unhook,
+    wait_hooked, write_batch, write_bytes, write_float, write_word)
+
+class FlakyBackend(MemoryBackend):
+    # hooks only while ready is set and fails every read while broken
+    def __init__(self) -> None:
+        self.ready = threading.Event()
+        self.broken = False
+        self.hooks = 0
+        self.memory = bytearray(range(0x100))
+
+    def hook(self) -> bool:
+        self.hooks += 1
+        return self.ready.is_set()
+
+    def is_hooked(self) -> bool:
+        return self.ready.is_set()
+
+    def read_bytes(self, addr:int, size:int):
+        if self.broken:
+            raise RuntimeError("Dolphin went away")
+        return bytes(self.memory[addr - BASE:addr - BASE + size])
+
+    def write_bytes(self, addr:int, b) -> None:
+        self.memory[addr - BASE:addr - BASE + len(b)] = b
+
+def test_snapshot_coalesces_reads(ram):
+    accessors = {
+        "word": DolphinWord(BASE + 0x100),
+        "half": DolphinHalfWord(BASE + 0x106),
+        "float": DolphinFloat(BASE + 0x110),
+        "vec": DolphinVec3(BASE + 0x120),
+        "alias": DolphinWord(BASE + 0x100),
+        "overlap": DolphinByte(BASE + 0x101),
+        "far": DolphinWord(BASE + 0x8000),
+    }
+    snapshot = DolphinSnapshot(accessors)
+    assert snapshot.ranges == [(BASE + 0x100, 0x2c), (BASE + 0x8000, 4)]
+
+    io_stats.reset()
+    values = snapshot.read()
+    assert io_stats.calls["read"] == 2
+
+    # every name decodes to what a read of its own would give
+    for name, accessor in accessors.items():
+        assert values[name] == accessor.read(), name
+
+def test_snapshot_gap(ram):
+    accessors = {"a": DolphinWord(BASE + 0x100), "b": DolphinWord(BASE + 0x200)}
+    assert len(DolphinSnapshot(accessors, max_gap=0xfc).ranges) == 1
+    assert len(DolphinSnapshot(accessors, max_gap=0xfb).ranges) == 2
+
+def test_record_layout():
+    layout = RecordLayout([("b", 0x8, "f"), ("a", 0x0, "H"), ("v", 0xc, "3f"), ("s", 0x18, "4s")], size=0x20)
+    assert layout.size == 0x20
+    assert layout.names == ["a", "b", "v", "s"]
+
+    b = bytearray(0x24)
+    struct.pack_into(">H", b, 0x4, 513)
+    struct.pack_into(">f", b, 0xc, 1.5)
+    struct.pack_into(">3f", b, 0x10, 1.0, -2.0, 0.25)
+    b[0x1c:0x20] = b"rio!"
+    values = layout.decode(b, 0x4)
+    assert values == {"a": 513, "b": 1.5, "v": (1.0, -2.0, 0.25), "s": b"rio!"}
+
+    # missing names and pad bytes are written as zero
+    out = bytearray(b"\xff" * 0x20)
+    layout.encode_into(out, 0, {"b": 1.5, "v": (1.0, -2.0, 0.25)})
+    assert layout.decode(out) == {"a": 0, "b": 1.5, "v": (1.0, -2.0, 0.25), "s": bytes(4)}
+    assert out[0x2:0x8] == bytes(6)
+
+def test_record_layout_overlap():
+    with pytest.raises(AssertionError):
+        RecordLayout([("a", 0x0, "I"), ("b", 0x2, "H")])
+
+def test_floats_round_trip():
+    assert floats_from_bytes(bytes_from_floats(1.0, -0.5, 3.25)) == [1.0, -0.5, 3.25]
+    assert bytes_from_floats(1.0) == b"\x3f\x80\x00\x00"
+
+def test_reconnect(monkeypatch):
+    monkeypatch.setattr(memory_engine, "_backend", get_backend())
+    monkeypatch.setattr(connection, "min_backoff", 0.001)
+    monkeypatch.setattr(connection, "max_backoff", 0.01)
+    backend = FlakyBackend()
+    set_backend(backend)
+
+    # reads fail fast while the background thread keeps retrying
+    with pytest.raises(DolphinDisconnectedError):
+        read_word(BASE)
+    assert not is_hooked()
+    backend.ready.set()
+    wait_hooked(1.0)
+    assert read_word(BASE + 4) == 0x04050607
+
+    # a failing read drops the hook until the backend comes back
+    backend.ready.clear()
+    backend.broken = True
+    with pytest.raises(DolphinDisconnectedError):
+        read_word(BASE)
+    assert not is_hooked()
+    hooks = backend.hooks
+    backend.broken = False
+    backend.ready.set()
+    wait_hooked(1.0)
+    assert backend.hooks > hooks
+    assert read_word(BASE) == 0x00010203
+    unhook()
+
+def test_ram_image(ram):
+    with open(ram.path, "rb") as f:
+        image = f.read()
+    assert bytes(read_bytes(BASE + 0x1234, 8)) == image[0x1234:0x123c]
+    # the uncached mirror and physical addresses land on the same bytes
+    assert bytes(read_bytes(0xC0001234, 8)) == image[0x1234:0x123c]
+    assert bytes(read_bytes(0x1234, 8)) == image[0x1234:0x123c]
+
+    # writes are seen by later reads but never reach the file
+    write_bytes(BASE + 0x10, b"rio!")
+    assert bytes(read_bytes(BASE + 0x10, 4)) == b"rio!"
+    with open(ram.path, "rb") as f:
+        assert f.read() == image
+
+    with pytest.raises(IndexError):
+        read_bytes(BASE + len(image) - 2, 4)
+
+def test_arrays(ram):
+    # strided arrays read like one accessor per element
+    floats = DolphinFloatArray(BASE + 0x200, 5, 0x10)
+    assert floats.nbytes == 0x44
+    assert list(floats.read()) == [DolphinFloat(BASE + 0x200 + 0x10 * i).read() for i in range(5)]
+    vecs = DolphinVec3Array(BASE + 0x400, 3, 0x20)
+    assert [tuple(v) for v in vecs.read()] == [tuple(DolphinVec3(BASE + 0x400 + 0x20 * i).read()) for i in range(3)]
+
+    with pytest.raises(ValueError):
+        floats.read()[0] = 0.0
+
+    # writing only touches the elements, the bytes between them stay
+    gaps = [bytes(read_bytes(BASE + 0x204 + 0x10 * i, 0xc)) for i in range(4)]
+    floats.write([1.0, 2.0, 3.0, 4.0, 5.0])
+    assert list(floats.read()) == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert [bytes(read_bytes(BASE + 0x204 + 0x10 * i, 0xc)) for i in range(4)] == gaps
+
+    packed = DolphinVec3Array(BASE + 0x800, 2)
+    packed.write([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    assert floats_from_bytes(read_bytes(BASE + 0x800, 0x18)) == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+
+def test_frame_cache():
+    cache = FrameCache()
+    cache.add(0x100, bytes(range(0x10)))
+    assert bytes(cache.get(0x104, 4)) == bytes([4, 5, 6, 7])
+    assert cache.get(0x10e, 4) is None
+    assert cache.get(0xfe, 4) is None
+    cache.invalidate(0x10f, 1)
+    assert cache.get(0x100, 4) is None
+
+def test_frame_reads_hit_dolphin_once(ram):
+    io_stats.reset()
+    begin_frame()
+    try:
+        first = read_word(BASE + 0x100)
+        assert [read_word(BASE + 0x100) for _ in range(3)] == [first] * 3
+        assert io_stats.calls["read"] == 1
+        assert io_stats.calls["cached_read"] == 3
+
+        # a write drops what it covers so the next read sees it
+        write_bytes(BASE + 0x100, b"rio!")
+        assert bytes(read_bytes(BASE + 0x100, 4)) == b"rio!"
+        assert io_stats.calls["read"] == 2
+    finally:
+        end_frame()
+
+    read_word(BASE + 0x100)
+    assert io_stats.calls["read"] == 3
+
+def test_frame_seeded_from_snapshot(ram):
+    snapshot = DolphinSnapshot({"a": DolphinWord(BASE + 0x100), "b": DolphinFloat(BASE + 0x180)})
+    values = snapshot.read()
+    io_stats.reset()
+    begin_frame(snapshot.raw)
+    try:
+        assert read_word(BASE + 0x100) == values["a"]
+        assert DolphinFloat(BASE + 0x180).read() == values["b"]
+        assert "read" not in io_stats.calls
+    finally:
+        end_frame()
+
+def test_write_batch_merges():
+    batch = WriteBatch()
+    batch.add(0x108, b"\x03\x03")
+    batch.add(0x100, b"\x01\x01\x01\x01")
+    batch.add(0x104, b"\x02\x02\x02\x02\x02")
+    batch.add(0x200, b"\x04")
+    # later writes win where they overlap earlier ones
+    assert batch.merged() == [(0x100, b"\x01\x01\x01\x01\x02\x02\x02\x02\x02\x03"), (0x200, b"\x04")]
+
+def test_write_batch_flushes_once(ram):
+    io_stats.reset()
+    with write_batch():
+        write_word(BASE + 0x100, 1)
+        write_float(BASE + 0x104, 2.0)
+        with write_batch():
+            write_word(BASE + 0x108, 3)
+        write_word(BASE + 0x300, 4)
+        assert "write" not in io_stats.calls
+    assert io_stats.calls["write"] == 2
+    assert bytes(read_bytes(BASE + 0x100, 0xc)) == struct.pack(">IfI", 1, 2.0, 3)
+    assert read_word(BASE + 0x300) == 4
+
+def test_io_stats():
+    stats = IOStats()
+    stats.record("read", "word", 0x80001234, 4, 3e-6)
+    stats.record("read", "float", 0x80001ffc, 4, 30e-6)
+    stats.next_frame()
+    stats.record("write", "batch", 0x80002000, 16, 1e-3, failed=True)
+    stats.next_frame()
+
+    summary = stats.summary()
+    assert summary["calls"] == {"read": 2, "write": 1}
+    assert summary["bytes"] == {"read": 8, "write": 16}
+    assert summary["failures"] == {"write": 1}
+    assert summary["by_kind"] == {"read word": 1, "read float": 1, "write batch": 1}
+    assert summary["by_block"] == {"read 0x80001000": 2, "write 0x80002000": 1}
+    assert summary["latency"]["read"]["<=5us"] == 1 and summary["latency"]["read"]["<=50us"] == 1
+    assert summary["calls_per_frame"] == {"mean": 1.5, "max": 2}
+    assert summary["bytes_per_frame"] == {"mean": 12.0, "max": 16}
+    json.dumps(summary)
+
+    stats.enabled = False
+    stats.record("read", "word", 0, 4, 0.0)
+    assert stats.calls["read"] == 2
@@ -0,0 +1,35 @@
+from time import sleep
+from conftest import BASE
+from memory_engine import DolphinBool, DolphinSnapshot, DolphinWord, write_bool, write_word
+from memory_poller import MemoryPoller
+
+def test_poll_reports_changes_and_captures(ram):
+    write_bool(BASE + 0x10, False)
+    watch = DolphinSnapshot({"flag": DolphinBool(BASE + 0x10), "counter": DolphinWord(BASE + 0x14)})
+    capture = DolphinSnapshot({"value": DolphinWord(BASE + 0x100)})
+    poller = MemoryPoller(watch, capture=capture, capture_on=["flag"])
+
+    poller.poll()
+    assert {e.name for e in poller.drain()} == {"flag", "counter"}
+    poller.poll()
+    assert poller.drain() == []
+
+    # the capture is read on the same sample the flag goes up
+    write_word(BASE + 0x100, 1234)
+    write_bool(BASE + 0x10, True)
+    poller.poll()
+    events = poller.drain()
+    assert [(e.name, e.value, e.previous) for e in events] == [("flag", True, False)]
+    assert events[0].captured == {"value": 1234}
+
+def test_thread_keeps_polling(ram):
+    write_word(BASE + 0x14, 0)
+    poller = MemoryPoller(DolphinSnapshot({"counter": DolphinWord(BASE + 0x14)}), rate=1000.0)
+    poller.start()
+    try:
+        for i in range(1, 4):
+            write_word(BASE + 0x14, i)
+            sleep(0.05)
+    finally:
+        poller.stop()
+    assert [e.value for e in poller.drain()] == [0, 1, 2, 3]
@@ -0,0 +1,19 @@
+import numpy as np
+from calc_batting import RIGHTY, LEFTY
+from outcome_tables import OUTCOME_DTYPE, SHAPE, OutcomeTable
+
+def test_lookup_by_handedness(tmp_path):
+    path = str(tmp_path / "table.npy")
+    table = np.lib.format.open_memmap(path, mode="w+", dtype=OUTCOME_DTYPE, shape=SHAPE)
+    table[3, LEFTY, 1, 0, 2, 1, 4, 0] = (5, (1, 1, 1, 1, 1), (0x500, 0x540), (200, 300), (90, 120), (40, 60), (20.0, 30.0), (-10.0, -5.0), (18.0, 25.0))
+    table.flush()
+    del table
+
+    # lefty records come back as stored, never mirrored from the righty ones
+    table = OutcomeTable(path)
+    assert table.lookup(3, 1, 0, 2, 1, 4, 0, handedness=RIGHTY) is None
+    record = table.lookup(3, 1, 0, 2, 1, 4, 0, handedness=LEFTY)
+    assert record["horizontal_angle"] == (0x500, 0x540)
+    assert record["landing_x"] == (-10.0, -5.0)
+    assert table.envelope(batter_id=3, handedness=RIGHTY) is None
+    assert table.envelope(batter_id=3, handedness=LEFTY)["count"] == 5
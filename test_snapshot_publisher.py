@@ -0,0 +1,56 @@
+import os
+import pytest
+from memory_engine import DolphinFloat, DolphinWord, RecordLayout
+from snapshot_publisher import SnapshotPublisher, SnapshotSubscriber, layout_from_accessors
+
+LAYOUT = RecordLayout([("time", 0, "d"), ("frame", 8, "I"), ("x", 12, "f")])
+
+@pytest.fixture
+def name():
+    return f"rio_test_{os.getpid()}"
+
+def test_publish_and_read(name):
+    publisher = SnapshotPublisher(name, LAYOUT, slots=4)
+    subscriber = SnapshotSubscriber(name)
+    try:
+        assert subscriber.latest() == (0, None)
+        for i in range(1, 7):
+            assert publisher.publish({"time": i / 60, "frame": i, "x": 0.5 * i}) == i
+        assert subscriber.latest() == (6, {"time": 0.1, "frame": 6, "x": 3.0})
+        # the ring only keeps the newest slots
+        assert [subscriber.read(s) is not None for s in range(1, 8)] == [False, False, True, True, True, True, False]
+        assert subscriber.read(4)["frame"] == 4
+    finally:
+        subscriber.close()
+        publisher.close()
+
+def test_reopen_resumes(name):
+    # a run that never got to close
+    first = SnapshotPublisher(name, LAYOUT, slots=4)
+    first.publish({"frame": 1})
+    first.publish({"frame": 2})
+    first._buf = None
+    first._shm.close()
+
+    subscriber = SnapshotSubscriber(name)
+    second = SnapshotPublisher(name, LAYOUT, slots=4)
+    try:
+        # the next one keeps its records and the readers attached to it
+        assert second.sequence == 2
+        assert second.publish({"frame": 3}) == 3
+        assert subscriber.latest()[1]["frame"] == 3
+        assert subscriber.read(2)["frame"] == 2
+
+        with pytest.raises(FileExistsError):
+            SnapshotPublisher(name, RecordLayout([("frame", 0, "I")]), slots=4)
+        with pytest.raises(FileExistsError):
+            SnapshotPublisher(name, LAYOUT, slots=8)
+        assert subscriber.latest()[0] == 3
+    finally:
+        subscriber.close()
+        second.close()
+
+def test_layout_from_accessors():
+    layout = layout_from_accessors({"a": DolphinWord(0x80000100), "b": DolphinFloat(0x80000104)},
+                                   {"a": DolphinWord(0x80000100)}, extra_fields=[("time", "d")])
+    assert layout.fields == [("time", 0, "d"), ("a", 8, "I"), ("b", 12, "f")]
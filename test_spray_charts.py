@@ -0,0 +1,12 @@
+import numpy as np
+from calc_batting import RIGHTY, LEFTY
+from spray_charts import load_spray, save_spray
+
+def test_charts_are_kept_per_hand(tmp_path):
+    righty = save_spray(0, RIGHTY, str(tmp_path), samples=1 << 16)
+    lefty = save_spray(0, LEFTY, str(tmp_path), samples=1 << 16)
+    # a lefty's swings aren't the mirror of a righty's, each hand loads the chart sampled for it
+    assert not np.array_equal(lefty, righty[::-1])
+    assert np.array_equal(load_spray(0, RIGHTY, str(tmp_path)), righty)
+    assert np.array_equal(load_spray(0, LEFTY, str(tmp_path)), lefty)
+    assert load_spray(1, LEFTY, str(tmp_path)) is None
@@ -0,0 +1,27 @@
+import numpy as np
+from batch_batting import CONTACT_FRAMES, hit_ball_batch
+from calc_batting import hit_ball, BATTING_REACHES, SLAP, CHARGE
+from stadium import MARIO_STADIUM, path_array
+
+def test_batch_and_paths_label_alike():
+    # the same swings through hit_ball_batch and hit_ball's paths have to get the same fence labels
+    rng = np.random.default_rng(0)
+    n = 1000
+    hit_type = rng.choice([SLAP, CHARGE], n)
+    stick = rng.integers(0, 9, n)
+    swings = dict(
+        batter_id=rng.integers(0, 54, n), hit_type=hit_type, charge_up=(hit_type == CHARGE).astype(float),
+        charge_down=np.where(hit_type == CHARGE, rng.random(n), 0.0), stick_up=stick // 3 == 1, stick_down=stick // 3 == 2,
+        stick_left=stick % 3 == 1, stick_right=stick % 3 == 2, frame=rng.choice(CONTACT_FRAMES, n),
+        ball_x=rng.uniform(np.min(BATTING_REACHES), np.max(BATTING_REACHES), n), pitch_type=rng.integers(0, 4, n),
+        rand_1=rng.integers(0, 1 << 15, n), rand_2=rng.integers(0, 1 << 15, n), rand_3=rng.integers(0, 1 << 15, n),
+    )
+    # hit_ball uses ball_x as the contact z, the batch takes ball_z as given
+    rows = hit_ball_batch(**swings, ball_z=swings["ball_x"])
+    valid = np.flatnonzero(rows["valid"])
+    assert len(valid) > n // 2
+
+    batch = MARIO_STADIUM.classify_flights(rows["start"][valid], rows["velocity"][valid], rows["acceleration"][valid], rows["frames"][valid])
+    results = [hit_ball(**{k: v[i].item() for k, v in swings.items()}) for i in valid]
+    single = MARIO_STADIUM.classify_paths(path_array([r["FlightDetails"]["Path"] for r in results]))
+    assert (batch == single).all(), valid[batch != single]
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+import swing_distribution
+from batch_batting import hit_ball_batch
+from swing_distribution import swing_distribution as distribution
+
+SWINGS = [
+    dict(batter_id=2, pitcher_id=26, ball_x=0.2101, chem=2, pitch_type=3, frame=4, stick_down=True),
+    dict(batter_id=10, pitcher_id=3, ball_x=-0.2, hit_type=1, charge_up=0.5, frame=6, stick_left=True),
+    dict(batter_id=30, pitcher_id=3, ball_x=0.1, frame=3, stick_up=True, handedness=1),
+    dict(batter_id=5, ball_x=-0.3, is_star_hit=True, num_stars=2, frame=5),
+]
+
+@pytest.mark.parametrize("swing", SWINGS)
+def test_matches_brute_force(swing, monkeypatch):
+    # a smaller rng so every rand_1, rand_2, rand_3 can be tried
+    size = 1 << 6
+    monkeypatch.setattr(swing_distribution, "RAND_RANGE", size)
+    monkeypatch.setattr(swing_distribution, "TOTAL", float(size) ** 3)
+    bins = np.linspace(0, 150, 76)
+    d = distribution(**swing, distance_bins=bins)
+
+    r1, r2, r3 = [r.ravel() for r in np.meshgrid(*[np.arange(size)] * 3, indexing="ij")]
+    rows = hit_ball_batch(**swing, rand_1=r1, rand_2=r2, rand_3=r3)
+    valid = rows[rows["valid"]]
+    weighted = valid["vertical_zone"] >= 0
+
+    assert d["valid"] == pytest.approx(len(valid) / len(rows), abs=1e-12)
+    assert np.allclose(d["contact_zone"], np.bincount(valid["contact_zone"], minlength=5) / len(rows), rtol=0, atol=1e-12)
+    assert np.allclose(d["vertical_zone"], np.bincount(valid["vertical_zone"][weighted], minlength=5) / len(rows), rtol=0, atol=1e-12)
+    assert np.allclose(d["distance"][0], np.histogram(valid["distance"], bins)[0] / len(rows), rtol=0, atol=1e-12)
+    if len(valid):
+        assert d["mean_distance"] == pytest.approx(valid["distance"].mean(), abs=1e-9)
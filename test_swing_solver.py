@@ -0,0 +1,11 @@
+import numpy as np
+import swing_solver
+from swing_solver import solve
+
+def test_lefty_pruning_keeps_every_solution(monkeypatch):
+    # a lefty target the mirrored righty records used to rule out entirely
+    pruned = solve(0, (-0.96, 11.66), handedness=1)
+    assert len(pruned) > 0
+
+    monkeypatch.setattr(swing_solver, "_reachable", lambda records, bounds: np.ones(records.shape, dtype=bool))
+    assert solve(0, (-0.96, 11.66), handedness=1) == pruned